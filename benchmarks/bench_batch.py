@@ -0,0 +1,54 @@
+"""
+Batch conversion benchmark
+Compares engine.convert_array against a pure-Python loop over
+engine.convert for growing array sizes.
+
+Usage: python benchmarks/bench_batch.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import convert, convert_array  # noqa: E402
+
+SIZES = (1_000, 100_000, 1_000_000)
+REPEATS = 3
+
+
+def best_of(func, repeats=REPEATS):
+    """Returns the best wall time of several runs"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'elements':>10} {'dtype':>8} {'python loop':>14} "
+          f"{'convert_array':>14} {'speedup':>8}")
+    for size in SIZES:
+        for dtype in (np.float64, np.float32):
+            values = np.random.default_rng(0).random(size).astype(dtype)
+            as_list = values.tolist()
+            out = np.empty_like(values)
+
+            loop_time = best_of(
+                lambda: [convert(v, 'Foot', 'Meter') for v in as_list])
+            array_time = best_of(
+                lambda: convert_array(values, 'Foot', 'Meter', out=out))
+
+            print(f"{size:>10} {np.dtype(dtype).name:>8} "
+                  f"{size / loop_time / 1e6:>10.1f} M/s "
+                  f"{size / array_time / 1e6:>10.1f} M/s "
+                  f"{loop_time / array_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Exact mode benchmark
+Compares float conversions with the exact Fraction/Decimal mode for the
+same typed input and the same units, from text in to text out, and the
+cost of the exact mode with plain Fraction arithmetic instead of the
+cached integer plans.
+
+Usage: python benchmarks/bench_exact.py
+"""
+
+import os
+import sys
+import timeit
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import (convert, convert_decimal, convert_exact,  # noqa: E402
+                    exact_scale_offset)
+
+CASES = (
+    ('3.25', 'Foot', 'Meter'),
+    ('1013.25', 'Kilopascal', 'PSI'),
+    ('98.6', 'Fahrenheit', 'Celsius'),
+    ('1', 'Radian', 'Degree'),
+    ('750', 'Megabyte', 'Gigabyte'),
+)
+
+CALLS = 100_000
+
+
+def naive_exact(text, source, target):
+    """Exact conversion with Fraction objects throughout"""
+    scale, offset = exact_scale_offset(source, target)
+    return Fraction(text) * scale + offset
+
+
+def per_call(func):
+    """Returns the best time of one call in ns"""
+    return min(timeit.repeat(func, number=CALLS, repeat=5)) / CALLS * 1e9
+
+
+def main():
+    print(f"{'conversion':<30} {'float':>8} {'decimal':>8} {'fraction':>9} "
+          f"{'naive':>8} {'slowdown':>9}")
+    for text, source, target in CASES:
+        convert_decimal(text, source, target)
+        float_time = per_call(
+            lambda: repr(convert(float(text), source, target)))
+        decimal_time = per_call(
+            lambda: str(convert_decimal(text, source, target)))
+        fraction_time = per_call(lambda: convert_exact(text, source, target))
+        naive_time = per_call(lambda: naive_exact(text, source, target))
+        print(f"{text + ' ' + source + ' -> ' + target:<30} "
+              f"{float_time:>5.0f} ns {decimal_time:>5.0f} ns "
+              f"{fraction_time:>6.0f} ns {naive_time:>5.0f} ns "
+              f"{decimal_time / float_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
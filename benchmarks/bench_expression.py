@@ -0,0 +1,54 @@
+"""
+Unit expression benchmark
+Measures parse-plus-evaluate latency of expression.evaluate with cold caches
+(every call parses) and warm caches (every call reuses the compiled plan),
+and the cost of applying a compiled unit-pair plan.
+
+Usage: python benchmarks/bench_expression.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from expression import (clear_caches, compile_conversion,  # noqa: E402
+                        evaluate)
+
+QUERIES = (
+    '3 ft 4 in to cm',
+    '12 kWh in MJ',
+    'kg*m/s^2 to N',
+    '1 lb/ft³ to kg/m³',
+    '100 °C to °F',
+)
+
+CALLS = 100_000
+
+
+def cold(query):
+    """Evaluates a query after emptying every cache"""
+    clear_caches()
+    return evaluate(query)
+
+
+def main():
+    print(f"{'query':<20} {'cold':>10} {'warm':>10}")
+    for query in QUERIES:
+        cold_time = min(timeit.repeat(lambda: cold(query),
+                                      number=1000, repeat=5)) / 1000
+        evaluate(query)
+        warm_time = min(timeit.repeat(lambda: evaluate(query),
+                                      number=CALLS, repeat=5)) / CALLS
+        print(f"{query:<20} {cold_time * 1e6:>8.1f}us "
+              f"{warm_time * 1e9:>8.0f}ns")
+
+    plan = compile_conversion('kWh', 'MJ')
+    applied = min(timeit.repeat(lambda: 12.0 * plan.scale + plan.offset,
+                                number=CALLS, repeat=5)) / CALLS
+    print(f"compiled kWh -> MJ plan applied to a value: {applied * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Lazy conversion benchmark
+Runs the same pipeline, Foot -> Meter, scaled, offset, -> Centimeter and
+the difference to a second column in Inch, once step by step with
+QuantityArray and once recorded with LazyArray and computed in one pass.
+Reports the wall time and the memory allocated on top of the inputs.
+
+Usage: python benchmarks/bench_lazy.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lazy import LazyArray  # noqa: E402
+from quantity import Quantity, QuantityArray  # noqa: E402
+
+SIZES = (10_000, 1_000_000, 10_000_000)
+REPEATS = 5
+
+
+def eager(feet, inches):
+    """The pipeline with a full array per step"""
+    meters = QuantityArray(feet, 'Foot').to('Meter') * 1.5
+    centimeters = (meters + Quantity(2, 'Meter')).to('Centimeter')
+    return centimeters - QuantityArray(inches, 'Inch')
+
+
+def lazy(feet, inches):
+    """The pipeline recorded and computed once"""
+    meters = LazyArray(feet, 'Foot').to('Meter') * 1.5
+    centimeters = (meters + Quantity(2, 'Meter')).to('Centimeter')
+    return (centimeters - QuantityArray(inches, 'Inch')).compute()
+
+
+def measure(pipeline, *columns):
+    """Returns (best wall time, peak bytes allocated) of a pipeline"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        pipeline(*columns)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    pipeline(*columns)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    print(f"{'elements':>10} {'eager':>10} {'lazy':>10} {'speedup':>8} "
+          f"{'eager peak':>11} {'lazy peak':>10}")
+    rng = np.random.default_rng(0)
+    for size in SIZES:
+        feet, inches = rng.random(size), rng.random(size)
+        assert np.allclose(eager(feet, inches).values,
+                           lazy(feet, inches).values)
+        eager_time, eager_peak = measure(eager, feet, inches)
+        lazy_time, lazy_peak = measure(lazy, feet, inches)
+        print(f"{size:>10} {eager_time * 1000:>7.2f} ms "
+              f"{lazy_time * 1000:>7.2f} ms {eager_time / lazy_time:>7.1f}x "
+              f"{eager_peak / 2 ** 20:>8.1f} MB {lazy_peak / 2 ** 20:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Factor matrix benchmark
+Measures the import cost of engine.py (which builds the factor matrices)
+and the latency of a scalar conversion, compared with the old GUI closure
+that rebuilt its factor dict on every click.
+
+Usage: python benchmarks/bench_matrix.py
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import (FACTOR_MATRICES, LINEAR_CATEGORIES,  # noqa: E402
+                    build_factor_matrix, convert)
+
+CALLS = 1_000_000
+
+
+def legacy_convert(value, source, target):
+    """The conversion as the length screen used to do it"""
+    length_to_meters = {
+        'Meter': 1,
+        'Centimeter': 0.01,
+        'Millimeter': 0.001,
+        'Kilometer': 1000,
+        'Inch': 0.0254,
+        'Foot': 0.3048,
+        'Yard': 0.9144,
+        'Mile': 1609.344
+    }
+    meters = value * length_to_meters[source]
+    return meters / length_to_meters[target]
+
+
+def import_time(repeats=5):
+    """Returns the best time to import engine in a fresh interpreter"""
+    code = ("import time; start = time.perf_counter(); import engine; "
+            "print(time.perf_counter() - start)")
+    times = [float(subprocess.check_output([sys.executable, '-c', code],
+                                           cwd=ROOT))
+             for _ in range(repeats)]
+    return min(times)
+
+
+def main():
+    cells = sum(len(matrix) ** 2 for matrix in FACTOR_MATRICES.values())
+    print(f"engine import (builds {cells} matrix cells): "
+          f"{import_time() * 1e3:.2f} ms")
+
+    build = min(timeit.repeat(
+        lambda: [build_factor_matrix(table)
+                 for table in LINEAR_CATEGORIES.values()],
+        number=100, repeat=5)) / 100
+    print(f"building all factor matrices: {build * 1e3:.3f} ms")
+
+    legacy = min(timeit.repeat(lambda: legacy_convert(3.0, 'Foot', 'Meter'),
+                               number=CALLS, repeat=3))
+    matrix = min(timeit.repeat(lambda: convert(3.0, 'Foot', 'Meter'),
+                               number=CALLS, repeat=3))
+    print(f"scalar conversion, dict rebuilt per call: "
+          f"{legacy / CALLS * 1e9:.0f} ns")
+    print(f"scalar conversion, factor matrix:         "
+          f"{matrix / CALLS * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
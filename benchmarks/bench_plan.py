@@ -0,0 +1,128 @@
+"""
+Conversion plan benchmark
+Times a tight Python loop of scalar Foot -> Meter and Fahrenheit -> Kelvin
+conversions done the ways the converter screens have done them:
+
+- original: a factor dict built on every call, a multiply and a divide
+- convert: engine.convert, one matrix lookup per call
+- scale/offset: engine.get_scale_offset per call, then a multiply-add
+- get_plan: the cached generated function looked up on every call
+- screen: the unit screens, the function kept until a unit changes
+- plan: the generated function fetched once, outside the loop
+
+Usage: python benchmarks/bench_plan.py [--calls N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import convert, get_plan, get_scale_offset  # noqa: E402
+
+
+def original(value, source, target):
+    """The conversion of the first length screen"""
+    length_to_meters = {
+        'Meter': 1,
+        'Centimeter': 0.01,
+        'Millimeter': 0.001,
+        'Kilometer': 1000,
+        'Inch': 0.0254,
+        'Foot': 0.3048,
+        'Yard': 0.9144,
+        'Mile': 1609.344
+    }
+    meters = value * length_to_meters[source]
+    return meters / length_to_meters[target]
+
+
+def original_temperature(value, source, target):
+    """The conversion of the first temperature screen"""
+    if source == 'Fahrenheit':
+        celsius = (value - 32) * 5/9
+    elif source == 'Kelvin':
+        celsius = value - 273.15
+    else:
+        celsius = value
+    if target == 'Fahrenheit':
+        return (celsius * 9/5) + 32
+    elif target == 'Kelvin':
+        return celsius + 273.15
+    return celsius
+
+
+def loop_original(calls, category, source, target):
+    """Original screen code"""
+    func = original if category == 'Length' else original_temperature
+    for value in range(calls):
+        func(value, source, target)
+
+
+def loop_convert(calls, category, source, target):
+    """engine.convert"""
+    for value in range(calls):
+        convert(value, source, target)
+
+
+def loop_scale_offset(calls, category, source, target):
+    """get_scale_offset and a multiply-add"""
+    for value in range(calls):
+        scale, offset = get_scale_offset(source, target)
+        value * scale + offset
+
+
+def loop_get_plan(calls, category, source, target):
+    """get_plan on every call"""
+    for value in range(calls):
+        get_plan(category, source, target)(value)
+
+
+def loop_screen(calls, category, source, target):
+    """Unit screen code: the plan is dropped when a unit changes"""
+    plan = None
+    for value in range(calls):
+        if plan is None:
+            plan = get_plan(category, source, target)
+        plan(value)
+
+
+def loop_plan(calls, category, source, target):
+    """One plan, fetched before the loop"""
+    plan = get_plan(category, source, target)
+    for value in range(calls):
+        plan(value)
+
+
+LOOPS = {
+    'original': loop_original,
+    'convert': loop_convert,
+    'scale/offset': loop_scale_offset,
+    'get_plan': loop_get_plan,
+    'screen': loop_screen,
+    'plan': loop_plan,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    print(f"{'loop':<14} {'pair':<22} {'total':>9} {'per call':>10}")
+    for category, source, target in (('Length', 'Foot', 'Meter'),
+                                     ('Temperature', 'Fahrenheit',
+                                      'Kelvin')):
+        for name, loop in LOOPS.items():
+            start = time.perf_counter()
+            loop(args.calls, category, source, target)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<14} {source + ' -> ' + target:<22} "
+                  f"{elapsed:>7.2f} s {elapsed / args.calls * 1e9:>7.0f} ns")
+    print(get_plan.cache_info())
+
+
+if __name__ == "__main__":
+    main()
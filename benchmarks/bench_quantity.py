@@ -0,0 +1,65 @@
+"""
+Quantity memory and conversion benchmark
+Measures the memory of one million values held as a list of floats, a list
+of Quantity objects and a QuantityArray, and the time to convert each of
+them from Foot to Meter.
+
+Usage: python benchmarks/bench_quantity.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import convert  # noqa: E402
+from quantity import Quantity, QuantityArray  # noqa: E402
+
+SIZE = 1_000_000
+
+
+def measure(build):
+    """Returns (object, bytes allocated while building it)"""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func):
+    """Returns the wall time of one run"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    source = np.random.default_rng(0).random(SIZE)
+
+    floats, floats_bytes = measure(source.tolist)
+    quantities, quantities_bytes = measure(
+        lambda: [Quantity(value, 'Foot') for value in source.tolist()])
+    array, array_bytes = measure(lambda: QuantityArray(source.copy(), 'Foot'))
+
+    rows = (
+        ('list of floats', floats_bytes,
+         timed(lambda: [convert(v, 'Foot', 'Meter') for v in floats])),
+        ('list of Quantity', quantities_bytes,
+         timed(lambda: [q.to('Meter') for q in quantities])),
+        ('QuantityArray', array_bytes,
+         timed(lambda: array.to('Meter'))),
+    )
+    print(f"{'storage':<18} {'MB per 1M':>10} {'bytes/value':>12} "
+          f"{'Foot -> Meter':>14}")
+    for name, size, seconds in rows:
+        print(f"{name:<18} {size / 1e6:>10.1f} {size / SIZE:>12.1f} "
+              f"{seconds * 1000:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Base conversion benchmark
+Times radix.decimal_to_base and radix.base_to_decimal against the old
+digit-by-digit implementation and the builtin str()/int()/format() paths
+for growing digit counts.
+
+Usage: python benchmarks/bench_radix.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radix import base_to_decimal, decimal_to_base  # noqa: E402
+
+DIGIT_COUNTS = (1_000, 10_000, 100_000, 1_000_000)
+
+# The naive versions are quadratic, skip them above this many digits
+NAIVE_LIMIT = 100_000
+
+
+def naive_decimal_to_base(n, base):
+    """The original string-prepending implementation"""
+    if n == 0:
+        return "0"
+    digits = "0123456789ABCDEF"
+    result = ""
+    while n > 0:
+        result = digits[n % base] + result
+        n = n // base
+    return result
+
+
+def naive_base_to_decimal(n, base):
+    """The original digits.index() implementation"""
+    digits = "0123456789ABCDEF"
+    result = 0
+    for digit in n:
+        result = result * base + digits.index(digit.upper())
+    return result
+
+
+def builtin_to_base(n, base):
+    """str() and format() for the bases they support"""
+    return str(n) if base == 10 else format(n, 'X')
+
+
+def timed(func, *args):
+    """Returns the wall time of one call"""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    # Let the builtins handle numbers of any size
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+
+    print(f"{'base':>4} {'digits':>9} {'direction':>10} {'naive':>9} "
+          f"{'builtin':>9} {'radix':>9}")
+    rng = random.Random(0)
+    for base in (10, 16):
+        for count in DIGIT_COUNTS:
+            text = str(rng.randint(1, 9)) + ''.join(
+                rng.choice('0123456789ABCDEF'[:base])
+                for _ in range(count - 1))
+            number = int(text, base)
+
+            for direction, naive, builtin, ours, arg in (
+                    ('to base', naive_decimal_to_base, builtin_to_base,
+                     decimal_to_base, number),
+                    ('from base', naive_base_to_decimal, int,
+                     base_to_decimal, text)):
+                naive_time = (f"{timed(naive, arg, base):9.3f}"
+                              if count <= NAIVE_LIMIT else f"{'-':>9}")
+                print(f"{base:>4} {count:>9} {direction:>10} {naive_time} "
+                      f"{timed(builtin, arg, base):9.3f} "
+                      f"{timed(ours, arg, base):9.3f}")
+
+
+if __name__ == "__main__":
+    main()
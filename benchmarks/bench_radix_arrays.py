@@ -0,0 +1,55 @@
+"""
+Array base formatting benchmark
+Compares radix.format_array and radix.parse_array with a Python loop over
+the scalar decimal_to_base and base_to_decimal.
+
+Usage: python benchmarks/bench_radix_arrays.py [count]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radix import (base_to_decimal, decimal_to_base,  # noqa: E402
+                   format_array, parse_array)
+
+DEFAULT_COUNT = 1_000_000
+
+
+def timed(func):
+    """Returns the result and wall time of one call"""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    values = np.random.default_rng(0).integers(0, 1 << 32, size=count,
+                                               dtype=np.int64)
+    as_list = values.tolist()
+
+    print(f"{count} values")
+    print(f"{'base':>4} {'direction':>10} {'scalar loop':>12} "
+          f"{'array':>9} {'speedup':>8}")
+    for base in (2, 10, 16, 36):
+        strings, loop_time = timed(
+            lambda: [decimal_to_base(v, base) for v in as_list])
+        array_strings, array_time = timed(lambda: format_array(values, base))
+        assert array_strings.astype(str).tolist() == strings
+        print(f"{base:>4} {'format':>10} {loop_time:>11.3f}s "
+              f"{array_time:>8.3f}s {loop_time / array_time:>7.0f}x")
+
+        _, loop_time = timed(
+            lambda: [base_to_decimal(s, base) for s in strings])
+        _, array_time = timed(lambda: parse_array(array_strings, base))
+        print(f"{base:>4} {'parse':>10} {loop_time:>11.3f}s "
+              f"{array_time:>8.3f}s {loop_time / array_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
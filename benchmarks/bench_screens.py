@@ -0,0 +1,77 @@
+"""
+Screen navigation benchmark
+Counts the widgets created and measures the latency of going back and forth
+between the main menu, Length and Pressure screens: once rebuilding every
+screen on each visit (what the app did before screens were cached)
+and once with the screen cache.
+
+Needs a display. Usage: python benchmarks/bench_screens.py
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import converter  # noqa: E402
+
+ROUTE = (converter.show_main_menu, converter.length_converter,
+         converter.show_main_menu, converter.pressure_converter)
+ROUNDS = 20
+
+# Widgets created so far, counted in the constructor every widget shares
+created = 0
+_setup = tk.BaseWidget._setup
+
+
+def _counting_setup(widget, master, cnf):
+    global created
+    created += 1
+    _setup(widget, master, cnf)
+
+
+tk.BaseWidget._setup = _counting_setup
+
+
+def clear_window():
+    """Destroys every widget and forgets the built screens, like the app
+    did on every navigation before screens were cached"""
+    for widget in converter.root.winfo_children():
+        widget.destroy()
+    converter.screens.clear()
+    converter.current_screen = None
+
+
+def navigate(rebuild):
+    """Walks the route ROUNDS times; returns (widgets created per
+    navigation, mean latency in ms)"""
+    global created
+    clear_window()
+    converter.show_main_menu()
+    converter.root.update()
+    created = 0
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        for screen in ROUTE:
+            start = time.perf_counter()
+            if rebuild:
+                clear_window()
+            screen()
+            converter.root.update()
+            elapsed += time.perf_counter() - start
+    navigations = ROUNDS * len(ROUTE)
+    return created / navigations, elapsed / navigations * 1000
+
+
+def main():
+    print(f"{'mode':<10} {'widgets/nav':>12} {'latency':>10}")
+    for name, rebuild in (('rebuild', True), ('cached', False)):
+        widgets, latency = navigate(rebuild)
+        print(f"{name:<10} {widgets:>12.1f} {latency:>7.2f} ms")
+    converter.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
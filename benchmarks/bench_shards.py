@@ -0,0 +1,76 @@
+"""
+Sharded conversion benchmark
+Reports how bulk CSV and binary conversion scale with the number of worker
+processes: wall time, speedup over one worker and efficiency
+(speedup / workers).
+
+Usage: python benchmarks/bench_shards.py [rows]
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk import convert_binary, convert_csv  # noqa: E402
+
+DEFAULT_ROWS = 2_000_000
+
+
+def worker_counts():
+    """Returns 1, 2, 4, ... up to the number of CPUs"""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def write_samples(directory, rows):
+    """Writes a synthetic CSV file and a float64 dump, returns their paths"""
+    import numpy as np
+
+    csv_path = os.path.join(directory, 'samples.csv')
+    rng = random.Random(0)
+    with open(csv_path, 'w') as f:
+        f.write('id,depth_ft,label\n')
+        for i in range(rows):
+            f.write(f'{i},{rng.random() * 1000:.4f},sensor_{i % 64}\n')
+
+    binary_path = os.path.join(directory, 'samples.f64')
+    np.random.default_rng(0).random(rows * 16).astype('<f8').tofile(
+        binary_path)
+    return csv_path, binary_path
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, binary_path = write_samples(directory, rows)
+        output = os.path.join(directory, 'out')
+
+        for name, path, run in (
+                ('csv', csv_path, lambda workers: convert_csv(
+                    csv_path, output, ['depth_ft'], 'Foot', 'Meter',
+                    workers=workers)),
+                ('binary', binary_path, lambda workers: convert_binary(
+                    binary_path, output, 'Foot', 'Meter',
+                    workers=workers))):
+            print(f"{name}: {os.path.getsize(path) / 1e6:.0f} MB")
+            print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} "
+                  f"{'efficiency':>11}")
+            baseline = None
+            for workers in worker_counts():
+                seconds = min(run(workers)['seconds'] for _ in range(2))
+                baseline = baseline or seconds
+                speedup = baseline / seconds
+                print(f"{workers:>8} {seconds:>9.2f} {speedup:>7.2f}x "
+                      f"{speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
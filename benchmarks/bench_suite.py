@@ -0,0 +1,218 @@
+"""
+Conversion benchmark suite
+Measures the conversion core and writes machine-readable results that can
+be compared between commits:
+
+- scalar engine.convert for every category
+- batch engine.convert_array from 1e3 to 1e8 elements
+- temperature (affine) conversions, scalar and batch
+- radix.base_to_decimal and radix.decimal_to_base for growing digit counts
+
+Every result is a time per operation, so lower is better. With --compare
+the run is checked against an earlier results file and the exit status is
+1 if any benchmark got slower by more than --threshold percent.
+
+Usage:
+    python benchmarks/bench_suite.py -o results.json
+    python benchmarks/bench_suite.py --compare results.json --threshold 10
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import CATEGORY_UNITS, convert, convert_array  # noqa: E402
+from radix import base_to_decimal, decimal_to_base  # noqa: E402
+
+GROUPS = ('scalar', 'batch', 'temperature', 'radix')
+
+# Batch sizes, up to --max-elements
+BATCH_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8)
+
+# Digit counts of the radix benchmarks, up to --max-digits
+DIGIT_COUNTS = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Scalar calls per timing run
+SCALAR_CALLS = 200_000
+
+# Regressions smaller than this many percent are noise by default
+DEFAULT_THRESHOLD = 10.0
+
+
+def best_time(func, number, repeat=5):
+    """Returns the best time of one call, over several timing runs"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def calls_for(size):
+    """Returns how many calls to time for a batch of size elements"""
+    return max(1, 10 ** 6 // size)
+
+
+def bench_scalar(results, args):
+    """engine.convert from the first to the last unit of each category"""
+    for category, units in CATEGORY_UNITS.items():
+        source, target = units[0], units[-1]
+        results[f"scalar/{category}"] = {
+            'value': best_time(lambda: convert(3.0, source, target),
+                               SCALAR_CALLS) * 1e9,
+            'unit': 'ns/call'}
+
+
+def bench_batch(results, args):
+    """engine.convert_array Foot -> Meter into a preallocated array"""
+    rng = np.random.default_rng(0)
+    for size in BATCH_SIZES:
+        if size > args.max_elements:
+            break
+        values = rng.random(size)
+        out = np.empty_like(values)
+        seconds = best_time(
+            lambda: convert_array(values, 'Foot', 'Meter', out=out),
+            calls_for(size), repeat=3)
+        results[f"batch/float64/{size:.0e}"] = {
+            'value': seconds / size * 1e9, 'unit': 'ns/element'}
+
+
+def bench_temperature(results, args):
+    """Affine conversions: scalar pairs and Celsius -> Kelvin arrays"""
+    for source, target in (('Celsius', 'Fahrenheit'),
+                           ('Fahrenheit', 'Kelvin'),
+                           ('Kelvin', 'Celsius')):
+        results[f"temperature/scalar/{source}->{target}"] = {
+            'value': best_time(lambda: convert(20.0, source, target),
+                               SCALAR_CALLS) * 1e9,
+            'unit': 'ns/call'}
+    rng = np.random.default_rng(0)
+    for size in BATCH_SIZES:
+        if size > min(args.max_elements, 10 ** 7):
+            break
+        values = rng.random(size) * 100
+        out = np.empty_like(values)
+        seconds = best_time(
+            lambda: convert_array(values, 'Celsius', 'Fahrenheit', out=out),
+            calls_for(size), repeat=3)
+        results[f"temperature/batch/{size:.0e}"] = {
+            'value': seconds / size * 1e9, 'unit': 'ns/element'}
+
+
+def bench_radix(results, args):
+    """Base 10 <-> base 7 for growing digit counts"""
+    rng = random.Random(0)
+    for digits in DIGIT_COUNTS:
+        if digits > args.max_digits:
+            break
+        text = str(rng.randrange(1, 10)) + ''.join(
+            rng.choice('0123456789') for _ in range(digits - 1))
+        number = base_to_decimal(text, 10)
+        encoded = decimal_to_base(number, 7)
+        number_calls = calls_for(digits * 10)
+        results[f"radix/base_to_decimal/{digits}"] = {
+            'value': best_time(lambda: base_to_decimal(encoded, 7),
+                               number_calls, repeat=3) * 1e3,
+            'unit': 'ms/call'}
+        results[f"radix/decimal_to_base/{digits}"] = {
+            'value': best_time(lambda: decimal_to_base(number, 7),
+                               number_calls, repeat=3) * 1e3,
+            'unit': 'ms/call'}
+
+
+BENCHMARKS = {
+    'scalar': bench_scalar,
+    'batch': bench_batch,
+    'temperature': bench_temperature,
+    'radix': bench_radix,
+}
+
+
+def git_commit():
+    """Returns the current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+            stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Returns (name, old, new, change %) for every benchmark that got
+    slower than the baseline by more than threshold percent"""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]['value'], result['value']
+        change = (new - old) / old * 100
+        if change > threshold:
+            regressions.append((name, old, new, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-o', '--output', help="write results as JSON")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="results file of an earlier run")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown in percent "
+                             "(default %(default)s)")
+    parser.add_argument('--only', default=','.join(GROUPS),
+                        help=f"comma-separated groups ({', '.join(GROUPS)})")
+    parser.add_argument('--max-elements', type=float, default=1e8,
+                        help="largest batch (default %(default).0e)")
+    parser.add_argument('--max-digits', type=float, default=1e5,
+                        help="largest radix number (default %(default).0e)")
+    args = parser.parse_args()
+
+    results = {}
+    for group in args.only.split(','):
+        if group not in BENCHMARKS:
+            parser.error(f"unknown group: {group}")
+        start = time.perf_counter()
+        BENCHMARKS[group](results, args)
+        print(f"{group}: {time.perf_counter() - start:.1f} s",
+              file=sys.stderr)
+
+    for name, result in results.items():
+        print(f"{name:<44} {result['value']:>12.3f} {result['unit']}")
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:.3f} -> {new:.3f} "
+                  f"{results[name]['unit']} (+{change:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions above {args.threshold:g}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Theme switch benchmark
+Builds the main menu (the busiest screen) and then every converter screen,
+and measures how long a theme switch takes and how many style and widget
+reconfigurations it makes as the number of live widgets grows.
+
+Needs a display. Usage: python benchmarks/bench_theme.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import converter  # noqa: E402
+
+SWITCHES = 50
+
+
+def count_widgets(widget):
+    """Returns the number of widgets under widget, itself included"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def count_calls(obj, name):
+    """Wraps obj.name to count its calls; returns the counter list"""
+    calls = [0]
+    original = getattr(obj, name)
+
+    def counted(*args, **kwargs):
+        calls[0] += 1
+        return original(*args, **kwargs)
+
+    setattr(obj, name, counted)
+    return calls
+
+
+def switch_time():
+    """Returns the mean wall time of a theme switch in ms, redraw included"""
+    converter.root.update()
+    start = time.perf_counter()
+    for _ in range(SWITCHES):
+        converter.toggle_theme()
+        converter.root.update()
+    return (time.perf_counter() - start) / SWITCHES * 1000
+
+
+def main():
+    style_calls = count_calls(converter.style, 'configure')
+    map_calls = count_calls(converter.style, 'map')
+
+    print(f"{'screens built':<24} {'widgets':>8} {'calls/switch':>13} "
+          f"{'switch':>10}")
+    steps = [('main menu', converter.show_main_menu),
+             ('+ every converter', None)]
+    for name, show in steps:
+        if show is not None:
+            show()
+        else:
+            for screen in converter.CATEGORY_SCREENS.values():
+                screen()
+            converter.base_converter()
+        style_calls[0] = map_calls[0] = 0
+        latency = switch_time()
+        calls = (style_calls[0] + map_calls[0] +
+                 SWITCHES * len(converter.themed_widgets)) / SWITCHES
+        print(f"{name:<24} {count_widgets(converter.root):>8} "
+              f"{calls:>13.0f} {latency:>7.2f} ms")
+    converter.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
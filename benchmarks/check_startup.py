@@ -0,0 +1,83 @@
+"""
+Cold start check
+Starts the application in fresh interpreters and measures the time from
+launch until the main menu has been drawn. Fails (exit status 1) when the
+median exceeds the budget, or when a module that the main menu does not
+need was imported during startup.
+
+Needs a display.
+Usage: python benchmarks/check_startup.py [--budget MS] [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startup budget in milliseconds, interpreter start included
+STARTUP_BUDGET = 200
+
+# Modules that must not be imported before a screen or action needs them
+DEFERRED_MODULES = ('numpy', 'PIL', 'ttkthemes', 'engine', 'dimensions',
+                    'expression', 'search', 'radix', 'quantity', 'fractions',
+                    'decimal')
+
+# Run in the child: start the application, draw the menu, report which
+# deferred modules were loaded
+CHILD = f"""
+import sys
+import converter
+converter.show_main_menu()
+converter.root.update()
+print(__import__('json').dumps(
+    [name for name in {DEFERRED_MODULES!r} if name in sys.modules]),
+    flush=True)
+"""
+
+
+def start_once(code):
+    """Runs code in a fresh interpreter; returns (seconds until its first
+    line of output, that line)"""
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, '-c', code], cwd=ROOT,
+                             stdout=subprocess.PIPE, text=True)
+    line = child.stdout.readline()
+    elapsed = time.perf_counter() - start
+    child.kill()
+    child.wait()
+    if not line:
+        raise RuntimeError("The application did not start")
+    return elapsed, line
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET,
+                        help="budget in ms (default %(default)s)")
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    interpreter = statistics.median(
+        start_once("print(flush=True)")[0] for _ in range(args.runs))
+    runs = [start_once(CHILD) for _ in range(args.runs)]
+    startup = statistics.median(elapsed for elapsed, _ in runs)
+    loaded = json.loads(runs[0][1])
+
+    print(f"interpreter alone     {interpreter * 1000:7.1f} ms")
+    print(f"main menu drawn       {startup * 1000:7.1f} ms "
+          f"(budget {args.budget:.0f} ms)")
+    print(f"deferred but loaded   {', '.join(loaded) or 'none'}")
+
+    if startup * 1000 > args.budget or loaded:
+        print("FAIL")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
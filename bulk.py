@@ -0,0 +1,636 @@
+"""
+Bulk Unit Conversion
+Command-line tools for converting large files with the conversion engine.
+Files are streamed in chunks so memory use stays flat whatever their size.
+
+Usage:
+    python bulk.py csv data.csv -o out.csv --columns depth_ft --from Foot --to Meter
+    python bulk.py binary raw.f32 -o out.f32 --dtype float32 --from PSI --to Pascal
+    python bulk.py radix number.bin -o number.hex --from-base 2 --to-base 16
+    python bulk.py hexdump firmware.img -o firmware.hex
+    python bulk.py query queries.txt -o results.txt
+
+License: MIT
+"""
+
+import argparse
+import io
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import get_scale_offset
+from expression import evaluate
+from radix import decode_stream, encode_stream, regroup_stream
+
+# Rows converted per chunk
+CSV_CHUNK_ROWS = 65536
+
+# Largest record, in bytes, that quoted line breaks may join lines into
+CSV_MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+# Buffer size for reading and writing files
+IO_BUFFER_SIZE = 1024 * 1024
+
+# Bytes mapped at a time when converting binary files, a whole number of pages
+MMAP_WINDOW_BYTES = max(mmap.PAGESIZE, mmap.ALLOCATIONGRANULARITY) * 4096
+
+# Supported raw sample types, always little-endian
+BINARY_DTYPES = {
+    'float32': '<f4',
+    'float64': '<f8'
+}
+
+# CSV helpers
+
+
+def split_fields(line, delimiter=b','):
+    """Splits a raw CSV record into its raw fields, keeping any quotes"""
+    if b'"' not in line:
+        return line.split(delimiter)
+
+    fields = []
+    start = 0
+    quoted = False
+    for position, char in enumerate(line):
+        if char == 34:  # '"'
+            quoted = not quoted
+        elif char == delimiter[0] and not quoted:
+            fields.append(line[start:position])
+            start = position + 1
+    fields.append(line[start:])
+    return fields
+
+
+def split_line_ending(line):
+    """Splits a raw line into its content and its line terminator"""
+    if line.endswith(b'\r\n'):
+        return line[:-2], b'\r\n'
+    if line.endswith(b'\n'):
+        return line[:-1], b'\n'
+    return line, b''
+
+
+def iter_records(stream, strict=False, max_bytes=CSV_MAX_RECORD_BYTES):
+    """Yields raw CSV records, joining lines that end inside a quoted field.
+
+    A record that is still open after max_bytes, usually a stray quote,
+    raises ValueError rather than reading the rest of the file into memory.
+    With strict set, a quoted field still open at the end of the stream
+    raises ValueError instead of being passed through.
+    """
+    pieces = []
+    quotes = size = 0
+    for line_number, line in enumerate(stream, 1):
+        if not pieces:
+            first_line = line_number
+        pieces.append(line)
+        quotes += line.count(b'"')
+        size += len(line)
+        if quotes % 2 == 0:
+            yield pieces[0] if len(pieces) == 1 else b''.join(pieces)
+            pieces = []
+            quotes = size = 0
+        elif size > max_bytes:
+            raise ValueError(f"Line {first_line}: quoted field is not "
+                             f"closed within {max_bytes} bytes")
+    if pieces:
+        if strict and quotes % 2:
+            raise ValueError(f"Line {first_line}: quoted field is not closed")
+        yield b''.join(pieces)
+
+
+def resolve_columns(header, columns, delimiter=b','):
+    """Returns the field indices of the named columns"""
+    names = [field.strip().strip(b'"').decode('utf-8')
+             for field in split_fields(split_line_ending(header)[0], delimiter)]
+    indices = []
+    for column in columns:
+        if column in names:
+            indices.append(names.index(column))
+        else:
+            raise ValueError(f"Column not found: {column}")
+    return indices
+
+
+def format_number(value, number_format=None):
+    """Formats a converted value for output"""
+    if number_format is None:
+        return repr(value).encode('ascii')
+    return format(value, number_format).encode('ascii')
+
+
+def convert_records(records, column_ids, scale, offset, delimiter=b',',
+                    number_format=None, first_line=1):
+    """Converts the given columns of a chunk of raw CSV records.
+
+    Fields that are not converted, empty fields and line endings are passed
+    through unchanged.
+    """
+    converted = []
+    for line_number, record in enumerate(records, first_line):
+        content, ending = split_line_ending(record)
+        if not content:
+            converted.append(record)
+            continue
+        fields = split_fields(content, delimiter)
+        for column in column_ids:
+            if column >= len(fields):
+                raise ValueError(
+                    f"Line {line_number}: missing column {column}")
+            raw = fields[column].strip().strip(b'"')
+            if not raw:
+                continue
+            try:
+                value = float(raw)
+            except ValueError:
+                raise ValueError(
+                    f"Line {line_number}: not a number: {raw!r}") from None
+            fields[column] = format_number(value * scale + offset,
+                                           number_format)
+        converted.append(delimiter.join(fields) + ending)
+    return converted
+
+
+def convert_csv(source_path, target_path, columns, source, target,
+                delimiter=',', header=True, number_format=None,
+                chunk_rows=CSV_CHUNK_ROWS, workers=1):
+    """Streams a CSV file and converts the given columns between units.
+
+    columns are header names, or 0-based indices when header is False.
+    With workers > 1 the file is split into shards that are converted in a
+    process pool; this needs real files and records without quoted line
+    breaks. Returns a dict with the number of rows and bytes processed and
+    the elapsed time.
+    """
+    scale, offset = get_scale_offset(source, target)
+    delimiter = delimiter.encode('ascii')
+    _check_output(source_path, target_path)
+    start = time.perf_counter()
+
+    if workers > 1 and '-' not in (source_path, target_path):
+        rows, size = _convert_csv_sharded(
+            source_path, target_path, columns, scale, offset, delimiter,
+            header, number_format, chunk_rows, workers)
+        return {'rows': rows, 'bytes': size,
+                'seconds': time.perf_counter() - start}
+
+    # Bytes read so far, also known for stdin
+    size = [0]
+    with _open_input(source_path) as infile, _open_output(target_path) as outfile:
+        records = iter_records(_count_bytes(infile, size))
+        line_number = 1
+        if header:
+            first = next(records, b'')
+            column_ids = resolve_columns(first, columns, delimiter)
+            outfile.write(first)
+            line_number += 1
+        else:
+            column_ids = [int(column) for column in columns]
+
+        rows = _convert_record_stream(records, outfile, column_ids, scale,
+                                      offset, delimiter, number_format,
+                                      chunk_rows, line_number)
+
+    return {'rows': rows, 'bytes': size[0],
+            'seconds': time.perf_counter() - start}
+
+
+def _convert_record_stream(records, outfile, column_ids, scale, offset,
+                           delimiter, number_format, chunk_rows,
+                           line_number=1):
+    """Converts records chunk by chunk into outfile, returns the row count"""
+    rows = 0
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_rows:
+            outfile.writelines(convert_records(
+                chunk, column_ids, scale, offset, delimiter,
+                number_format, line_number + rows))
+            rows += len(chunk)
+            chunk = []
+    if chunk:
+        outfile.writelines(convert_records(
+            chunk, column_ids, scale, offset, delimiter,
+            number_format, line_number + rows))
+        rows += len(chunk)
+    return rows
+
+# Sharded conversion
+
+
+def find_record_shards(path, start, end, count):
+    """Splits the byte range [start, end) of a file into up to count shards
+    whose boundaries fall right after a line break.
+    """
+    boundaries = [start]
+    with open(path, 'rb') as infile:
+        for shard in range(1, count):
+            position = start + (end - start) * shard // count
+            if position <= boundaries[-1]:
+                continue
+            # Read on to the end of the line that contains position - 1
+            infile.seek(position - 1)
+            infile.readline()
+            position = min(infile.tell(), end)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    if boundaries[-1] < end:
+        boundaries.append(end)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _read_lines(infile, start, end):
+    """Yields the lines of a file that start in the byte range [start, end)"""
+    infile.seek(start)
+    position = start
+    while position < end:
+        line = infile.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line
+
+
+def _convert_csv_shard(task):
+    """Process pool worker: converts one CSV shard into a part file"""
+    (source_path, part_path, start, end, column_ids, scale, offset,
+     delimiter, number_format, chunk_rows) = task
+    with open(source_path, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+            open(part_path, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+        records = iter_records(_read_lines(infile, start, end), strict=True)
+        try:
+            rows = _convert_record_stream(records, outfile, column_ids,
+                                          scale, offset, delimiter,
+                                          number_format, chunk_rows)
+        except ValueError as e:
+            # A quoted line break that crosses a shard boundary, a short
+            # row or a bad number; lines are counted from the shard start
+            raise ValueError(f"Shard at byte {start}: {e}") from None
+    return rows
+
+
+def _convert_csv_sharded(source_path, target_path, columns, scale, offset,
+                         delimiter, header, number_format, chunk_rows,
+                         workers):
+    """Converts a CSV file in shards and stitches the parts back in order"""
+    size = os.path.getsize(source_path)
+    with open(source_path, 'rb') as infile:
+        first = next(iter_records(infile), b'') if header else b''
+    if header:
+        column_ids = resolve_columns(first, columns, delimiter)
+    else:
+        column_ids = [int(column) for column in columns]
+
+    shards = find_record_shards(source_path, len(first), size, workers)
+    directory = os.path.dirname(os.path.abspath(target_path))
+    parts = []
+    try:
+        for _ in shards:
+            handle, part_path = tempfile.mkstemp(suffix='.part',
+                                                 dir=directory)
+            os.close(handle)
+            parts.append(part_path)
+
+        tasks = [(source_path, part_path, shard_start, shard_end, column_ids,
+                  scale, offset, delimiter, number_format, chunk_rows)
+                 for part_path, (shard_start, shard_end) in zip(parts, shards)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = sum(pool.map(_convert_csv_shard, tasks))
+
+        # Stitch the parts back together in input order
+        with open(target_path, 'wb') as outfile:
+            outfile.write(first)
+            for part_path in parts:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, outfile, IO_BUFFER_SIZE)
+    finally:
+        for part_path in parts:
+            os.remove(part_path)
+    return rows, size
+
+# Binary helpers
+
+
+def convert_binary(source_path, target_path, source, target,
+                   dtype='float64', window_bytes=MMAP_WINDOW_BYTES,
+                   workers=1):
+    """Converts a raw little-endian float32/float64 file between units.
+
+    The file is memory-mapped one window at a time and each window is
+    converted with a single vectorized kernel. If target_path is None the
+    file is converted in place. With workers > 1 the file is split into
+    value-aligned shards converted in a process pool, each writing its own
+    byte range of the output. Returns a dict with the number of values and
+    bytes processed and the elapsed time.
+    """
+    # Validate the units before touching any file
+    get_scale_offset(source, target)
+    itemsize = int(BINARY_DTYPES[dtype][-1])
+    size = os.path.getsize(source_path)
+    if size % itemsize:
+        raise ValueError(f"File size {size} is not a multiple of "
+                         f"{itemsize} bytes")
+    if target_path is not None and _same_file(source_path, target_path):
+        raise ValueError(f"Output {target_path} is the input file; use "
+                         f"--in-place to convert a file in place")
+    count = size // itemsize
+    start = time.perf_counter()
+
+    if target_path is not None:
+        # Preallocate the output so it can be mapped window by window
+        with open(target_path, 'wb') as outfile:
+            outfile.truncate(size)
+
+    window = max(window_bytes // itemsize, 1)
+    workers = max(min(workers, count // window + 1), 1)
+    bounds = [count * shard // workers for shard in range(workers + 1)]
+    tasks = [(source_path, target_path, source, target, dtype, first, last,
+              window) for first, last in zip(bounds, bounds[1:])]
+    if workers == 1:
+        for task in tasks:
+            _convert_binary_range(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_convert_binary_range, tasks))
+
+    return {'values': count, 'bytes': size,
+            'seconds': time.perf_counter() - start}
+
+
+def _convert_binary_range(task):
+    """Converts the values [first, last) of a binary file window by window"""
+    import numpy as np
+
+    from engine import convert_array
+
+    (source_path, target_path, source, target, dtype, first, last,
+     window) = task
+    dtype = np.dtype(BINARY_DTYPES[dtype])
+    for position in range(first, last, window):
+        length = min(window, last - position)
+        offset = position * dtype.itemsize
+        if target_path is None:
+            values = np.memmap(source_path, dtype=dtype, mode='r+',
+                               offset=offset, shape=(length,))
+            convert_array(values, source, target, out=values)
+            values.flush()
+        else:
+            values = np.memmap(source_path, dtype=dtype, mode='r',
+                               offset=offset, shape=(length,))
+            out = np.memmap(target_path, dtype=dtype, mode='r+',
+                            offset=offset, shape=(length,))
+            convert_array(values, source, target, out=out)
+            out.flush()
+            del out
+        # Unmap the window before moving on
+        del values
+    return last - first
+
+
+# Digit text helpers
+
+
+def convert_radix(source_path, target_path, from_base, to_base, wrap=0):
+    """Re-encodes a file of digits between two power-of-two bases.
+
+    Digits are streamed chunk by chunk; see radix.regroup_stream. Returns a
+    dict with the number of digits written, the input size and the elapsed
+    time.
+    """
+    _check_output(source_path, target_path)
+    start = time.perf_counter()
+    with _open_input(source_path) as raw_in, _open_output(target_path) as raw_out:
+        infile = io.TextIOWrapper(raw_in, encoding='ascii')
+        outfile = io.TextIOWrapper(raw_out, encoding='ascii')
+        digits = regroup_stream(infile, outfile, from_base, to_base,
+                                wrap=wrap)
+        outfile.flush()
+        size = raw_in.tell() if raw_in.seekable() else None
+    return {'digits': digits, 'bytes': size,
+            'seconds': time.perf_counter() - start}
+
+
+def convert_hexdump(source_path, target_path, base=16, decode=False,
+                    wrap=64):
+    """Encodes a binary file as lines of digits, or decodes it back.
+
+    Returns a dict with the number of bytes encoded or decoded and the
+    elapsed time.
+    """
+    _check_output(source_path, target_path)
+    start = time.perf_counter()
+    with _open_input(source_path) as infile, _open_output(target_path) as outfile:
+        if decode:
+            size = decode_stream(io.TextIOWrapper(infile, encoding='ascii'),
+                                 outfile, base)
+        else:
+            text = io.TextIOWrapper(outfile, encoding='ascii')
+            size = encode_stream(infile, text, base, wrap)
+            text.flush()
+    return {'values': size, 'bytes': size,
+            'seconds': time.perf_counter() - start}
+
+
+# Unit expression queries
+
+
+def convert_queries(source_path, target_path, number_format=None):
+    """Evaluates a file of queries such as '3 ft 4 in to cm', one per line,
+    and writes one result per line.
+
+    Every distinct query is compiled once, see expression.compile_query;
+    blank lines are copied through. Returns a dict with the number of
+    queries, the input size and the elapsed time.
+    """
+    _check_output(source_path, target_path)
+    start = time.perf_counter()
+    count = 0
+    size = 0
+    with _open_input(source_path) as infile, _open_output(target_path) as outfile:
+        for line_number, line in enumerate(infile, 1):
+            size += len(line)
+            text = line.decode('utf-8').strip()
+            if not text:
+                outfile.write(b'\n')
+                continue
+            try:
+                result = evaluate(text)
+            except (KeyError, ValueError) as error:
+                raise ValueError(f"Line {line_number}: {error.args[0]}") from None
+            outfile.write(format_number(result, number_format) + b'\n')
+            count += 1
+    return {'values': count, 'bytes': size,
+            'seconds': time.perf_counter() - start}
+
+
+def _count_bytes(lines, size):
+    """Yields lines, adding their lengths to size[0]"""
+    for line in lines:
+        size[0] += len(line)
+        yield line
+
+
+def _same_file(source_path, target_path):
+    """Returns True when the output path names the input file"""
+    if '-' in (source_path, target_path) or not os.path.exists(target_path):
+        return False
+    return os.path.samefile(source_path, target_path)
+
+
+def _check_output(source_path, target_path):
+    """Raises ValueError when the output file is the input file, which
+    opening the output would truncate before it is read"""
+    if _same_file(source_path, target_path):
+        raise ValueError(f"Output {target_path} is the input file; "
+                         f"write to another file")
+
+
+def _open_input(path):
+    """Opens an input file for binary reading, '-' is stdin"""
+    if path == '-':
+        return os.fdopen(os.dup(sys.stdin.fileno()), 'rb')
+    return open(path, 'rb', buffering=IO_BUFFER_SIZE)
+
+
+def _open_output(path):
+    """Opens an output file for binary writing, '-' is stdout"""
+    if path == '-':
+        sys.stdout.flush()
+        return os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    return open(path, 'wb', buffering=IO_BUFFER_SIZE)
+
+
+def report(stats, stream=sys.stderr):
+    """Prints the throughput of a bulk conversion; bytes is None when the
+    input size is unknown"""
+    seconds = max(stats['seconds'], 1e-9)
+    kind = next(kind for kind in ('rows', 'digits', 'values')
+                if kind in stats)
+    if stats['bytes'] is None:
+        print(f"{stats[kind]} {kind} in {seconds:.2f} s "
+              f"({stats[kind] / seconds:,.0f} {kind}/s)", file=stream)
+        return
+    print(f"{stats[kind]} {kind}, {stats['bytes'] / 1e6:.1f} MB in "
+          f"{seconds:.2f} s ({stats[kind] / seconds:,.0f} {kind}/s, "
+          f"{stats['bytes'] / 1e6 / seconds:.1f} MB/s)", file=stream)
+
+# Command line interface
+
+
+def build_parser():
+    """Builds the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="Convert units in large files")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    csv_parser = commands.add_parser(
+        'csv', help="convert columns of a CSV file")
+    csv_parser.add_argument('input', help="input CSV file, '-' for stdin")
+    csv_parser.add_argument('-o', '--output', default='-',
+                            help="output CSV file (default: stdout)")
+    csv_parser.add_argument('--columns', required=True,
+                            help="comma separated column names to convert")
+    csv_parser.add_argument('--from', dest='source', required=True,
+                            help="unit of the columns, e.g. Foot")
+    csv_parser.add_argument('--to', dest='target', required=True,
+                            help="unit to convert to, e.g. Meter")
+    csv_parser.add_argument('--delimiter', default=',')
+    csv_parser.add_argument('--no-header', action='store_true',
+                            help="columns are 0-based indices")
+    csv_parser.add_argument('--format', dest='number_format',
+                            help="format spec for results, e.g. .6g")
+    csv_parser.add_argument('--chunk-rows', type=int, default=CSV_CHUNK_ROWS)
+    csv_parser.add_argument('--workers', type=int, default=1,
+                            help="processes to convert shards with")
+
+    binary_parser = commands.add_parser(
+        'binary', help="convert a raw little-endian float file")
+    binary_parser.add_argument('input', help="input binary file")
+    output = binary_parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('-o', '--output', help="output binary file")
+    output.add_argument('--in-place', action='store_true',
+                        help="overwrite the input file")
+    binary_parser.add_argument('--dtype', choices=tuple(BINARY_DTYPES),
+                               default='float64')
+    binary_parser.add_argument('--from', dest='source', required=True,
+                               help="unit of the samples, e.g. PSI")
+    binary_parser.add_argument('--to', dest='target', required=True,
+                               help="unit to convert to, e.g. Pascal")
+    binary_parser.add_argument('--workers', type=int, default=1,
+                               help="processes to convert shards with")
+
+    radix_parser = commands.add_parser(
+        'radix', help="re-encode digits between bases 2, 4, 8, 16 and 32")
+    radix_parser.add_argument('input', help="input text file of digits")
+    radix_parser.add_argument('-o', '--output', default='-',
+                              help="output text file (default: stdout)")
+    radix_parser.add_argument('--from-base', type=int, required=True)
+    radix_parser.add_argument('--to-base', type=int, required=True)
+    radix_parser.add_argument('--wrap', type=int, default=0,
+                              help="digits per output line (default: one line)")
+
+    hexdump_parser = commands.add_parser(
+        'hexdump', help="encode a binary file as digits, or decode it")
+    hexdump_parser.add_argument('input', help="input file, '-' for stdin")
+    hexdump_parser.add_argument('-o', '--output', default='-',
+                                help="output file (default: stdout)")
+    hexdump_parser.add_argument('--base', type=int, choices=(2, 4, 16),
+                                default=16)
+    hexdump_parser.add_argument('--decode', action='store_true',
+                                help="turn digits back into bytes")
+    hexdump_parser.add_argument('--wrap', type=int, default=64,
+                                help="digits per output line, 0 for one line")
+
+    query_parser = commands.add_parser(
+        'query', help="evaluate queries such as '12 kWh in MJ', one per line")
+    query_parser.add_argument('input', help="input text file, '-' for stdin")
+    query_parser.add_argument('-o', '--output', default='-',
+                              help="output text file (default: stdout)")
+    query_parser.add_argument('--format', dest='number_format',
+                              help="format spec for results, e.g. .6g")
+    return parser
+
+
+def main(argv=None):
+    """Runs the command-line interface"""
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == 'csv':
+            stats = convert_csv(args.input, args.output,
+                                args.columns.split(','),
+                                args.source, args.target,
+                                delimiter=args.delimiter,
+                                header=not args.no_header,
+                                number_format=args.number_format,
+                                chunk_rows=args.chunk_rows,
+                                workers=args.workers)
+        elif args.command == 'binary':
+            stats = convert_binary(args.input,
+                                   None if args.in_place else args.output,
+                                   args.source, args.target,
+                                   dtype=args.dtype,
+                                   workers=args.workers)
+        elif args.command == 'radix':
+            stats = convert_radix(args.input, args.output, args.from_base,
+                                  args.to_base, wrap=args.wrap)
+        elif args.command == 'hexdump':
+            stats = convert_hexdump(args.input, args.output, base=args.base,
+                                    decode=args.decode, wrap=args.wrap)
+        elif args.command == 'query':
+            stats = convert_queries(args.input, args.output,
+                                    number_format=args.number_format)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    report(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,19 @@ License: MIT
 """
 
 import tkinter as tk
+from collections import namedtuple
 from tkinter import ttk, font
 import math
+import time
 
-# Initial window setup
+# The conversion modules (engine, expression, search, radix) and NumPy are
+# imported by the screens and actions that use them, so starting the
+# application only loads what the main menu needs
+
+# Initial window setup, timed for --profile
+_tk_started = time.perf_counter()
 root = tk.Tk()
+TK_INIT_SECONDS = time.perf_counter() - _tk_started
 root.title("Unit Converter")
 root.geometry("800x600")
 root.minsize(400, 300)
@@ -64,6 +72,14 @@ DARK_THEME = {
 
 current_theme = LIGHT_THEME
 
+# Background of a card that shows an error
+ERROR_BG = '#ffebee'  # Light red
+
+# Every widget is colored through these named styles; 'clam' is used on all
+# platforms because native themes ignore custom colors
+style = ttk.Style(root)
+style.theme_use('clam')
+
 # Helper functions for responsive UI
 
 
@@ -74,7 +90,7 @@ def get_scaled_font(size):
 
 def create_responsive_frame(parent):
     """Creates a responsive frame with proper padding"""
-    frame = tk.Frame(parent, bg=current_theme['frame_bg'])
+    frame = ttk.Frame(parent, style='Card.TFrame')
     frame.pack(expand=True, fill='both', padx=PADDING['medium'],
                pady=PADDING['medium'])
     return frame
@@ -82,29 +98,19 @@ def create_responsive_frame(parent):
 
 def create_responsive_label(parent, text, size=12, is_title=False):
     """Creates a responsive label with proper styling"""
-    return tk.Label(parent, text=text, font=get_scaled_font(size),
-                    bg=current_theme['bg'],
-                    fg=current_theme['title_fg'] if is_title else current_theme['fg'])
+    return ttk.Label(parent, text=text, font=get_scaled_font(size),
+                     style='Title.TLabel' if is_title else 'TLabel')
 
 
 def create_responsive_entry(parent):
     """Creates a responsive entry field with proper styling"""
-    entry = tk.Entry(parent, font=get_scaled_font(12))
-    entry.configure(relief='flat',
-                    bg=current_theme['entry_bg'],
-                    fg=current_theme['entry_fg'],
-                    insertbackground=current_theme['entry_fg'],
-                    highlightthickness=1,
-                    highlightbackground=current_theme['button_bg'],
-                    highlightcolor=current_theme['button_hover'])
-    return entry
+    return ttk.Entry(parent, font=get_scaled_font(12))
 
 
 def animate_button_click(button):
     """Animates button click with color change"""
-    original_bg = button.cget('bg')
-    button.configure(bg=current_theme['button_hover'])
-    root.after(ANIMATION_DURATION, lambda: button.configure(bg=original_bg))
+    button.configure(style='Pressed.TButton')
+    root.after(ANIMATION_DURATION, lambda: button.configure(style='TButton'))
 
 
 def create_responsive_button(parent, text, command):
@@ -113,26 +119,9 @@ def create_responsive_button(parent, text, command):
         animate_button_click(button)
         command()
 
-    button = tk.Button(parent, text=text, command=wrapped_command,
-                       font=get_scaled_font(11),
-                       bg=current_theme['button_bg'],
-                       fg=current_theme['button_fg'],
-                       relief='flat',
-                       borderwidth=0,
-                       padx=PADDING['medium'],
-                       pady=PADDING['small'],
-                       cursor='hand2')
-
-    def on_enter(e):
-        button.configure(bg=current_theme['button_hover'])
-        button.configure(relief='solid')
-
-    def on_leave(e):
-        button.configure(bg=current_theme['button_bg'])
-        button.configure(relief='flat')
-
-    button.bind('<Enter>', on_enter)
-    button.bind('<Leave>', on_leave)
+    # Colors, padding and the hover color come from the TButton style
+    button = ttk.Button(parent, text=text, command=wrapped_command,
+                        cursor='hand2')
     return button
 
 
@@ -144,6 +133,36 @@ def create_back_button(parent):
         side='bottom', pady=PADDING['medium'], fill='x', padx=PADDING['large'])
     return back_button
 
+# Delay before a live conversion runs, in ms; keystrokes that arrive within
+# it are coalesced into one computation
+LIVE_DELAY = 5
+
+
+def bind_live(widgets, compute):
+    """Runs compute after every edit of the given entries and comboboxes.
+    Edits are debounced with root.after, so however fast the user types at
+    most one computation is pending"""
+    pending = None
+
+    def run():
+        nonlocal pending
+        pending = None
+        compute()
+
+    def schedule(event=None):
+        nonlocal pending
+        if getattr(event, 'keysym', None) in ('Return', 'KP_Enter'):
+            return  # Enter runs the screen's own action
+        if pending is not None:
+            root.after_cancel(pending)
+        pending = root.after(LIVE_DELAY, run)
+
+    for widget in widgets:
+        for sequence in ('<KeyRelease>', '<<Paste>>', '<<Cut>>',
+                         '<<ComboboxSelected>>'):
+            widget.bind(sequence, schedule, add='+')
+    return schedule
+
 # Theme management functions
 
 
@@ -154,96 +173,126 @@ def toggle_theme():
     update_theme()
 
 
-def update_theme():
-    """Updates all widgets with current theme settings"""
-    root.configure(bg=current_theme['bg'])
-    for widget in root.winfo_children():
-        update_widget_theme(widget)
+# Plain tk widgets that ttk styles cannot reach: widget -> {option: theme key}
+themed_widgets = {root: {'bg': 'bg'}}
 
 
-def update_widget_theme(widget):
-    """Updates individual widget theme settings"""
-    try:
-        if isinstance(widget, tk.Frame):
-            widget.configure(bg=current_theme['frame_bg'])
-        elif isinstance(widget, tk.Label):
-            if widget.cget('font')[1] >= 20:  # For titles
-                widget.configure(
-                    bg=current_theme['bg'], fg=current_theme['title_fg'])
-            else:
-                widget.configure(
-                    bg=current_theme['bg'], fg=current_theme['fg'])
-        elif isinstance(widget, tk.Button):
-            widget.configure(bg=current_theme['button_bg'],
-                             fg=current_theme['button_fg'],
-                             activebackground=current_theme['button_hover'],
-                             activeforeground=current_theme['button_fg'])
-        elif isinstance(widget, tk.Entry):
-            widget.configure(bg=current_theme['entry_bg'],
-                             fg=current_theme['entry_fg'],
-                             insertbackground=current_theme['entry_fg'],
-                             highlightbackground=current_theme['button_bg'],
-                             highlightcolor=current_theme['button_hover'])
-        elif isinstance(widget, ttk.Combobox):
-            style = ttk.Style()
-            style.configure('TCombobox',
-                            background=current_theme['combobox_bg'],
-                            foreground=current_theme['combobox_fg'],
-                            fieldbackground=current_theme['combobox_bg'],
-                            selectbackground=current_theme['button_bg'],
-                            selectforeground=current_theme['button_fg'])
-            widget.configure(style='TCombobox')
-
-        for child in widget.winfo_children():
-            update_widget_theme(child)
-    except:
-        pass
-
-
-def clear_window():
-    """Clears all widgets from the window"""
-    for widget in root.winfo_children():
-        widget.destroy()
-
-# Base conversion functions
-
-
-def decimal_to_base(n, base):
-    """Converts a decimal number to specified base"""
-    if n == 0:
-        return "0"
-    digits = "0123456789ABCDEF"
-    result = ""
-    negative = False
-    if n < 0:
-        negative = True
-        n = -n
-    while n > 0:
-        result = digits[n % base] + result
-        n = n // base
-    return "-" + result if negative else result
-
-
-def base_to_decimal(n, base):
-    """Converts a number from specified base to decimal"""
-    if not n:
-        return 0
-    digits = "0123456789ABCDEF"
-    negative = False
-    if n[0] == '-':
-        negative = True
-        n = n[1:]
-    result = 0
-    for digit in n:
-        result = result * base + digits.index(digit.upper())
-    return -result if negative else result
+def register_themed(widget, **options):
+    """Colors a plain tk widget from the theme now and on every switch;
+    options map widget options to theme keys, e.g. bg='entry_bg'"""
+    themed_widgets[widget] = options
+    widget.configure(**{option: current_theme[key]
+                        for option, key in options.items()})
+    widget.bind('<Destroy>',
+                lambda event: themed_widgets.pop(widget, None), add='+')
+
+
+def update_theme():
+    """Applies the current theme: a fixed set of named ttk styles, plus the
+    few registered tk widgets, whatever the number of widgets on screen"""
+    theme = current_theme
+    style.configure('TFrame', background=theme['bg'])
+    style.configure('Card.TFrame', background=theme['frame_bg'])
+    style.configure('Error.TFrame', background=ERROR_BG)
+    style.configure('TLabel', background=theme['bg'],
+                    foreground=theme['fg'])
+    style.configure('Title.TLabel', foreground=theme['title_fg'])
+    style.configure('TButton', background=theme['button_bg'],
+                    foreground=theme['button_fg'],
+                    bordercolor=theme['button_bg'],
+                    font=get_scaled_font(11), relief='flat', borderwidth=0,
+                    padding=(PADDING['medium'], PADDING['small']))
+    style.map('TButton',
+              background=[('pressed', theme['button_hover']),
+                          ('active', theme['button_hover'])],
+              relief=[('active', 'solid')])
+    style.configure('Pressed.TButton', background=theme['button_hover'])
+    style.configure('TEntry', fieldbackground=theme['entry_bg'],
+                    foreground=theme['entry_fg'],
+                    insertcolor=theme['entry_fg'],
+                    bordercolor=theme['button_bg'])
+    style.map('TEntry', bordercolor=[('focus', theme['button_hover'])])
+    style.configure('Treeview', background=theme['entry_bg'],
+                    fieldbackground=theme['entry_bg'],
+                    foreground=theme['entry_fg'])
+    style.configure('Treeview.Heading', background=theme['frame_bg'],
+                    foreground=theme['title_fg'])
+    style.configure('TCheckbutton', background=theme['frame_bg'],
+                    foreground=theme['fg'])
+    style.configure('TCombobox', background=theme['combobox_bg'],
+                    foreground=theme['combobox_fg'],
+                    fieldbackground=theme['combobox_bg'],
+                    selectbackground=theme['button_bg'],
+                    selectforeground=theme['button_fg'])
+    for widget, options in themed_widgets.items():
+        widget.configure(**{option: theme[key]
+                            for option, key in options.items()})
+
+
+# Style the window before any screen is built
+update_theme()
+
+
+# A built screen: its outer frame, and a function that preselects a source
+# unit (None for screens without units)
+Screen = namedtuple('Screen', 'frame select')
+
+# Screens built so far: key -> Screen. Screens are built on their first
+# visit and then hidden and shown again, so their state is kept
+screens = {}
+current_screen = None
+
+
+def show_screen(key, build):
+    """Hides the current screen and shows the one named key, building it
+    with build() on its first visit; returns its Screen"""
+    global current_screen
+    if current_screen == key:
+        return screens[key]
+    if current_screen is not None:
+        screens[current_screen].frame.pack_forget()
+    if key in screens:
+        screens[key].frame.pack(expand=True, fill='both',
+                                padx=PADDING['large'],
+                                pady=PADDING['large'])
+    else:
+        screens[key] = build()
+    current_screen = key
+    return screens[key]
 
 # Main conversion functions
 
+# Bases offered by the base converter
+BASES = [str(base) for base in range(2, 37)]
+
+
+def describe_float_fields(pattern, fmt):
+    """Returns the sign, exponent and mantissa fields of a bit pattern as
+    text, with the unbiased exponent"""
+    from radix import FLOAT_FORMATS, float_fields
+
+    exponent_bits, mantissa_bits = FLOAT_FORMATS[fmt]
+    sign, exponent, mantissa = float_fields(pattern, fmt)
+    bias = (1 << exponent_bits - 1) - 1
+    return (f"Sign: {sign}   "
+            f"Exponent: {exponent:0{exponent_bits}b} ({exponent - bias:+d})   "
+            f"Mantissa: {mantissa:0{mantissa_bits}b}")
+
 
 def base_converter():
     """Base conversion interface"""
-    clear_window()
+    show_screen('Number Base', build_base_converter)
+
+
+def build_base_converter():
+    """Builds the base conversion screen"""
+    from radix import (FLOAT_FORMATS, POWER_OF_TWO_BASES, base_to_decimal,
+                       bits_to_float, decimal_to_base, float_to_bits,
+                       format_bit_pattern, regroup_digits)
+
+    # Number modes: integers or IEEE-754 bit patterns
+    modes = ['Integer'] + list(FLOAT_FORMATS)
+
     main_frame = create_responsive_frame(root)
     main_frame.pack(expand=True, fill='both',
                     padx=PADDING['large'],
@@ -261,8 +310,8 @@ def base_converter():
     create_back_button(main_frame)
 
     # Input card
-    input_card = tk.Frame(main_frame, bg=current_theme['frame_bg'],
-                          relief='solid', borderwidth=1)
+    input_card = ttk.Frame(main_frame, style='Card.TFrame',
+                           relief='solid', borderwidth=1)
     input_card.pack(fill='x', padx=PADDING['large'],
                     pady=PADDING['medium'])
 
@@ -278,33 +327,41 @@ def base_converter():
     value_entry.pack(fill='x', padx=PADDING['large'],
                      pady=(0, PADDING['medium']))
 
-    bases_frame = tk.Frame(input_frame, bg=current_theme['frame_bg'])
+    # Integers, or float bit patterns where base 10 is the float value
+    mode_label = create_responsive_label(input_frame, "Mode:", size=12)
+    mode_label.pack(pady=(0, PADDING['small']))
+    mode_combo = ttk.Combobox(input_frame, values=modes)
+    mode_combo.set(modes[0])
+    mode_combo.pack(fill='x', padx=PADDING['large'],
+                    pady=(0, PADDING['medium']))
+
+    bases_frame = ttk.Frame(input_frame, style='Card.TFrame')
     bases_frame.pack(fill='x', padx=PADDING['medium'])
 
     # From base
-    from_frame = tk.Frame(bases_frame, bg=current_theme['frame_bg'])
+    from_frame = ttk.Frame(bases_frame, style='Card.TFrame')
     from_frame.pack(side='left', fill='x', expand=True,
                     padx=(0, PADDING['small']))
 
     from_base_label = create_responsive_label(
         from_frame, "From Base:", size=12)
     from_base_label.pack(pady=(0, PADDING['small']))
-    from_base_combo = ttk.Combobox(from_frame, values=["2", "8", "10", "16"])
+    from_base_combo = ttk.Combobox(from_frame, values=BASES)
     from_base_combo.pack(fill='x')
 
     # To base
-    to_frame = tk.Frame(bases_frame, bg=current_theme['frame_bg'])
+    to_frame = ttk.Frame(bases_frame, style='Card.TFrame')
     to_frame.pack(side='right', fill='x', expand=True,
                   padx=(PADDING['small'], 0))
 
     to_base_label = create_responsive_label(to_frame, "To Base:", size=12)
     to_base_label.pack(pady=(0, PADDING['small']))
-    to_base_combo = ttk.Combobox(to_frame, values=["2", "8", "10", "16"])
+    to_base_combo = ttk.Combobox(to_frame, values=BASES)
     to_base_combo.pack(fill='x')
 
     # Result card
-    result_card = tk.Frame(main_frame, bg=current_theme['frame_bg'],
-                           relief='solid', borderwidth=1)
+    result_card = ttk.Frame(main_frame, style='Card.TFrame',
+                            relief='solid', borderwidth=1)
     result_card.pack(fill='x', padx=PADDING['large'],
                      pady=PADDING['medium'])
 
@@ -317,52 +374,95 @@ def base_converter():
     result_label.pack(pady=(0, PADDING['small']))
     result_entry = create_responsive_entry(result_frame)
     result_entry.pack(fill='x', padx=PADDING['large'])
+    fields_label = create_responsive_label(result_frame, "", size=10)
+    fields_label.configure(wraplength=600, justify='left')
+    fields_label.pack(fill='x', padx=PADDING['large'],
+                      pady=(PADDING['small'], 0))
 
     # Add separator
     separator = ttk.Separator(main_frame, orient='horizontal')
     separator.pack(fill='x', pady=PADDING['medium'])
 
     # Operation buttons
-    buttons_frame = tk.Frame(main_frame, bg=current_theme['bg'])
+    buttons_frame = ttk.Frame(main_frame)
     buttons_frame.pack(fill='x', padx=PADDING['large'])
 
-    def convert():
-        """Converts number between bases"""
+    def convert(live=False):
+        """Converts number between bases; live conversions while typing
+        skip the visual effects"""
+        if live and not value_entry.get().strip():
+            result_entry.delete(0, tk.END)
+            fields_label.configure(text="")
+            return
         try:
             value = value_entry.get()
             from_base = int(from_base_combo.get())
             to_base = int(to_base_combo.get())
-
-            # Convert to decimal
-            decimal = base_to_decimal(value, from_base)
-            # Convert to target base
-            result = decimal_to_base(decimal, to_base)
+            mode = mode_combo.get()
+            fields_label.configure(text="")
+
+            if mode in FLOAT_FORMATS:
+                # Base 10 is the float itself, other bases its bit pattern
+                if from_base == 10:
+                    pattern = float_to_bits(float(value), mode)
+                else:
+                    pattern = base_to_decimal(value, from_base)
+                    # Rejects patterns wider than the format
+                    bits_to_float(pattern, mode)
+                if to_base == 10:
+                    result = repr(bits_to_float(pattern, mode))
+                else:
+                    result = format_bit_pattern(pattern, to_base, mode)
+                fields_label.configure(
+                    text=describe_float_fields(pattern, mode))
+            elif (from_base in POWER_OF_TWO_BASES and
+                    to_base in POWER_OF_TWO_BASES):
+                # Just regroup the bits
+                result = regroup_digits(value, from_base, to_base)
+            else:
+                # Convert to decimal
+                decimal = base_to_decimal(value, from_base)
+                # Convert to target base
+                result = decimal_to_base(decimal, to_base)
 
             result_entry.delete(0, tk.END)
             result_entry.insert(0, result)
+            if live:
+                return
 
             # Visual effect for result
             result_card.configure(relief='solid', borderwidth=2)
             root.after(ANIMATION_DURATION,
                        lambda: result_card.configure(relief='solid', borderwidth=1))
 
-        except ValueError:
+        except (ValueError, OverflowError):
             result_entry.delete(0, tk.END)
             result_entry.insert(0, "Error: Please enter valid values")
+            if live:
+                return
 
             # Visual effect for error
-            result_card.configure(bg='#ffebee')  # Light red
+            result_card.configure(style='Error.TFrame')
             root.after(ANIMATION_DURATION,
-                       lambda: result_card.configure(bg=current_theme['frame_bg']))
+                       lambda: result_card.configure(style='Card.TFrame'))
 
     convert_btn = create_responsive_button(buttons_frame, "Convert", convert)
     convert_btn.pack(side='left', fill='x', expand=True,
                      padx=(0, PADDING['small']))
 
+    # Results follow every keystroke and base or mode change
+    bind_live((value_entry, mode_combo, from_base_combo, to_base_combo),
+              lambda: convert(live=True))
+    return Screen(main_frame, None)
+
 
 def show_main_menu():
     """Shows the main menu of the application"""
-    clear_window()
+    show_screen('Menu', build_main_menu)
+
+
+def build_main_menu():
+    """Builds the main menu screen"""
     main_frame = create_responsive_frame(root)
     main_frame.pack(expand=True, fill='both',
                     padx=PADDING['large'], pady=PADDING['large'])
@@ -372,8 +472,79 @@ def show_main_menu():
         main_frame, "Unit Converter", size=28, is_title=True)
     title_label.pack(pady=PADDING['large'])
 
+    # Quick conversion of a typed query, e.g. "3 ft 4 in to cm"
+    query_frame = ttk.Frame(main_frame, style='Card.TFrame')
+    query_frame.pack(fill='x', padx=PADDING['medium'],
+                     pady=(0, PADDING['medium']))
+    query_entry = create_responsive_entry(query_frame)
+    query_entry.pack(side='left', fill='x', expand=True,
+                     padx=(0, PADDING['small']))
+    query_result = create_responsive_label(
+        query_frame, "e.g. 3 ft 4 in to cm", size=12)
+    query_result.pack(side='left')
+
+    def run_query(event=None, live=False):
+        """Evaluates the typed query; while typing, incomplete queries
+        clear the result instead of showing an error"""
+        from expression import evaluate
+
+        try:
+            result = evaluate(query_entry.get())
+            query_result.configure(text=f"= {result:.6g}")
+        except (KeyError, ValueError):
+            query_result.configure(
+                text="" if live else "Error: Please enter a valid query")
+
+    query_entry.bind('<Return>', run_query)
+    bind_live((query_entry,), lambda: run_query(live=True))
+
+    # Unit search: matches are listed as you type, Enter opens the first
+    search_frame = ttk.Frame(main_frame, style='Card.TFrame')
+    search_frame.pack(fill='x', padx=PADDING['medium'],
+                      pady=(0, PADDING['medium']))
+    search_label = create_responsive_label(search_frame, "Find unit:")
+    search_label.pack(side='left', padx=(0, PADDING['small']))
+    search_entry = create_responsive_entry(search_frame)
+    search_entry.pack(side='left', fill='x', expand=True)
+    search_results = tk.Listbox(
+        main_frame, height=0, font=get_scaled_font(12),
+        relief='flat', activestyle='none')
+    register_themed(search_results, bg='entry_bg', fg='entry_fg',
+                    selectbackground='button_bg',
+                    selectforeground='button_fg')
+    matches = []
+
+    def update_search(event=None):
+        """Lists the units matching the typed text"""
+        from search import search_units
+
+        matches[:] = search_units(search_entry.get())
+        search_results.delete(0, 'end')
+        for match in matches:
+            search_results.insert(
+                'end', f"{match.unit} ({match.alias}) - {match.category}"
+                if match.alias != match.unit
+                else f"{match.unit} - {match.category}")
+        if matches:
+            search_results.configure(height=len(matches))
+            search_results.pack(fill='x', padx=PADDING['medium'],
+                                after=search_frame)
+        else:
+            search_results.pack_forget()
+
+    def open_match(event=None):
+        """Opens the selected match, or the best one"""
+        selection = search_results.curselection()
+        if matches:
+            open_unit(matches[selection[0] if selection else 0])
+
+    search_entry.bind('<KeyRelease>', update_search)
+    search_entry.bind('<Return>', open_match)
+    search_results.bind('<Double-Button-1>', open_match)
+    search_results.bind('<Return>', open_match)
+
     # Categories frame
-    categories_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
+    categories_frame = ttk.Frame(main_frame, style='Card.TFrame')
     categories_frame.pack(expand=True, fill='both', padx=PADDING['medium'])
 
     # Configure grid
@@ -411,14 +582,15 @@ def show_main_menu():
         ],
         "Other Units": [
             ("Viscosity", viscosity_converter),
-            ("Luminance", luminance_converter)
+            ("Luminance", luminance_converter),
+            ("Number Base", base_converter)
         ]
     }
 
     # Create category frames
     for col, (category_name, buttons) in enumerate(categories.items()):
-        category_frame = tk.Frame(
-            categories_frame, bg=current_theme['frame_bg'])
+        category_frame = ttk.Frame(
+            categories_frame, style='Card.TFrame')
         category_frame.grid(
             row=0, column=col, padx=PADDING['medium'], pady=PADDING['medium'], sticky='nsew')
 
@@ -441,20 +613,32 @@ def show_main_menu():
         main_frame, "Toggle Theme", toggle_theme)
     theme_button.pack(side='bottom', fill='x',
                       padx=PADDING['large'], pady=PADDING['medium'])
+    return Screen(main_frame, None)
 
-# Time conversion functions
 
+def unit_converter(category, default_source, default_target,
+                   result_format='.4g', source=None):
+    """Generic conversion interface for a category of units; source
+    preselects the unit to convert from"""
+    screen = show_screen(category, lambda: build_unit_converter(
+        category, default_source, default_target, result_format))
+    if source is not None:
+        screen.select(source)
+
+
+def build_unit_converter(category, default_source, default_target,
+                         result_format):
+    """Builds the conversion screen of a category of units"""
+    from engine import (CATEGORY_UNITS, convert_decimal, convert_to_all,
+                        exact_ratio, get_plan)
 
-def time_converter():
-    """Time conversion interface"""
-    clear_window()
     main_frame = create_responsive_frame(root)
     main_frame.pack(expand=True, fill='both',
                     padx=PADDING['large'],
                     pady=PADDING['large'])
 
     title_label = create_responsive_label(
-        main_frame, "Time Converter", size=24, is_title=True)
+        main_frame, f"{category} Converter", size=24, is_title=True)
     title_label.pack(pady=PADDING['large'])
 
     # Add separator
@@ -465,22 +649,22 @@ def time_converter():
     create_back_button(main_frame)
 
     # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
+    input_frame = ttk.Frame(main_frame, style='Card.TFrame')
     input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
 
+    units = CATEGORY_UNITS[category]
+
     # Source unit
     source_label = create_responsive_label(input_frame, "From:")
     source_label.pack(anchor='w', padx=PADDING['small'])
 
-    source_value = tk.StringVar()
     source_entry = create_responsive_entry(input_frame)
     source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
     source_unit = tk.StringVar()
     source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Second', 'Minute', 'Hour', 'Day', 'Week', 'Month', 'Year')
-    source_combo.set('Second')
+    source_combo['values'] = units
+    source_combo.set(default_source)
     source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
     # Target unit
@@ -489,1700 +673,299 @@ def time_converter():
 
     target_unit = tk.StringVar()
     target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Second', 'Minute', 'Hour', 'Day', 'Week', 'Month', 'Year')
-    target_combo.set('Minute')
+    target_combo['values'] = units
+    target_combo.set(default_target)
     target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
+    # Exact mode: no rounding until the result is shown, fractions allowed
+    exact = tk.BooleanVar(value=False)
+    exact_check = ttk.Checkbutton(input_frame, text="Exact (e.g. 1/3)",
+                                  variable=exact)
+    exact_check.pack(anchor='w', padx=PADDING['small'])
+
     # Result
-    result_var = tk.StringVar()
     result_label = create_responsive_label(
         input_frame, "", size=14)
     result_label.pack(pady=PADDING['medium'])
 
+    # The value in every unit of the category
+    table = ttk.Treeview(main_frame, columns=('unit', 'value'),
+                         show='headings', height=len(units),
+                         selectmode='none')
+    table.heading('unit', text="Unit")
+    table.heading('value', text="Value")
+    for unit in units:
+        table.insert('', 'end', iid=unit, values=(unit, ""))
+    table.pack(fill='x', padx=PADDING['medium'], pady=PADDING['small'])
+
+    # Conversion function of the selected units, dropped when a unit
+    # changes and rebuilt on the next conversion
+    plan = None
+
+    def reset_plan(*args):
+        nonlocal plan
+        plan = None
+
+    source_unit.trace_add('write', reset_plan)
+    target_unit.trace_add('write', reset_plan)
+    # Table values, reused by every convert_to_all call, and the shown text
+    table_values = None
+    table_text = dict.fromkeys(units, "")
+
+    def show_table(texts):
+        """Writes the texts of the table, touching only changed cells"""
+        for unit, text in zip(units, texts):
+            if table_text[unit] != text:
+                table_text[unit] = text
+                table.set(unit, 'value', text)
+
     def convert():
+        nonlocal plan, table_values
+        text = source_entry.get().strip()
+        if not text:
+            result_label.configure(text="")
+            show_table([""] * len(units))
+            return
         try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to seconds first
-            time_to_seconds = {
-                'Second': 1,
-                'Minute': 60,
-                'Hour': 3600,
-                'Day': 86400,
-                'Week': 604800,
-                'Month': 2592000,  # Assuming 30 days
-                'Year': 31536000   # Assuming 365 days
-            }
-
-            # Convert to seconds
-            seconds = value * time_to_seconds[source]
-            # Convert to target unit
-            result = seconds / time_to_seconds[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
+            source, target = source_unit.get(), target_unit.get()
+            if exact.get():
+                numerator, denominator = exact_ratio(text)
+                value = numerator / denominator
+                result_label.configure(
+                    text=f"Result: {convert_decimal(text, source, target)} "
+                         f"{target}")
+            else:
+                value = float(text)
+                if plan is None:
+                    plan = get_plan(category, source, target)
+                result = plan(value)
+                result_label.configure(
+                    text=f"Result: {result:{result_format}} {target}")
+            table_values = convert_to_all(value, source, out=table_values)
+            show_table([f"{result:{result_format}}"
+                        for result in table_values.tolist()])
         except ValueError:
             result_label.configure(text="Please enter a valid number")
+            show_table([""] * len(units))
         except Exception as e:
             result_label.configure(text=f"Error: {str(e)}")
+            show_table([""] * len(units))
 
     # Convert button
     convert_btn = create_responsive_button(input_frame, "Convert", convert)
     convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
 
-# Volume conversion functions
-
-
-def volume_converter():
-    """Volume conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Volume Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+    # Results follow every keystroke and unit change
+    refresh = bind_live((source_entry, source_combo, target_combo), convert)
+    exact_check.configure(command=refresh)
 
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Milliliter', 'Liter', 'Cubic Centimeter', 'Cubic Meter', 'Gallon', 'Pint', 'Quart')
-    source_combo.set('Milliliter')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+    def select(unit):
+        """Makes unit the source unit, swapping units if it is the target"""
+        if target_unit.get() == unit:
+            target_combo.set(source_unit.get())
+        source_combo.set(unit)
+        refresh()
 
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
+    return Screen(main_frame, select)
 
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Milliliter', 'Liter', 'Cubic Centimeter', 'Cubic Meter', 'Gallon', 'Pint', 'Quart')
-    target_combo.set('Liter')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+# Category conversion interfaces
 
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
 
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to milliliters first
-            volume_to_ml = {
-                'Milliliter': 1,
-                'Liter': 1000,
-                'Cubic Centimeter': 1,
-                'Cubic Meter': 1000000,
-                'Gallon': 3785.41,
-                'Pint': 473.176,
-                'Quart': 946.353
-            }
-
-            # Convert to milliliters
-            ml = value * volume_to_ml[source]
-            # Convert to target unit
-            result = ml / volume_to_ml[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
+def time_converter(source=None):
+    """Time conversion interface"""
+    unit_converter('Time', 'Second', 'Minute', source=source)
 
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
 
-# Speed conversion functions
+def volume_converter(source=None):
+    """Volume conversion interface"""
+    unit_converter('Volume', 'Milliliter', 'Liter', source=source)
 
 
-def speed_converter():
+def speed_converter(source=None):
     """Speed conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Speed Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
+    unit_converter('Speed', 'Kilometers per Hour', 'Miles per Hour',
+                   source=source)
 
-    # Add back button
-    create_back_button(main_frame)
 
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
+def area_converter(source=None):
+    """Area conversion interface"""
+    unit_converter('Area', 'Square Meter', 'Square Kilometer', source=source)
 
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
 
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+def energy_converter(source=None):
+    """Energy conversion interface"""
+    unit_converter('Energy', 'Joule', 'Kilocalorie', source=source)
 
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Meters per Second', 'Kilometers per Hour', 'Miles per Hour', 'Knots')
-    source_combo.set('Kilometers per Hour')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
+def pressure_converter(source=None):
+    """Pressure conversion interface"""
+    unit_converter('Pressure', 'Pascal', 'Bar', source=source)
 
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Meters per Second', 'Kilometers per Hour', 'Miles per Hour', 'Knots')
-    target_combo.set('Miles per Hour')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
+def digital_storage_converter(source=None):
+    """Digital Storage conversion interface"""
+    unit_converter('Digital Storage', 'Megabyte', 'Gigabyte',
+                   source=source)
 
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to meters per second first
-            speed_to_mps = {
-                'Meters per Second': 1,
-                'Kilometers per Hour': 0.277778,
-                'Miles per Hour': 0.44704,
-                'Knots': 0.514444
-            }
-
-            # Convert to meters per second
-            mps = value * speed_to_mps[source]
-            # Convert to target unit
-            result = mps / speed_to_mps[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
 
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
+def length_converter(source=None):
+    """Length conversion interface"""
+    unit_converter('Length', 'Meter', 'Centimeter', source=source)
 
-# Area conversion functions
 
+def weight_converter(source=None):
+    """Weight conversion interface"""
+    unit_converter('Weight', 'Kilogram', 'Gram', source=source)
 
-def area_converter():
-    """Area conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
 
-    title_label = create_responsive_label(
-        main_frame, "Area Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
+def temperature_converter(source=None):
+    """Temperature conversion interface"""
+    unit_converter('Temperature', 'Celsius', 'Fahrenheit', result_format='.2f',
+                   source=source)
 
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
 
-    # Add back button
-    create_back_button(main_frame)
+def angle_converter(source=None):
+    """Angle conversion interface"""
+    unit_converter('Angle', 'Degree', 'Radian', source=source)
 
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
 
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
+def frequency_converter(source=None):
+    """Frequency conversion interface"""
+    unit_converter('Frequency', 'Hertz', 'Kilohertz', source=source)
 
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Square Meter', 'Square Centimeter',
-                              'Square Kilometer', 'Hectare', 'Square Foot', 'Square Yard', 'Acre')
-    source_combo.set('Square Meter')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+def force_converter(source=None):
+    """Force conversion interface"""
+    unit_converter('Force', 'Newton', 'Kilogram-force', source=source)
 
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
 
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Square Meter', 'Square Centimeter',
-                              'Square Kilometer', 'Hectare', 'Square Foot', 'Square Yard', 'Acre')
-    target_combo.set('Square Kilometer')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+def power_converter(source=None):
+    """Power conversion interface"""
+    unit_converter('Power', 'Watt', 'Kilowatt', source=source)
 
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
 
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to square meters first
-            area_to_sqm = {
-                'Square Meter': 1,
-                'Square Centimeter': 0.0001,
-                'Square Kilometer': 1000000,
-                'Hectare': 10000,
-                'Square Foot': 0.092903,
-                'Square Yard': 0.836127,
-                'Acre': 4046.86
-            }
-
-            # Convert to square meters
-            sqm = value * area_to_sqm[source]
-            # Convert to target unit
-            result = sqm / area_to_sqm[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
+def density_converter(source=None):
+    """Density conversion interface"""
+    unit_converter('Density', 'kg/m³', 'g/cm³', source=source)
 
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
 
-# Energy conversion functions
+def viscosity_converter(source=None):
+    """Viscosity conversion interface"""
+    unit_converter('Viscosity', 'Pa·s', 'Poise', source=source)
 
 
-def energy_converter():
-    """Energy conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
+def magnetic_flux_converter(source=None):
+    """Magnetic Flux conversion interface"""
+    unit_converter('Magnetic Flux', 'Weber', 'Maxwell', source=source)
 
-    title_label = create_responsive_label(
-        main_frame, "Energy Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
 
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
+def luminance_converter(source=None):
+    """Luminance conversion interface"""
+    unit_converter('Luminance', 'cd/m²', 'Foot-lambert', source=source)
 
-    # Add back button
-    create_back_button(main_frame)
 
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
+def electric_current_converter(source=None):
+    """Electric Current conversion interface"""
+    unit_converter('Electric Current', 'Ampere', 'Milliampere',
+                   source=source)
 
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
 
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
+def electric_resistance_converter(source=None):
+    """Electric Resistance conversion interface"""
+    unit_converter('Electric Resistance', 'Ohm', 'Kiloohm',
+                   source=source)
+
+
+# Converter screen of every category
+CATEGORY_SCREENS = {
+    'Length': length_converter,
+    'Weight': weight_converter,
+    'Temperature': temperature_converter,
+    'Time': time_converter,
+    'Volume': volume_converter,
+    'Speed': speed_converter,
+    'Area': area_converter,
+    'Energy': energy_converter,
+    'Pressure': pressure_converter,
+    'Digital Storage': digital_storage_converter,
+    'Angle': angle_converter,
+    'Frequency': frequency_converter,
+    'Force': force_converter,
+    'Power': power_converter,
+    'Density': density_converter,
+    'Viscosity': viscosity_converter,
+    'Magnetic Flux': magnetic_flux_converter,
+    'Luminance': luminance_converter,
+    'Electric Current': electric_current_converter,
+    'Electric Resistance': electric_resistance_converter
+}
 
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Joule', 'Kilojoule', 'Calorie',
-                              'Kilocalorie', 'Kilowatt Hour', 'Horsepower Hour')
-    source_combo.set('Joule')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
+def open_unit(match):
+    """Opens the converter screen of a search Match with its unit selected"""
+    CATEGORY_SCREENS[match.category](source=match.unit)
 
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Joule', 'Kilojoule', 'Calorie',
-                              'Kilocalorie', 'Kilowatt Hour', 'Horsepower Hour')
-    target_combo.set('Kilocalorie')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
 
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
+def enable_profiling(path=None):
+    """Times Tk initialisation, show_main_menu, screen builds and
+    navigation, update_theme, button clicks and live conversions, and runs
+    cProfile over the session; returns the started Profiler.
 
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to joules first
-            energy_to_joules = {
-                'Joule': 1,
-                'Kilojoule': 1000,
-                'Calorie': 4.184,
-                'Kilocalorie': 4184,
-                'Kilowatt Hour': 3600000,
-                'Horsepower Hour': 2684520
-            }
-
-            # Convert to joules
-            joules = value * energy_to_joules[source]
-            # Convert to target unit
-            result = joules / energy_to_joules[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
+    Functions are wrapped here, so without --profile nothing is timed.
+    """
+    from profiling import Profiler
 
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
+    global create_responsive_button, bind_live, build_unit_converter
+    profiler = Profiler(path) if path else Profiler()
+    profiler.record('Tk initialisation', TK_INIT_SECONDS)
 
-# Pressure conversion functions
+    module = globals()
+    for name in ('show_main_menu', 'build_main_menu', 'base_converter',
+                 'build_base_converter', 'update_theme'):
+        module[name] = profiler.wrap(name, module[name])
+    for category, screen in CATEGORY_SCREENS.items():
+        CATEGORY_SCREENS[category] = module[screen.__name__] = \
+            profiler.wrap(screen.__name__, screen)
+    build_unit_converter = profiler.wrap(
+        lambda category, *args: f"build_unit_converter {category}",
+        build_unit_converter)
 
+    # Buttons and live fields created from now on time their actions
+    create_button = create_responsive_button
+    bind_fields = bind_live
 
-def pressure_converter():
-    """Pressure conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
+    def create_timed_button(parent, text, command):
+        return create_button(parent, text,
+                             profiler.wrap(f"click {text}", command))
 
-    title_label = create_responsive_label(
-        main_frame, "Pressure Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
+    def bind_timed(widgets, compute):
+        return bind_fields(widgets,
+                           profiler.wrap('live conversion', compute))
 
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
+    create_responsive_button = create_timed_button
+    bind_live = bind_timed
 
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Pascal', 'Kilopascal',
-                              'Bar', 'Atmosphere', 'PSI')
-    source_combo.set('Pascal')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Pascal', 'Kilopascal',
-                              'Bar', 'Atmosphere', 'PSI')
-    target_combo.set('Bar')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to pascals first
-            pressure_to_pa = {
-                'Pascal': 1,
-                'Kilopascal': 1000,
-                'Bar': 100000,
-                'Atmosphere': 101325,
-                'PSI': 6894.76
-            }
-
-            # Convert to pascals
-            pa = value * pressure_to_pa[source]
-            # Convert to target unit
-            result = pa / pressure_to_pa[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-# Digital Storage conversion functions
-
-
-def digital_storage_converter():
-    """Digital Storage conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Digital Storage Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Bit', 'Byte', 'Kilobyte', 'Megabyte', 'Gigabyte', 'Terabyte')
-    source_combo.set('Megabyte')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Bit', 'Byte', 'Kilobyte', 'Megabyte', 'Gigabyte', 'Terabyte')
-    target_combo.set('Gigabyte')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to bits first
-            storage_to_bits = {
-                'Bit': 1,
-                'Byte': 8,
-                'Kilobyte': 8 * 1024,
-                'Megabyte': 8 * 1024 * 1024,
-                'Gigabyte': 8 * 1024 * 1024 * 1024,
-                'Terabyte': 8 * 1024 * 1024 * 1024 * 1024
-            }
-
-            # Convert to bits
-            bits = value * storage_to_bits[source]
-            # Convert to target unit
-            result = bits / storage_to_bits[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def length_converter():
-    """Length conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Length Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Meter', 'Centimeter', 'Millimeter', 'Kilometer', 'Inch', 'Foot', 'Yard', 'Mile')
-    source_combo.set('Meter')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Meter', 'Centimeter', 'Millimeter', 'Kilometer', 'Inch', 'Foot', 'Yard', 'Mile')
-    target_combo.set('Centimeter')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to meters first
-            length_to_meters = {
-                'Meter': 1,
-                'Centimeter': 0.01,
-                'Millimeter': 0.001,
-                'Kilometer': 1000,
-                'Inch': 0.0254,
-                'Foot': 0.3048,
-                'Yard': 0.9144,
-                'Mile': 1609.344
-            }
-
-            # Convert to meters
-            meters = value * length_to_meters[source]
-            # Convert to target unit
-            result = meters / length_to_meters[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def weight_converter():
-    """Weight conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Weight Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Kilogram', 'Gram', 'Milligram', 'Pound', 'Ounce', 'Ton')
-    source_combo.set('Kilogram')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Kilogram', 'Gram', 'Milligram', 'Pound', 'Ounce', 'Ton')
-    target_combo.set('Gram')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to kilograms first
-            weight_to_kg = {
-                'Kilogram': 1,
-                'Gram': 0.001,
-                'Milligram': 0.000001,
-                'Pound': 0.453592,
-                'Ounce': 0.0283495,
-                'Ton': 1000
-            }
-
-            # Convert to kilograms
-            kg = value * weight_to_kg[source]
-            # Convert to target unit
-            result = kg / weight_to_kg[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def temperature_converter():
-    """Temperature conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Temperature Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Celsius', 'Fahrenheit', 'Kelvin')
-    source_combo.set('Celsius')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Celsius', 'Fahrenheit', 'Kelvin')
-    target_combo.set('Fahrenheit')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to Celsius first
-            if source == 'Fahrenheit':
-                celsius = (value - 32) * 5/9
-            elif source == 'Kelvin':
-                celsius = value - 273.15
-            else:  # Celsius
-                celsius = value
-
-            # Convert from Celsius to target unit
-            if target == 'Fahrenheit':
-                result = (celsius * 9/5) + 32
-            elif target == 'Kelvin':
-                result = celsius + 273.15
-            else:  # Celsius
-                result = celsius
-
-            result_label.configure(
-                text=f"Result: {result:.2f} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def angle_converter():
-    """Angle conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Angle Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Degree', 'Radian', 'Grad', 'Arcminute', 'Arcsecond')
-    source_combo.set('Degree')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Degree', 'Radian', 'Grad', 'Arcminute', 'Arcsecond')
-    target_combo.set('Radian')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to degrees first
-            angle_to_degrees = {
-                'Degree': 1,
-                'Radian': 57.2958,
-                'Grad': 0.9,
-                'Arcminute': 1/60,
-                'Arcsecond': 1/3600
-            }
-
-            # Convert to degrees
-            degrees = value * angle_to_degrees[source]
-            # Convert to target unit
-            result = degrees / angle_to_degrees[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def frequency_converter():
-    """Frequency conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Frequency Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Hertz', 'Kilohertz',
-                              'Megahertz', 'Gigahertz', 'RPM')
-    source_combo.set('Hertz')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Hertz', 'Kilohertz',
-                              'Megahertz', 'Gigahertz', 'RPM')
-    target_combo.set('Kilohertz')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to hertz first
-            freq_to_hertz = {
-                'Hertz': 1,
-                'Kilohertz': 1000,
-                'Megahertz': 1000000,
-                'Gigahertz': 1000000000,
-                'RPM': 1/60
-            }
-
-            # Convert to hertz
-            hertz = value * freq_to_hertz[source]
-            # Convert to target unit
-            result = hertz / freq_to_hertz[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def force_converter():
-    """Force conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Force Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Newton', 'Kilogram-force', 'Pound-force', 'Dyne')
-    source_combo.set('Newton')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Newton', 'Kilogram-force', 'Pound-force', 'Dyne')
-    target_combo.set('Kilogram-force')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to newtons first
-            force_to_newton = {
-                'Newton': 1,
-                'Kilogram-force': 9.80665,
-                'Pound-force': 4.44822,
-                'Dyne': 0.00001
-            }
-
-            # Convert to newtons
-            newton = value * force_to_newton[source]
-            # Convert to target unit
-            result = newton / force_to_newton[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def power_converter():
-    """Power conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Power Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = (
-        'Watt', 'Kilowatt', 'Horsepower', 'Kilocalorie per hour')
-    source_combo.set('Watt')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = (
-        'Watt', 'Kilowatt', 'Horsepower', 'Kilocalorie per hour')
-    target_combo.set('Kilowatt')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to watts first
-            power_to_watt = {
-                'Watt': 1,
-                'Kilowatt': 1000,
-                'Horsepower': 745.7,
-                'Kilocalorie per hour': 1.163
-            }
-
-            # Convert to watts
-            watt = value * power_to_watt[source]
-            # Convert to target unit
-            result = watt / power_to_watt[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def density_converter():
-    """Density conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Density Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('kg/m³', 'g/cm³', 'lb/ft³')
-    source_combo.set('kg/m³')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('kg/m³', 'g/cm³', 'lb/ft³')
-    target_combo.set('g/cm³')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to kg/m³ first
-            density_to_kgm3 = {
-                'kg/m³': 1,
-                'g/cm³': 1000,
-                'lb/ft³': 16.0185
-            }
-
-            # Convert to kg/m³
-            kgm3 = value * density_to_kgm3[source]
-            # Convert to target unit
-            result = kgm3 / density_to_kgm3[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def viscosity_converter():
-    """Viscosity conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Viscosity Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Pa·s', 'Poise', 'Centipoise')
-    source_combo.set('Pa·s')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Pa·s', 'Poise', 'Centipoise')
-    target_combo.set('Poise')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to Pa·s first
-            viscosity_to_pas = {
-                'Pa·s': 1,
-                'Poise': 0.1,
-                'Centipoise': 0.001
-            }
-
-            # Convert to Pa·s
-            pas = value * viscosity_to_pas[source]
-            # Convert to target unit
-            result = pas / viscosity_to_pas[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def magnetic_flux_converter():
-    """Magnetic Flux conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Magnetic Flux Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Weber', 'Maxwell', 'Magnetic Lines')
-    source_combo.set('Weber')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Weber', 'Maxwell', 'Magnetic Lines')
-    target_combo.set('Maxwell')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to webers first
-            flux_to_weber = {
-                'Weber': 1,
-                'Maxwell': 0.00000001,
-                'Magnetic Lines': 0.00000001
-            }
-
-            # Convert to webers
-            weber = value * flux_to_weber[source]
-            # Convert to target unit
-            result = weber / flux_to_weber[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def luminance_converter():
-    """Luminance conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Luminance Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('cd/m²', 'Foot-lambert', 'Stilb')
-    source_combo.set('cd/m²')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('cd/m²', 'Foot-lambert', 'Stilb')
-    target_combo.set('Foot-lambert')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to cd/m² first
-            luminance_to_cdm2 = {
-                'cd/m²': 1,
-                'Foot-lambert': 3.426259,
-                'Stilb': 10000
-            }
-
-            # Convert to cd/m²
-            cdm2 = value * luminance_to_cdm2[source]
-            # Convert to target unit
-            result = cdm2 / luminance_to_cdm2[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def electric_current_converter():
-    """Electric Current conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Electric Current Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Ampere', 'Milliampere', 'Microampere')
-    source_combo.set('Ampere')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Ampere', 'Milliampere', 'Microampere')
-    target_combo.set('Milliampere')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to amperes first
-            current_to_ampere = {
-                'Ampere': 1,
-                'Milliampere': 0.001,
-                'Microampere': 0.000001
-            }
-
-            # Convert to amperes
-            ampere = value * current_to_ampere[source]
-            # Convert to target unit
-            result = ampere / current_to_ampere[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
-
-
-def electric_resistance_converter():
-    """Electric Resistance conversion interface"""
-    clear_window()
-    main_frame = create_responsive_frame(root)
-    main_frame.pack(expand=True, fill='both',
-                    padx=PADDING['large'],
-                    pady=PADDING['large'])
-
-    title_label = create_responsive_label(
-        main_frame, "Electric Resistance Converter", size=24, is_title=True)
-    title_label.pack(pady=PADDING['large'])
-
-    # Add separator
-    separator = ttk.Separator(main_frame, orient='horizontal')
-    separator.pack(fill='x', pady=PADDING['medium'])
-
-    # Add back button
-    create_back_button(main_frame)
-
-    # Input card
-    input_frame = tk.Frame(main_frame, bg=current_theme['frame_bg'])
-    input_frame.pack(fill='x', padx=PADDING['medium'], pady=PADDING['medium'])
-
-    # Source unit
-    source_label = create_responsive_label(input_frame, "From:")
-    source_label.pack(anchor='w', padx=PADDING['small'])
-
-    source_value = tk.StringVar()
-    source_entry = create_responsive_entry(input_frame)
-    source_entry.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    source_unit = tk.StringVar()
-    source_combo = ttk.Combobox(input_frame, textvariable=source_unit)
-    source_combo['values'] = ('Ohm', 'Kiloohm', 'Megaohm')
-    source_combo.set('Ohm')
-    source_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Target unit
-    target_label = create_responsive_label(input_frame, "To:")
-    target_label.pack(anchor='w', padx=PADDING['small'])
-
-    target_unit = tk.StringVar()
-    target_combo = ttk.Combobox(input_frame, textvariable=target_unit)
-    target_combo['values'] = ('Ohm', 'Kiloohm', 'Megaohm')
-    target_combo.set('Kiloohm')
-    target_combo.pack(fill='x', padx=PADDING['small'], pady=PADDING['small'])
-
-    # Result
-    result_var = tk.StringVar()
-    result_label = create_responsive_label(
-        input_frame, "", size=14)
-    result_label.pack(pady=PADDING['medium'])
-
-    def convert():
-        try:
-            value = float(source_entry.get())
-            source = source_unit.get()
-            target = target_unit.get()
-
-            # Convert everything to ohms first
-            resistance_to_ohm = {
-                'Ohm': 1,
-                'Kiloohm': 1000,
-                'Megaohm': 1000000
-            }
-
-            # Convert to ohms
-            ohm = value * resistance_to_ohm[source]
-            # Convert to target unit
-            result = ohm / resistance_to_ohm[target]
-
-            result_label.configure(
-                text=f"Result: {result:.4g} {target}")
-        except ValueError:
-            result_label.configure(text="Please enter a valid number")
-        except Exception as e:
-            result_label.configure(text=f"Error: {str(e)}")
-
-    # Convert button
-    convert_btn = create_responsive_button(input_frame, "Convert", convert)
-    convert_btn.pack(fill='x', padx=PADDING['small'], pady=PADDING['medium'])
+    profiler.start()
+    return profiler
 
 
 # Start the application
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Unit Converter")
+    parser.add_argument('--profile', nargs='?', const='', metavar='FILE',
+                        help="time startup, screens and conversions and "
+                             "write cProfile statistics to FILE "
+                             "(default converter.prof)")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile is not None:
+        profiler = enable_profiling(args.profile)
     show_main_menu()
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if profiler is not None:
+            print(profiler.finish())
@@ -0,0 +1,264 @@
+"""
+Dimensional Analysis Core
+Every unit is a scale in SI base units and a dimension: the exponents of
+the SI base quantities (plus information and angle, which the factor tables
+keep apart from plain numbers).
+
+Dimensions are interned to small integers and units are hash-consed, so
+equal definitions are the same object and checking that two units can be
+converted is a single integer comparison. Scales are kept as exact
+fractions of their definitions, so derived units such as mile/hour or
+lb/ft³ carry no rounding until they are turned into a float factor.
+
+License: MIT
+"""
+
+import functools
+import math
+from fractions import Fraction
+
+# Dimension axes, in the order of the exponent tuples
+DIMENSIONS = ('length', 'mass', 'time', 'current', 'temperature', 'amount',
+              'luminous intensity', 'information', 'angle')
+
+# Symbols of the base units, for printing dimensions
+BASE_SYMBOLS = ('m', 'kg', 's', 'A', 'K', 'mol', 'cd', 'bit', 'rad')
+
+# Interned dimensions: exponent tuple -> ID, and ID -> exponent tuple
+_dimension_ids = {}
+DIMENSION_VECTORS = []
+
+# Hash-consed units: (exact scale, dimension ID) -> Unit
+_units = {}
+
+
+def intern_dimension(vector):
+    """Returns the ID of a dimension exponent tuple, assigning a new one the
+    first time it is seen"""
+    vector = tuple(vector)
+    if len(vector) != len(DIMENSIONS):
+        raise ValueError(f"Expected {len(DIMENSIONS)} exponents, "
+                         f"got {len(vector)}")
+    try:
+        return _dimension_ids[vector]
+    except KeyError:
+        _dimension_ids[vector] = len(DIMENSION_VECTORS)
+        DIMENSION_VECTORS.append(vector)
+        return _dimension_ids[vector]
+
+
+@functools.lru_cache(maxsize=None)
+def combine_dimensions(left, right, power=1):
+    """Returns the ID of the dimension left * right ** power"""
+    return intern_dimension(
+        a + b * power
+        for a, b in zip(DIMENSION_VECTORS[left], DIMENSION_VECTORS[right]))
+
+
+def format_dimension(dimension):
+    """Returns a dimension ID as text, e.g. 'm^2·kg·s^-2'"""
+    parts = [symbol if exponent == 1 else f"{symbol}^{exponent}"
+             for symbol, exponent in zip(BASE_SYMBOLS,
+                                         DIMENSION_VECTORS[dimension])
+             if exponent]
+    return '·'.join(parts) or '1'
+
+
+def _exact(number):
+    """Returns a number as a Fraction; floats are read from their decimal
+    digits, so 0.3048 is exactly 3048/10000"""
+    if isinstance(number, float):
+        return Fraction(repr(number))
+    return Fraction(number)
+
+
+class Unit:
+    """A unit of measurement: an exact scale in SI base units and an
+    interned dimension ID.
+
+    Units are hash-consed: building the same scale and dimension twice
+    returns the same object. They multiply, divide and raise to integer
+    powers with each other and with plain numbers.
+    """
+
+    __slots__ = ('exact', 'scale', 'dimension')
+
+    def __new__(cls, exact, dimension):
+        exact = _exact(exact)
+        key = (exact, dimension)
+        unit = _units.get(key)
+        if unit is None:
+            unit = super().__new__(cls)
+            unit.exact = exact
+            unit.scale = float(exact)
+            unit.dimension = dimension
+            _units[key] = unit
+        return unit
+
+    def __reduce__(self):
+        # Dimension IDs are per process, so send the exponents
+        return _unpickle_unit, (self.exact, self.vector)
+
+    @property
+    def vector(self):
+        """The dimension exponent tuple, in DIMENSIONS order"""
+        return DIMENSION_VECTORS[self.dimension]
+
+    def __mul__(self, other):
+        if isinstance(other, Unit):
+            return Unit(self.exact * other.exact,
+                        combine_dimensions(self.dimension, other.dimension))
+        return Unit(self.exact * _exact(other), self.dimension)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Unit):
+            return Unit(self.exact / other.exact,
+                        combine_dimensions(self.dimension, other.dimension,
+                                           -1))
+        return Unit(self.exact / _exact(other), self.dimension)
+
+    def __rtruediv__(self, other):
+        return Unit(_exact(other) / self.exact,
+                    combine_dimensions(DIMENSIONLESS, self.dimension, -1))
+
+    def __pow__(self, power):
+        if not isinstance(power, int):
+            raise ValueError(f"Units can only be raised to integer powers, "
+                             f"not {power}")
+        return Unit(self.exact ** power,
+                    combine_dimensions(DIMENSIONLESS, self.dimension, power))
+
+    def __repr__(self):
+        return f"Unit({self.scale!r}, {format_dimension(self.dimension)})"
+
+
+def _unpickle_unit(exact, vector):
+    """Interns a pickled unit in this process"""
+    return Unit(exact, intern_dimension(vector))
+
+
+def base_unit(axis):
+    """Returns the SI base unit of a dimension axis"""
+    return Unit(1, intern_dimension(int(name == axis) for name in DIMENSIONS))
+
+
+def get_factor(source, target):
+    """Returns the factor from a source Unit to a target Unit"""
+    if source.dimension != target.dimension:
+        raise ValueError(f"Cannot convert {format_dimension(source.dimension)}"
+                         f" to {format_dimension(target.dimension)}")
+    return float(source.exact / target.exact)
+
+
+def factor_table(units):
+    """Builds a factor table from named Units, in terms of the first one.
+
+    Every unit must have the dimension of the first, otherwise ValueError
+    names the odd one out.
+    """
+    base = next(iter(units.values()))
+    table = {}
+    for name, unit in units.items():
+        if unit.dimension != base.dimension:
+            raise ValueError(f"{name} is {format_dimension(unit.dimension)}, "
+                             f"not {format_dimension(base.dimension)}")
+        table[name] = float(unit.exact / base.exact)
+    return table
+
+
+# Dimensionless numbers
+DIMENSIONLESS = intern_dimension((0,) * len(DIMENSIONS))
+ONE = Unit(1, DIMENSIONLESS)
+
+# Base units
+METER = base_unit('length')
+KILOGRAM = base_unit('mass')
+SECOND = base_unit('time')
+AMPERE = base_unit('current')
+KELVIN = base_unit('temperature')
+MOLE = base_unit('amount')
+CANDELA = base_unit('luminous intensity')
+BIT = base_unit('information')
+RADIAN = base_unit('angle')
+
+# Length
+CENTIMETER = METER / 100
+MILLIMETER = METER / 1000
+KILOMETER = 1000 * METER
+INCH = 0.0254 * METER
+FOOT = 12 * INCH
+YARD = 3 * FOOT
+MILE = 5280 * FOOT
+NAUTICAL_MILE = 1852 * METER
+
+# Mass
+GRAM = KILOGRAM / 1000
+MILLIGRAM = GRAM / 1000
+POUND = 0.45359237 * KILOGRAM
+OUNCE = POUND / 16
+TONNE = 1000 * KILOGRAM
+
+# Time
+MINUTE = 60 * SECOND
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+MONTH = 30 * DAY   # Assuming 30 days
+YEAR = 365 * DAY   # Assuming 365 days
+
+# Volume
+LITER = (METER / 10) ** 3
+MILLILITER = LITER / 1000
+GALLON = 231 * INCH ** 3   # US liquid gallon
+QUART = GALLON / 4
+PINT = GALLON / 8
+
+# Area
+HECTARE = (100 * METER) ** 2
+ACRE = 43560 * FOOT ** 2
+
+# Mechanics
+STANDARD_GRAVITY = 9.80665 * METER / SECOND ** 2
+NEWTON = KILOGRAM * METER / SECOND ** 2
+KILOGRAM_FORCE = KILOGRAM * STANDARD_GRAVITY
+POUND_FORCE = POUND * STANDARD_GRAVITY
+DYNE = GRAM * CENTIMETER / SECOND ** 2
+JOULE = NEWTON * METER
+CALORIE = 4.184 * JOULE
+KILOCALORIE = 1000 * CALORIE
+WATT = JOULE / SECOND
+KILOWATT = 1000 * WATT
+HORSEPOWER = 745.7 * WATT
+WATT_HOUR = WATT * HOUR
+KILOWATT_HOUR = KILOWATT * HOUR
+PASCAL = NEWTON / METER ** 2
+BAR = 100000 * PASCAL
+ATMOSPHERE = 101325 * PASCAL
+PSI = POUND_FORCE / INCH ** 2
+POISE = GRAM / (CENTIMETER * SECOND)
+
+# Frequency
+HERTZ = 1 / SECOND
+RPM = 1 / MINUTE
+
+# Electromagnetism
+VOLT = WATT / AMPERE
+OHM = VOLT / AMPERE
+WEBER = VOLT * SECOND
+MAXWELL = WEBER / 100000000
+
+# Light
+NIT = CANDELA / METER ** 2
+STILB = CANDELA / CENTIMETER ** 2
+FOOT_LAMBERT = CANDELA / (math.pi * FOOT ** 2)
+
+# Information
+BYTE = 8 * BIT
+
+# Angle
+DEGREE = math.pi / 180 * RADIAN
+GRAD = math.pi / 200 * RADIAN
+ARCMINUTE = DEGREE / 60
+ARCSECOND = ARCMINUTE / 60
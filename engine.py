@@ -0,0 +1,595 @@
+"""
+Unit Conversion Engine
+The conversion rules used by the Unit Converter application, kept free of
+any GUI code so they can be imported by scripts, worker processes and
+servers without creating a Tk window.
+
+License: MIT
+"""
+
+import decimal
+import functools
+from fractions import Fraction
+
+from dimensions import (
+    ACRE, AMPERE, ARCMINUTE, ARCSECOND, ATMOSPHERE, BAR, BIT, BYTE, CALORIE,
+    CENTIMETER, DAY, DEGREE, DYNE, FOOT, FOOT_LAMBERT, GALLON, GRAD, GRAM,
+    HECTARE, HERTZ, HORSEPOWER, HOUR, INCH, JOULE, KELVIN, KILOCALORIE,
+    KILOGRAM, KILOGRAM_FORCE, KILOMETER, KILOWATT, KILOWATT_HOUR, LITER,
+    MAXWELL, METER, MILE, MILLIGRAM, MILLILITER, MILLIMETER, MINUTE, MONTH,
+    NAUTICAL_MILE, NEWTON, NIT, OHM, OUNCE, PASCAL, PINT, POISE, POUND,
+    POUND_FORCE, PSI, QUART, RADIAN, RPM, SECOND, STILB, TONNE, WATT, WEBER,
+    WEEK, YARD, YEAR, factor_table)
+
+# Unit definitions of every linear category, base unit first. Derived units
+# are built from base units, so their factors follow from the definitions
+# and factor_table checks that every unit has the dimension of the category
+
+LENGTH_UNITS = {
+    'Meter': METER,
+    'Centimeter': CENTIMETER,
+    'Millimeter': MILLIMETER,
+    'Kilometer': KILOMETER,
+    'Inch': INCH,
+    'Foot': FOOT,
+    'Yard': YARD,
+    'Mile': MILE
+}
+
+WEIGHT_UNITS = {
+    'Kilogram': KILOGRAM,
+    'Gram': GRAM,
+    'Milligram': MILLIGRAM,
+    'Pound': POUND,
+    'Ounce': OUNCE,
+    'Ton': TONNE
+}
+
+TIME_UNITS = {
+    'Second': SECOND,
+    'Minute': MINUTE,
+    'Hour': HOUR,
+    'Day': DAY,
+    'Week': WEEK,
+    'Month': MONTH,
+    'Year': YEAR
+}
+
+VOLUME_UNITS = {
+    'Milliliter': MILLILITER,
+    'Liter': LITER,
+    'Cubic Centimeter': CENTIMETER ** 3,
+    'Cubic Meter': METER ** 3,
+    'Gallon': GALLON,
+    'Pint': PINT,
+    'Quart': QUART
+}
+
+SPEED_UNITS = {
+    'Meters per Second': METER / SECOND,
+    'Kilometers per Hour': KILOMETER / HOUR,
+    'Miles per Hour': MILE / HOUR,
+    'Knots': NAUTICAL_MILE / HOUR
+}
+
+AREA_UNITS = {
+    'Square Meter': METER ** 2,
+    'Square Centimeter': CENTIMETER ** 2,
+    'Square Kilometer': KILOMETER ** 2,
+    'Hectare': HECTARE,
+    'Square Foot': FOOT ** 2,
+    'Square Yard': YARD ** 2,
+    'Acre': ACRE
+}
+
+ENERGY_UNITS = {
+    'Joule': JOULE,
+    'Kilojoule': 1000 * JOULE,
+    'Calorie': CALORIE,
+    'Kilocalorie': KILOCALORIE,
+    'Kilowatt Hour': KILOWATT_HOUR,
+    'Horsepower Hour': HORSEPOWER * HOUR
+}
+
+PRESSURE_UNITS = {
+    'Pascal': PASCAL,
+    'Kilopascal': 1000 * PASCAL,
+    'Bar': BAR,
+    'Atmosphere': ATMOSPHERE,
+    'PSI': PSI
+}
+
+STORAGE_UNITS = {
+    'Bit': BIT,
+    'Byte': BYTE,
+    'Kilobyte': 1024 * BYTE,
+    'Megabyte': 1024 ** 2 * BYTE,
+    'Gigabyte': 1024 ** 3 * BYTE,
+    'Terabyte': 1024 ** 4 * BYTE
+}
+
+ANGLE_UNITS = {
+    'Degree': DEGREE,
+    'Radian': RADIAN,
+    'Grad': GRAD,
+    'Arcminute': ARCMINUTE,
+    'Arcsecond': ARCSECOND
+}
+
+FREQUENCY_UNITS = {
+    'Hertz': HERTZ,
+    'Kilohertz': 1000 * HERTZ,
+    'Megahertz': 1000000 * HERTZ,
+    'Gigahertz': 1000000000 * HERTZ,
+    'RPM': RPM
+}
+
+FORCE_UNITS = {
+    'Newton': NEWTON,
+    'Kilogram-force': KILOGRAM_FORCE,
+    'Pound-force': POUND_FORCE,
+    'Dyne': DYNE
+}
+
+POWER_UNITS = {
+    'Watt': WATT,
+    'Kilowatt': KILOWATT,
+    'Horsepower': HORSEPOWER,
+    'Kilocalorie per hour': KILOCALORIE / HOUR
+}
+
+DENSITY_UNITS = {
+    'kg/m³': KILOGRAM / METER ** 3,
+    'g/cm³': GRAM / CENTIMETER ** 3,
+    'lb/ft³': POUND / FOOT ** 3
+}
+
+VISCOSITY_UNITS = {
+    'Pa·s': PASCAL * SECOND,
+    'Poise': POISE,
+    'Centipoise': POISE / 100
+}
+
+FLUX_UNITS = {
+    'Weber': WEBER,
+    'Maxwell': MAXWELL,
+    'Magnetic Lines': MAXWELL
+}
+
+LUMINANCE_UNITS = {
+    'cd/m²': NIT,
+    'Foot-lambert': FOOT_LAMBERT,
+    'Stilb': STILB
+}
+
+CURRENT_UNITS = {
+    'Ampere': AMPERE,
+    'Milliampere': AMPERE / 1000,
+    'Microampere': AMPERE / 1000000
+}
+
+RESISTANCE_UNITS = {
+    'Ohm': OHM,
+    'Kiloohm': 1000 * OHM,
+    'Megaohm': 1000000 * OHM
+}
+
+# Factor tables: every unit of a category expressed in the category's base unit
+
+length_to_meters = factor_table(LENGTH_UNITS)
+weight_to_kg = factor_table(WEIGHT_UNITS)
+time_to_seconds = factor_table(TIME_UNITS)
+volume_to_ml = factor_table(VOLUME_UNITS)
+speed_to_mps = factor_table(SPEED_UNITS)
+area_to_sqm = factor_table(AREA_UNITS)
+energy_to_joules = factor_table(ENERGY_UNITS)
+pressure_to_pa = factor_table(PRESSURE_UNITS)
+storage_to_bits = factor_table(STORAGE_UNITS)
+angle_to_degrees = factor_table(ANGLE_UNITS)
+freq_to_hertz = factor_table(FREQUENCY_UNITS)
+force_to_newton = factor_table(FORCE_UNITS)
+power_to_watt = factor_table(POWER_UNITS)
+density_to_kgm3 = factor_table(DENSITY_UNITS)
+viscosity_to_pas = factor_table(VISCOSITY_UNITS)
+flux_to_weber = factor_table(FLUX_UNITS)
+luminance_to_cdm2 = factor_table(LUMINANCE_UNITS)
+current_to_ampere = factor_table(CURRENT_UNITS)
+resistance_to_ohm = factor_table(RESISTANCE_UNITS)
+
+# Temperature is not a plain scale, it is converted through Celsius
+TEMPERATURE_UNITS = ('Celsius', 'Fahrenheit', 'Kelvin')
+
+# Exact temperature rules: Celsius = value * scale + offset, as Fractions
+TEMPERATURE_EXACT = {
+    'Celsius': (Fraction(1), Fraction(0)),
+    'Fahrenheit': (Fraction(5, 9), Fraction(-160, 9)),
+    'Kelvin': (Fraction(1), Fraction(-27315, 100))
+}
+
+# Celsius = value * scale + offset
+temperature_to_celsius = {unit: (float(scale), float(offset))
+                          for unit, (scale, offset) in TEMPERATURE_EXACT.items()}
+
+# Linear categories and their factor tables
+LINEAR_CATEGORIES = {
+    'Length': length_to_meters,
+    'Weight': weight_to_kg,
+    'Time': time_to_seconds,
+    'Volume': volume_to_ml,
+    'Speed': speed_to_mps,
+    'Area': area_to_sqm,
+    'Energy': energy_to_joules,
+    'Pressure': pressure_to_pa,
+    'Digital Storage': storage_to_bits,
+    'Angle': angle_to_degrees,
+    'Frequency': freq_to_hertz,
+    'Force': force_to_newton,
+    'Power': power_to_watt,
+    'Density': density_to_kgm3,
+    'Viscosity': viscosity_to_pas,
+    'Magnetic Flux': flux_to_weber,
+    'Luminance': luminance_to_cdm2,
+    'Electric Current': current_to_ampere,
+    'Electric Resistance': resistance_to_ohm
+}
+
+# Unit definitions of the linear categories
+CATEGORY_DEFINITIONS = {
+    'Length': LENGTH_UNITS,
+    'Weight': WEIGHT_UNITS,
+    'Time': TIME_UNITS,
+    'Volume': VOLUME_UNITS,
+    'Speed': SPEED_UNITS,
+    'Area': AREA_UNITS,
+    'Energy': ENERGY_UNITS,
+    'Pressure': PRESSURE_UNITS,
+    'Digital Storage': STORAGE_UNITS,
+    'Angle': ANGLE_UNITS,
+    'Frequency': FREQUENCY_UNITS,
+    'Force': FORCE_UNITS,
+    'Power': POWER_UNITS,
+    'Density': DENSITY_UNITS,
+    'Viscosity': VISCOSITY_UNITS,
+    'Magnetic Flux': FLUX_UNITS,
+    'Luminance': LUMINANCE_UNITS,
+    'Electric Current': CURRENT_UNITS,
+    'Electric Resistance': RESISTANCE_UNITS
+}
+
+# Temperature differences: one degree of each scale
+TEMPERATURE_INTERVALS = {
+    'Celsius': KELVIN,
+    'Fahrenheit': KELVIN * 5 / 9,
+    'Kelvin': KELVIN
+}
+
+# Affine categories and their exact rules to a reference unit. A unit of
+# these categories is a scale and an offset, so an absolute value and a
+# difference between two values convert differently
+AFFINE_CATEGORIES = {
+    'Temperature': TEMPERATURE_EXACT
+}
+
+# Unit name -> Unit, for every unit of every category
+UNIT_DEFINITIONS = {name: unit
+                    for units in CATEGORY_DEFINITIONS.values()
+                    for name, unit in units.items()}
+UNIT_DEFINITIONS.update(TEMPERATURE_INTERVALS)
+
+# Unit names of every category, in display order
+CATEGORY_UNITS = {name: tuple(table)
+                  for name, table in LINEAR_CATEGORIES.items()}
+CATEGORY_UNITS.update((name, tuple(rules))
+                      for name, rules in AFFINE_CATEGORIES.items())
+
+# Reverse index: unit name -> category name
+UNIT_CATEGORY = {unit: name
+                 for name, units in CATEGORY_UNITS.items()
+                 for unit in units}
+
+# Compact unit IDs: unit name -> (category, index into the factor matrix)
+UNIT_IDS = {unit: (name, index)
+            for name, units in CATEGORY_UNITS.items()
+            for index, unit in enumerate(units)}
+
+
+def build_factor_matrix(factors):
+    """Builds the N×N matrix of direct source -> target factors"""
+    scales = tuple(factors.values())
+    return tuple(tuple(source / target for target in scales)
+                 for source in scales)
+
+
+def build_affine_matrix(rules):
+    """Builds the N×N matrix of direct source -> target (scale, offset)
+    pairs from exact rules to a reference unit, rounding each pair once"""
+    pairs = tuple(rules.values())
+    return tuple(tuple((float(scale / target_scale),
+                        float((offset - target_offset) / target_scale))
+                       for target_scale, target_offset in pairs)
+                 for scale, offset in pairs)
+
+
+# Direct factors for every pair of units, built once at import time
+FACTOR_MATRICES = {name: build_factor_matrix(table)
+                   for name, table in LINEAR_CATEGORIES.items()}
+
+# Direct (scale, offset) pairs for every pair of affine units
+AFFINE_MATRICES = {name: build_affine_matrix(rules)
+                   for name, rules in AFFINE_CATEGORIES.items()}
+
+
+def get_category(unit):
+    """Returns the category a unit belongs to"""
+    try:
+        return UNIT_CATEGORY[unit]
+    except KeyError:
+        raise KeyError(f"Unknown unit: {unit}") from None
+
+
+def get_unit_id(unit):
+    """Returns the (category, index) ID of a unit"""
+    try:
+        return UNIT_IDS[unit]
+    except KeyError:
+        raise KeyError(f"Unknown unit: {unit}") from None
+
+
+def get_factor(source, target):
+    """Returns the direct factor from a linear source unit to a target unit"""
+    category, source_id = get_unit_id(source)
+    target_category, target_id = get_unit_id(target)
+    if target_category != category:
+        raise ValueError(f"Cannot convert {source} to {target}")
+    if category not in FACTOR_MATRICES:
+        raise ValueError(f"{category} units have no single factor")
+    return FACTOR_MATRICES[category][source_id][target_id]
+
+
+def get_scale_offset(source, target, difference=False):
+    """Returns (scale, offset) such that target = source * scale + offset.
+
+    With difference=True the values are differences between two readings,
+    such as a rise of 10 degrees, and the offset is always 0.
+    """
+    category, source_id = get_unit_id(source)
+    target_category, target_id = get_unit_id(target)
+    if target_category != category:
+        raise ValueError(f"Cannot convert {source} to {target}")
+
+    if category in AFFINE_MATRICES:
+        scale, offset = AFFINE_MATRICES[category][source_id][target_id]
+        return scale, 0.0 if difference else offset
+    return FACTOR_MATRICES[category][source_id][target_id], 0.0
+
+
+def convert_temperature(value, source, target):
+    """Converts a temperature between Celsius, Fahrenheit and Kelvin"""
+    if get_category(source) != 'Temperature':
+        raise ValueError(f"{source} is not a temperature unit")
+    return convert(value, source, target)
+
+
+def convert(value, source, target):
+    """Converts a value from the source unit to the target unit"""
+    try:
+        category, source_id = UNIT_IDS[source]
+        target_category, target_id = UNIT_IDS[target]
+    except KeyError as error:
+        raise KeyError(f"Unknown unit: {error.args[0]}") from None
+    if target_category != category:
+        raise ValueError(f"Cannot convert {source} to {target}")
+
+    if category in AFFINE_MATRICES:
+        # One lookup, one multiply-add
+        scale, offset = AFFINE_MATRICES[category][source_id][target_id]
+        return value * scale + offset
+
+    # One lookup in the precomputed matrix, one multiply
+    return value * FACTOR_MATRICES[category][source_id][target_id]
+
+
+def convert_difference(value, source, target):
+    """Converts a difference between two values, such as a temperature
+    rise, from the source unit to the target unit. Only the scale applies:
+    a rise of 10 Celsius is a rise of 18 Fahrenheit, not 50."""
+    return value * get_scale_offset(source, target, difference=True)[0]
+
+
+# Conversion plans kept by get_plan
+PLAN_CACHE_SIZE = 1024
+
+
+def _plan_source(scale, offset):
+    """Returns the body of a plan with scale and offset as literals"""
+    if offset:
+        return f"value * {scale!r} + {offset!r}"
+    if scale == 1:
+        return "value"
+    return f"value * {scale!r}"
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def get_plan(category, source, target):
+    """Returns a function that converts one value from source to target,
+    generated with the scale and offset as constants.
+
+    Plans are kept in an LRU cache of PLAN_CACHE_SIZE unit pairs;
+    get_plan.cache_info() gives its hits and misses.
+    """
+    for unit in (source, target):
+        if get_category(unit) != category:
+            raise ValueError(f"{unit} is not a {category} unit")
+    namespace = {}
+    exec(f"def plan(value):\n"
+         f"    return {_plan_source(*get_scale_offset(source, target))}\n",
+         namespace)
+    plan = namespace['plan']
+    plan.__qualname__ = plan.__name__ = f"convert_{source}_to_{target}"
+    plan.__doc__ = f"Converts a value from {source} to {target}"
+    return plan
+
+
+# Arrays with an offset and at least this many elements are converted in
+# blocks of FUSED_BLOCK elements (512 KiB of float64), which fit in cache
+FUSED_MIN_SIZE = 1 << 19
+FUSED_BLOCK = 1 << 16
+
+
+def convert_array(values, source, target, out=None, difference=False):
+    """Converts a NumPy array of values from the source unit to the target
+    unit in a single vectorized pass.
+
+    Float32 and float64 inputs keep their dtype, other inputs are converted
+    to float64. If out is given the result is written into it and returned.
+    With difference=True the values are differences, see convert_difference.
+    """
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
+
+    scale, offset = get_scale_offset(source, target, difference)
+    if not offset:
+        return np.multiply(values, scale, out=out)
+    if out is None:
+        out = np.empty_like(values)
+    if (values.size >= FUSED_MIN_SIZE and values.flags.c_contiguous
+            and out.flags.c_contiguous):
+        _multiply_add_blocks(values.reshape(-1), scale, offset,
+                             out.reshape(-1))
+    else:
+        np.multiply(values, scale, out=out)
+        np.add(out, offset, out=out)
+    return out
+
+
+def _multiply_add_blocks(values, scale, offset, out):
+    """Writes values * scale + offset into out one block at a time, so the
+    add reads the product from cache instead of from memory"""
+    import numpy as np
+
+    for start in range(0, values.size, FUSED_BLOCK):
+        block = out[start:start + FUSED_BLOCK]
+        np.multiply(values[start:start + FUSED_BLOCK], scale, out=block)
+        np.add(block, offset, out=block)
+
+
+@functools.lru_cache(maxsize=None)
+def conversion_rows(source):
+    """Returns NumPy (scales, offsets) from a unit to every unit of its
+    category, in CATEGORY_UNITS order; offsets is None for linear units"""
+    import numpy as np
+
+    pairs = [get_scale_offset(source, target)
+             for target in CATEGORY_UNITS[get_category(source)]]
+    scales = np.array([scale for scale, _ in pairs])
+    offsets = np.array([offset for _, offset in pairs])
+    if not offsets.any():
+        offsets = None
+    return scales, offsets
+
+
+def convert_to_all(value, source, out=None):
+    """Converts one value into every unit of the source unit's category in
+    a single vectorized pass.
+
+    Returns a float64 array in CATEGORY_UNITS order. Pass the array from a
+    previous call as out to reuse it instead of allocating a new one.
+    """
+    import numpy as np
+
+    scales, offsets = conversion_rows(source)
+    out = np.multiply(scales, value, out=out)
+    if offsets is not None:
+        np.add(out, offsets, out=out)
+    return out
+
+
+# Exact mode: factors are the exact Fractions of the unit definitions, so
+# a conversion is rounded at most once, when the result is rendered. Angle
+# factors involve pi and are exact only to the digits of math.pi.
+
+def exact_ratio(value):
+    """Returns a value as an exact (numerator, denominator) pair.
+
+    Accepts ints, Fractions, Decimals and strings such as '0.1', '2.5e3'
+    or '1/3'. Floats are read from their shortest decimal form, so 0.1 is
+    1/10 rather than its binary approximation.
+    """
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, Fraction):
+        return value.numerator, value.denominator
+    if isinstance(value, float):
+        value = repr(value)
+    if isinstance(value, str):
+        try:
+            value = decimal.Decimal(value.strip())
+        except decimal.InvalidOperation:
+            fraction = Fraction(value)
+            return fraction.numerator, fraction.denominator
+    if isinstance(value, decimal.Decimal):
+        if not value.is_finite():
+            raise ValueError(f"Cannot convert {value} exactly")
+        return value.as_integer_ratio()
+    raise TypeError(f"Cannot read {type(value).__name__} as an exact number")
+
+
+@functools.lru_cache(maxsize=None)
+def exact_scale_offset(source, target):
+    """Returns exact (scale, offset) Fractions such that
+    target = source * scale + offset; cached per unit pair"""
+    category = get_category(source)
+    if get_category(target) != category:
+        raise ValueError(f"Cannot convert {source} to {target}")
+
+    if category in AFFINE_CATEGORIES:
+        rules = AFFINE_CATEGORIES[category]
+        scale, offset = rules[source]
+        target_scale, target_offset = rules[target]
+        return (scale / target_scale,
+                (offset - target_offset) / target_scale)
+    return (UNIT_DEFINITIONS[source].exact / UNIT_DEFINITIONS[target].exact,
+            Fraction(0))
+
+
+@functools.lru_cache(maxsize=None)
+def _exact_plan(source, target):
+    """Returns the exact conversion as integers: (scale numerator, scale
+    denominator, offset numerator, offset denominator)"""
+    scale, offset = exact_scale_offset(source, target)
+    return (scale.numerator, scale.denominator,
+            offset.numerator, offset.denominator)
+
+
+def _exact_result(value, source, target):
+    """Returns the unreduced (numerator, denominator) of a conversion"""
+    numerator, denominator = exact_ratio(value)
+    scale_num, scale_den, offset_num, offset_den = _exact_plan(source, target)
+    numerator *= scale_num
+    denominator *= scale_den
+    if offset_num:
+        numerator = numerator * offset_den + offset_num * denominator
+        denominator *= offset_den
+    return numerator, denominator
+
+
+def convert_exact(value, source, target):
+    """Converts a value without rounding and returns a Fraction"""
+    return Fraction(*_exact_result(value, source, target))
+
+
+@functools.lru_cache(maxsize=None)
+def _decimal_context(precision):
+    """Returns a decimal context with the given number of digits"""
+    return decimal.Context(prec=precision)
+
+
+def convert_decimal(value, source, target, precision=28):
+    """Converts a value exactly and returns it as a Decimal rounded to
+    precision significant digits"""
+    numerator, denominator = _exact_result(value, source, target)
+    return _decimal_context(precision).divide(decimal.Decimal(numerator),
+                                              decimal.Decimal(denominator))
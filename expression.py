@@ -0,0 +1,378 @@
+"""
+Unit Expression Parser
+Parses conversion queries such as '3 ft 4 in to cm', '12 kWh in MJ',
+'kg*m/s^2 to N' or '5 Miles per Hour to km/h' into the units of the
+dimensional-analysis core. Units are symbols, full unit names in any case,
+or the aliases of the unit search.
+
+Every distinct query, unit expression and unit pair is compiled once into a
+plan that is kept in an LRU cache, so evaluating the same text again is a
+dictionary lookup instead of a parse.
+
+License: MIT
+"""
+
+import functools
+import re
+from collections import namedtuple
+
+from dimensions import CANDELA, KELVIN, MOLE, NAUTICAL_MILE, WATT_HOUR
+from engine import UNIT_DEFINITIONS, temperature_to_celsius
+
+# Plans kept per cache
+PLAN_CACHE_SIZE = 4096
+
+# Symbol -> unit name in the engine's factor tables
+UNIT_SYMBOLS = {
+    # Length
+    'm': 'Meter', 'cm': 'Centimeter', 'mm': 'Millimeter', 'km': 'Kilometer',
+    'in': 'Inch', 'ft': 'Foot', 'yd': 'Yard', 'mi': 'Mile',
+    # Weight
+    'kg': 'Kilogram', 'g': 'Gram', 'mg': 'Milligram', 'lb': 'Pound',
+    'lbs': 'Pound', 'oz': 'Ounce', 't': 'Ton',
+    # Time
+    's': 'Second', 'sec': 'Second', 'min': 'Minute', 'h': 'Hour',
+    'hr': 'Hour', 'd': 'Day', 'day': 'Day', 'wk': 'Week', 'yr': 'Year',
+    # Volume
+    'mL': 'Milliliter', 'ml': 'Milliliter', 'L': 'Liter', 'l': 'Liter',
+    'cc': 'Cubic Centimeter', 'gal': 'Gallon', 'pt': 'Pint', 'qt': 'Quart',
+    # Speed
+    'kph': 'Kilometers per Hour', 'mph': 'Miles per Hour', 'kn': 'Knots',
+    'kt': 'Knots',
+    # Area
+    'ha': 'Hectare', 'acre': 'Acre', 'ac': 'Acre',
+    # Energy
+    'J': 'Joule', 'kJ': 'Kilojoule', 'cal': 'Calorie', 'kcal': 'Kilocalorie',
+    'kWh': 'Kilowatt Hour', 'hph': 'Horsepower Hour',
+    # Pressure
+    'Pa': 'Pascal', 'kPa': 'Kilopascal', 'bar': 'Bar', 'atm': 'Atmosphere',
+    'psi': 'PSI',
+    # Digital storage (binary multiples, as in the storage screen)
+    'bit': 'Bit', 'b': 'Bit', 'B': 'Byte', 'KB': 'Kilobyte',
+    'MB': 'Megabyte', 'GB': 'Gigabyte', 'TB': 'Terabyte',
+    # Angle
+    'deg': 'Degree', '°': 'Degree', 'rad': 'Radian', 'grad': 'Grad',
+    'arcmin': 'Arcminute', 'arcsec': 'Arcsecond',
+    # Frequency
+    'Hz': 'Hertz', 'kHz': 'Kilohertz', 'MHz': 'Megahertz',
+    'GHz': 'Gigahertz', 'rpm': 'RPM',
+    # Force
+    'N': 'Newton', 'kgf': 'Kilogram-force', 'lbf': 'Pound-force',
+    'dyn': 'Dyne',
+    # Power
+    'W': 'Watt', 'kW': 'Kilowatt', 'hp': 'Horsepower',
+    # Viscosity
+    'P': 'Poise', 'cP': 'Centipoise',
+    # Magnetic flux
+    'Wb': 'Weber', 'Mx': 'Maxwell',
+    # Luminance
+    'fL': 'Foot-lambert', 'sb': 'Stilb',
+    # Electric current
+    'A': 'Ampere', 'mA': 'Milliampere', 'µA': 'Microampere',
+    'uA': 'Microampere',
+    # Electric resistance
+    'Ω': 'Ohm', 'ohm': 'Ohm', 'kΩ': 'Kiloohm', 'MΩ': 'Megaohm',
+    # Temperature
+    '°C': 'Celsius', 'degC': 'Celsius', '°F': 'Fahrenheit',
+    'degF': 'Fahrenheit', 'K': 'Kelvin',
+}
+
+# Units that have no entry in the factor tables
+EXTRA_UNITS = {
+    'Wh': WATT_HOUR,
+    'cd': CANDELA,
+    'mol': MOLE,
+    'nmi': NAUTICAL_MILE,
+}
+
+# Symbols that take SI prefixes
+PREFIXED_SYMBOLS = ('m', 'g', 's', 'L', 'l', 'J', 'Wh', 'Pa', 'bar', 'Hz',
+                    'N', 'W', 'A', 'Ω', 'Wb', 'mol', 'cd', 'K')
+
+# SI prefixes, 'da' first so it wins over 'd'
+SI_PREFIXES = {
+    'da': 1e1, 'Y': 1e24, 'Z': 1e21, 'E': 1e18, 'P': 1e15, 'T': 1e12,
+    'G': 1e9, 'M': 1e6, 'k': 1e3, 'h': 1e2, 'd': 1e-1, 'c': 1e-2,
+    'm': 1e-3, 'µ': 1e-6, 'u': 1e-6, 'n': 1e-9, 'p': 1e-12, 'f': 1e-15,
+    'a': 1e-18, 'z': 1e-21, 'y': 1e-24,
+}
+
+# Superscript exponents
+_SUPERSCRIPTS = str.maketrans({'²': '^2', '³': '^3', '⁻': '^-', '¹': '1',
+                               '·': '*', '×': '*'})
+
+# Tokens: numbers, unit symbols, operators and parentheses
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<symbol>°?[^\W\d_][^\W\d_]*(?:-[^\W\d_]+)*|°)
+      | (?P<operator>\*\*|->|[*/^()])
+    )""", re.VERBOSE)
+
+# Words that separate the source quantity from the target unit
+_TARGET_WORDS = ('to', '->', 'in')
+
+# A parsed unit expression: its dimensions.Unit, and for a bare
+# temperature the (scale, offset) to Celsius
+ParsedUnit = namedtuple('ParsedUnit', 'unit affine')
+
+# A conversion: target = source * scale + offset
+ConversionPlan = namedtuple('ConversionPlan', 'scale offset')
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_names():
+    """Returns the words that name units, as in the unit search: case-folded
+    unit names and the search aliases -> unit name, and the most words in
+    one name"""
+    # Imported here: search imports this module for UNIT_SYMBOLS
+    from search import ALIASES
+
+    names = {name.casefold(): name for name in UNIT_DEFINITIONS}
+    names.update((alias, name) for alias, name in ALIASES.items()
+                 if name in UNIT_DEFINITIONS)
+    return names, max(len(name.split()) for name in names)
+
+
+def _find_name(text):
+    """Returns the unit name that text spells, or None. Names and lower-case
+    aliases match in any case; aliases such as Mohm are symbols and match
+    only as written, so mOhm is not a megaohm."""
+    names = _unit_names()[0]
+    return names.get(text) or names.get(text.casefold())
+
+
+def _join_names(tokens):
+    """Merges runs of words that spell one unit name, such as 'Miles per
+    Hour', into a single symbol token"""
+    longest = _unit_names()[1]
+    joined = []
+    position = 0
+    while position < len(tokens):
+        for count in range(min(longest, len(tokens) - position), 1, -1):
+            words = tokens[position:position + count]
+            if all(kind == 'symbol' for kind, _ in words):
+                name = ' '.join(value for _, value in words)
+                if _find_name(name):
+                    joined.append(('symbol', name))
+                    position += count
+                    break
+        else:
+            joined.append(tokens[position])
+            position += 1
+    return joined
+
+
+def _tokenize(text):
+    """Splits text into (kind, value) tokens"""
+    text = text.translate(_SUPERSCRIPTS)
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            if text[position:].strip():
+                raise ValueError(f"Unexpected text: {text[position:]!r}")
+            break
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return _join_names(tokens)
+
+
+def _unit_name(symbol):
+    """Returns the engine's unit name for a symbol, or the symbol itself"""
+    name = UNIT_SYMBOLS.get(symbol, symbol)
+    if name in UNIT_DEFINITIONS:
+        return name
+    return _find_name(symbol) or symbol
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def lookup_symbol(symbol):
+    """Returns the dimensions.Unit of a single symbol, unit name or alias.
+
+    Symbols are case-sensitive, mK is not MK; unit names are not.
+    """
+    name = UNIT_SYMBOLS.get(symbol, symbol)
+    if name in UNIT_DEFINITIONS:
+        return UNIT_DEFINITIONS[name]
+    if symbol in EXTRA_UNITS:
+        return EXTRA_UNITS[symbol]
+
+    for prefix, factor in SI_PREFIXES.items():
+        base = symbol[len(prefix):]
+        if symbol.startswith(prefix) and base in PREFIXED_SYMBOLS:
+            return lookup_symbol(base) * factor
+
+    name = _unit_name(symbol)
+    if name in UNIT_DEFINITIONS:
+        return UNIT_DEFINITIONS[name]
+    raise KeyError(f"Unknown unit: {symbol}")
+
+
+class _UnitParser:
+    """Recursive descent parser for products and quotients of units"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse_product(self):
+        """product := power (('*' | '/' | juxtaposition) power)*"""
+        unit = self.parse_power()
+        while True:
+            kind, value = self.peek()
+            if value in ('*', '/'):
+                self.take()
+                if value == '/':
+                    unit = unit / self.parse_power()
+                else:
+                    unit = unit * self.parse_power()
+            elif kind == 'symbol' or value == '(':
+                unit = unit * self.parse_power()
+            else:
+                return unit
+
+    def parse_power(self):
+        """power := atom (('^' | '**') number)?"""
+        unit = self.parse_atom()
+        if self.peek()[1] in ('^', '**'):
+            self.take()
+            kind, value = self.take()
+            if kind != 'number' or not float(value).is_integer():
+                raise ValueError(f"Exponent must be an integer, not {value}")
+            unit = unit ** int(float(value))
+        return unit
+
+    def parse_atom(self):
+        """atom := symbol | '(' product ')'"""
+        kind, value = self.take()
+        if kind == 'symbol':
+            return lookup_symbol(value)
+        if value == '(':
+            unit = self.parse_product()
+            if self.take()[1] != ')':
+                raise ValueError("Missing closing parenthesis")
+            return unit
+        raise ValueError(f"Expected a unit, got {value!r}")
+
+
+def _parse_unit_tokens(tokens):
+    """Returns the ParsedUnit of a whole token list"""
+    if not tokens:
+        raise ValueError("Expected a unit")
+    if len(tokens) == 1 and tokens[0][0] == 'symbol':
+        # A bare unit keeps its temperature offset
+        symbol = tokens[0][1]
+        return ParsedUnit(lookup_symbol(symbol),
+                          temperature_to_celsius.get(_unit_name(symbol)))
+    parser = _UnitParser(tokens)
+    unit = parser.parse_product()
+    if parser.position != len(tokens):
+        raise ValueError(f"Unexpected {parser.peek()[1]!r} in unit")
+    return ParsedUnit(unit, None)
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def parse_unit(text):
+    """Returns the ParsedUnit of a unit expression such as 'kg*m/s^2'"""
+    return _parse_unit_tokens(_tokenize(text))
+
+
+def _celsius_rule(parsed):
+    """Returns the (scale, offset) rule to Celsius of a ParsedUnit that is
+    an absolute temperature; units such as mK count from absolute zero"""
+    if parsed.affine:
+        return parsed.affine
+    kelvin_scale, kelvin_offset = temperature_to_celsius['Kelvin']
+    return (float(parsed.unit.exact / KELVIN.exact) * kelvin_scale,
+            kelvin_offset)
+
+
+def _plan(source, target, description):
+    """Returns the ConversionPlan between two ParsedUnits"""
+    if source.unit.dimension != target.unit.dimension:
+        raise ValueError(f"Cannot convert {description}")
+    if source.affine or target.affine:
+        # Through Celsius, like engine.get_scale_offset; the other side has
+        # the same dimension, so it is a temperature too
+        scale, offset = _celsius_rule(source)
+        target_scale, target_offset = _celsius_rule(target)
+        return ConversionPlan(scale / target_scale,
+                              (offset - target_offset) / target_scale)
+    return ConversionPlan(float(source.unit.exact / target.unit.exact), 0.0)
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_conversion(source, target):
+    """Returns the cached ConversionPlan from one unit expression to
+    another, for converting many values with the same units"""
+    return _plan(parse_unit(source), parse_unit(target),
+                 f"{source} to {target}")
+
+
+def _split_target(tokens):
+    """Splits query tokens around the word before the target unit"""
+    for word in _TARGET_WORDS:
+        for index in range(len(tokens) - 2, 0, -1):
+            if tokens[index][1] == word:
+                return tokens[:index], tokens[index + 1:]
+    raise ValueError("Expected '<quantity> to <unit>'")
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_query(text):
+    """Compiles a query such as '3 ft 4 in to cm' into (amount, plan), where
+    amount is the quantity in the units of its first term"""
+    tokens = _tokenize(text)
+    source_tokens, target_tokens = _split_target(tokens)
+    target = _parse_unit_tokens(target_tokens)
+
+    # Terms are numbers followed by their units: '3 ft 4 in'
+    terms = []
+    previous = None
+    for kind, value in source_tokens:
+        if kind == 'number' and previous not in ('^', '**'):
+            terms.append((float(value), []))
+        elif terms:
+            terms[-1][1].append((kind, value))
+        else:
+            terms.append((1.0, [(kind, value)]))
+        previous = value
+    if not terms:
+        raise ValueError("Expected a quantity to convert")
+
+    units = [_parse_unit_tokens(unit_tokens) for _, unit_tokens in terms]
+    first = units[0]
+    if len(terms) > 1 and any(unit.affine for unit in units):
+        raise ValueError("Temperatures cannot be added up")
+    amount = 0.0
+    for (number, _), unit in zip(terms, units):
+        if unit.unit.dimension != first.unit.dimension:
+            raise ValueError("Terms have different dimensions")
+        amount += number * float(unit.unit.exact / first.unit.exact)
+    return amount, _plan(first, target, text)
+
+
+def evaluate(text):
+    """Evaluates a query such as '12 kWh in MJ' and returns the number"""
+    amount, plan = compile_query(text)
+    return amount * plan.scale + plan.offset
+
+
+def clear_caches():
+    """Empties every plan cache"""
+    for cached in (lookup_symbol, parse_unit, compile_conversion,
+                   compile_query):
+        cached.cache_clear()
@@ -0,0 +1,226 @@
+"""
+Lazy Conversions
+Records chains of unit conversions and arithmetic on arrays and runs them
+in one pass when the result is needed.
+
+Every step of such a chain is an affine map, so a recorded chain is kept
+collapsed as scale * x + offset per input array: converting Foot to Meter
+to Centimeter is one factor, and scaling, adding a constant or adding
+another array only updates the scales and the offset. compute() then
+writes the result block by block without a temporary array per step.
+
+    feet = LazyArray(values, 'Foot')
+    total = (feet.to('Meter') * 1.5 + Quantity(2, 'Meter')).to('Centimeter')
+    total.compute()     # QuantityArray, 150 * 0.3048 * values + 200
+
+License: MIT
+"""
+
+from engine import FUSED_BLOCK, FUSED_MIN_SIZE, get_category
+from quantity import (UNIT_NAMES, Quantity, QuantityArray, scale_offset,
+                      unit_id)
+
+
+def _check_linear(lazy, operation):
+    """Raises ValueError for arithmetic that has no meaning on temperatures"""
+    if lazy.category == 'Temperature':
+        raise ValueError(f"Temperatures cannot be {operation}")
+
+
+class LazyArray:
+    """A recorded conversion of one or more arrays into a unit.
+
+    Holds (array, scale) terms and an offset, so that the values are
+    sum(scale * array) + offset in unit_id. Operations return new
+    LazyArrays and do not touch the arrays; compute() evaluates.
+    """
+
+    __slots__ = ('terms', 'offset', 'unit_id')
+
+    def __init__(self, values, unit=None):
+        import numpy as np
+
+        if isinstance(values, QuantityArray):
+            if unit is not None and unit_id(unit) != values.unit_id:
+                raise ValueError("Convert the QuantityArray with to() "
+                                 "instead of passing another unit")
+            values, unit = values.values, values.unit_id
+        elif unit is None:
+            raise TypeError("A unit is needed for a plain array")
+        values = np.asarray(values)
+        if values.dtype.kind != 'f':
+            values = values.astype(np.float64)
+        self.terms = ((values, 1.0),)
+        self.offset = 0.0
+        self.unit_id = unit_id(unit)
+
+    @classmethod
+    def _node(cls, terms, offset, unit):
+        """Returns a LazyArray from already collapsed parts"""
+        lazy = cls.__new__(cls)
+        lazy.terms = terms
+        lazy.offset = offset
+        lazy.unit_id = unit
+        return lazy
+
+    @property
+    def unit(self):
+        """The unit name"""
+        return UNIT_NAMES[self.unit_id]
+
+    @property
+    def category(self):
+        """The category of the unit"""
+        return get_category(UNIT_NAMES[self.unit_id])
+
+    @property
+    def shape(self):
+        """The shape of the result"""
+        return self.terms[0][0].shape
+
+    def _affine(self, scale, offset, unit):
+        """Returns scale * self + offset in unit"""
+        return LazyArray._node(
+            tuple((values, factor * scale) for values, factor in self.terms),
+            self.offset * scale + offset, unit)
+
+    def to(self, unit):
+        """Records a conversion to another unit of the category"""
+        target = unit_id(unit)
+        return self._affine(*scale_offset(self.unit_id, target), target)
+
+    def __mul__(self, factor):
+        if isinstance(factor, (Quantity, QuantityArray, LazyArray)):
+            return NotImplemented
+        _check_linear(self, 'scaled')
+        return self._affine(factor, 0.0, self.unit_id)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        if isinstance(divisor, (Quantity, QuantityArray, LazyArray)):
+            return NotImplemented
+        _check_linear(self, 'scaled')
+        return self._affine(1 / divisor, 0.0, self.unit_id)
+
+    def __neg__(self):
+        _check_linear(self, 'negated')
+        return self._affine(-1.0, 0.0, self.unit_id)
+
+    def _combine(self, other, sign, operation):
+        """Returns self + sign * other with other in this unit"""
+        _check_linear(self, operation)
+        if isinstance(other, Quantity):
+            scale, offset = scale_offset(other.unit_id, self.unit_id)
+            return self._affine(1.0, sign * (other.value * scale + offset),
+                                self.unit_id)
+        if isinstance(other, QuantityArray):
+            other = LazyArray(other)
+        if other.shape != self.shape:
+            raise ValueError(f"Cannot combine shapes {self.shape} and "
+                             f"{other.shape}")
+        other = other.to(self.unit_id)._affine(sign, 0.0, self.unit_id)
+
+        # The same array on both sides keeps a single term
+        terms = list(self.terms)
+        for values, factor in other.terms:
+            for index, (known, known_factor) in enumerate(terms):
+                if known is values:
+                    terms[index] = (known, known_factor + factor)
+                    break
+            else:
+                terms.append((values, factor))
+        return LazyArray._node(tuple(terms), self.offset + other.offset,
+                               self.unit_id)
+
+    def __add__(self, other):
+        if not isinstance(other, (Quantity, QuantityArray, LazyArray)):
+            return NotImplemented
+        return self._combine(other, 1.0, 'added up')
+
+    def __radd__(self, other):
+        # Quantity + LazyArray: the result takes the left operand's unit
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        return self.to(other.unit_id)._combine(other, 1.0, 'added up')
+
+    def __sub__(self, other):
+        if not isinstance(other, (Quantity, QuantityArray, LazyArray)):
+            return NotImplemented
+        return self._combine(other, -1.0, 'subtracted')
+
+    def __rsub__(self, other):
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        _check_linear(self, 'subtracted')
+        return (-self.to(other.unit_id))._combine(other, 1.0, 'subtracted')
+
+    def compute(self, out=None):
+        """Evaluates the chain in one pass and returns a QuantityArray; if
+        out is given the values are written into it"""
+        import numpy as np
+
+        arrays = [values for values, _ in self.terms]
+        if out is None:
+            out = np.empty(self.shape, np.result_type(*arrays))
+        elif out.shape != self.shape:
+            raise ValueError(f"out has shape {out.shape}, expected "
+                             f"{self.shape}")
+        elif self._overlaps(out):
+            # Writing out would change inputs before they are read
+            np.copyto(out, self.compute().values)
+            return QuantityArray(out, self.unit_id)
+
+        if (out.size >= FUSED_MIN_SIZE and out.flags.c_contiguous
+                and all(values.flags.c_contiguous for values in arrays)):
+            # Blocks small enough to stay in cache between the steps
+            flat = out.reshape(-1)
+            terms = [(values.reshape(-1), factor)
+                     for values, factor in self.terms]
+            spare = np.empty(min(FUSED_BLOCK, out.size), out.dtype)
+            for start in range(0, out.size, FUSED_BLOCK):
+                block = slice(start, start + FUSED_BLOCK)
+                self._evaluate(terms, block, flat[block],
+                               spare[:flat[block].size])
+        else:
+            self._evaluate(self.terms, Ellipsis, out,
+                           np.empty_like(out) if len(self.terms) > 1
+                           else None)
+        return QuantityArray(out, self.unit_id)
+
+    def _overlaps(self, out):
+        """Returns True when out shares memory with an input in a way that
+        the evaluation would read values it has already overwritten. out
+        may be the first input itself, which is read just before each
+        block of it is written."""
+        import numpy as np
+
+        (first, _), *others = self.terms
+        if any(np.shares_memory(out, values) for values, _ in others):
+            return True
+        return np.shares_memory(out, first) and not (
+            out.__array_interface__['data'] ==
+            first.__array_interface__['data'] and
+            out.strides == first.strides and out.dtype == first.dtype)
+
+    def _evaluate(self, terms, block, out, spare):
+        """Writes one block of the result into out"""
+        import numpy as np
+
+        (values, factor), *others = terms
+        np.multiply(values[block], factor, out=out)
+        for values, factor in others:
+            np.multiply(values[block], factor, out=spare)
+            np.add(out, spare, out=out)
+        if self.offset:
+            np.add(out, self.offset, out=out)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        terms = ' + '.join(f"{factor!r} * <{values.dtype} {values.shape}>"
+                           for values, factor in self.terms)
+        if self.offset:
+            terms += f" + {self.offset!r}"
+        return f"LazyArray({terms}, {self.unit!r})"
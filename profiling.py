@@ -0,0 +1,70 @@
+"""
+Profiling
+Wall-time and cProfile recording for the Unit Converter application,
+enabled with `python converter.py --profile`.
+
+Functions are only wrapped when profiling is switched on, so a normal run
+pays nothing for it.
+
+License: MIT
+"""
+
+import cProfile
+import functools
+import time
+from collections import defaultdict
+
+# Default file for the cProfile statistics
+PROFILE_PATH = 'converter.prof'
+
+
+class Profiler:
+    """Records the wall time of named operations while a cProfile session
+    runs, and writes both out at the end"""
+
+    def __init__(self, path=PROFILE_PATH):
+        self.path = path
+        self.profile = cProfile.Profile()
+        self.timings = defaultdict(list)
+
+    def record(self, name, seconds):
+        """Adds one timing of an operation"""
+        self.timings[name].append(seconds)
+
+    def wrap(self, name, func):
+        """Returns func with each call timed under name; name may also be a
+        function of the call's arguments"""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                label = name(*args, **kwargs) if callable(name) else name
+                self.record(label, time.perf_counter() - start)
+        return timed
+
+    def start(self):
+        """Starts the cProfile session"""
+        self.profile.enable()
+
+    def finish(self):
+        """Stops the session, writes the statistics file and returns the
+        timing summary"""
+        self.profile.disable()
+        self.profile.dump_stats(self.path)
+        return self.summary()
+
+    def summary(self):
+        """Returns the timings as a table, slowest total first"""
+        lines = [f"{'operation':<32} {'calls':>6} {'total':>10} "
+                 f"{'mean':>9} {'max':>9}"]
+        for name, times in sorted(self.timings.items(),
+                                  key=lambda item: -sum(item[1])):
+            lines.append(f"{name:<32} {len(times):>6} "
+                         f"{sum(times) * 1000:>7.1f} ms "
+                         f"{sum(times) / len(times) * 1000:>6.2f} ms "
+                         f"{max(times) * 1000:>6.2f} ms")
+        lines.append(f"cProfile statistics: {self.path} "
+                     f"(python -m pstats {self.path})")
+        return '\n'.join(lines)
@@ -0,0 +1,289 @@
+"""
+Quantities
+Values that carry their unit, for services that pass measurements around
+instead of bare numbers.
+
+A Quantity is one value and an interned unit ID in two slots, with no
+per-object dict. A QuantityArray is one contiguous NumPy float buffer and a
+single unit ID, so converting or adding a million values is a vectorized
+pass rather than a million Python objects. NumPy is only imported when a
+QuantityArray is created.
+
+License: MIT
+"""
+
+import functools
+
+from engine import CATEGORY_UNITS, UNIT_IDS, convert, get_scale_offset
+
+# Interned unit IDs: unit ID -> unit name, in category display order
+UNIT_NAMES = tuple(UNIT_IDS)
+
+# Unit name -> unit ID
+_UNIT_NUMBERS = {name: number for number, name in enumerate(UNIT_NAMES)}
+
+# Unit ID -> category
+_UNIT_CATEGORIES = tuple(UNIT_IDS[name][0] for name in UNIT_NAMES)
+
+# Unit ID -> ID of the base unit of its category, its first unit
+_BASE_UNITS = tuple(_UNIT_NUMBERS[CATEGORY_UNITS[category][0]]
+                    for category in _UNIT_CATEGORIES)
+
+
+def unit_id(unit):
+    """Returns the interned ID of a unit name; IDs are passed through"""
+    if isinstance(unit, int):
+        if not 0 <= unit < len(UNIT_NAMES):
+            raise KeyError(f"Unknown unit: {unit}")
+        return unit
+    try:
+        return _UNIT_NUMBERS[unit]
+    except KeyError:
+        raise KeyError(f"Unknown unit: {unit}") from None
+
+
+@functools.lru_cache(maxsize=None)
+def scale_offset(source_id, target_id):
+    """Returns (scale, offset) between two unit IDs, cached per pair"""
+    return get_scale_offset(UNIT_NAMES[source_id], UNIT_NAMES[target_id])
+
+
+def _check_linear(unit_id, operation):
+    """Raises ValueError for arithmetic that has no meaning on temperatures"""
+    if _UNIT_CATEGORIES[unit_id] == 'Temperature':
+        raise ValueError(f"Temperatures cannot be {operation}")
+
+
+class Quantity:
+    """A value with its unit: Quantity(3, 'Foot').to('Meter')"""
+
+    __slots__ = ('value', 'unit_id')
+
+    def __init__(self, value, unit):
+        self.value = value
+        self.unit_id = unit_id(unit)
+
+    @property
+    def unit(self):
+        """The unit name"""
+        return UNIT_NAMES[self.unit_id]
+
+    @property
+    def category(self):
+        """The category of the unit"""
+        return _UNIT_CATEGORIES[self.unit_id]
+
+    def to(self, unit):
+        """Returns the quantity converted to another unit of its category"""
+        target = unit_id(unit)
+        return Quantity(convert(self.value, UNIT_NAMES[self.unit_id],
+                                UNIT_NAMES[target]), target)
+
+    def _in_own_unit(self, other, operation):
+        """Returns the value of another Quantity in this one's unit"""
+        if not isinstance(other, Quantity):
+            raise TypeError(f"Cannot {operation} {type(other).__name__} "
+                            f"and Quantity")
+        scale, offset = scale_offset(other.unit_id, self.unit_id)
+        return other.value * scale + offset
+
+    def __add__(self, other):
+        if not isinstance(other, Quantity):
+            # Lets other types, such as lazy.LazyArray, handle the sum
+            return NotImplemented
+        _check_linear(self.unit_id, 'added up')
+        return Quantity(self.value + self._in_own_unit(other, 'add'),
+                        self.unit_id)
+
+    def __sub__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        _check_linear(self.unit_id, 'subtracted')
+        return Quantity(self.value - self._in_own_unit(other, 'subtract'),
+                        self.unit_id)
+
+    def __mul__(self, factor):
+        if isinstance(factor, Quantity):
+            return NotImplemented
+        _check_linear(self.unit_id, 'scaled')
+        return Quantity(self.value * factor, self.unit_id)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Quantity):
+            # Ratio of two quantities of the same category
+            _check_linear(self.unit_id, 'divided')
+            return self.value / self._in_own_unit(other, 'divide')
+        _check_linear(self.unit_id, 'scaled')
+        return Quantity(self.value / other, self.unit_id)
+
+    def __neg__(self):
+        _check_linear(self.unit_id, 'negated')
+        return Quantity(-self.value, self.unit_id)
+
+    def __abs__(self):
+        return Quantity(abs(self.value), self.unit_id)
+
+    def _base_value(self):
+        """Returns the value in the base unit of the category"""
+        scale, offset = scale_offset(self.unit_id, _BASE_UNITS[self.unit_id])
+        return self.value * scale + offset
+
+    def __eq__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        if _UNIT_CATEGORIES[other.unit_id] != self.category:
+            return False
+        return self._base_value() == other._base_value()
+
+    def __lt__(self, other):
+        return self.value < self._in_own_unit(other, 'compare')
+
+    def __le__(self, other):
+        return self.value <= self._in_own_unit(other, 'compare')
+
+    def __gt__(self, other):
+        return self.value > self._in_own_unit(other, 'compare')
+
+    def __ge__(self, other):
+        return self.value >= self._in_own_unit(other, 'compare')
+
+    def __hash__(self):
+        # Equality compares the same base values, so equal quantities in
+        # different units hash alike
+        return hash((self.category, self._base_value()))
+
+    def __repr__(self):
+        return f"Quantity({self.value!r}, {self.unit!r})"
+
+    def __str__(self):
+        return f"{self.value:g} {self.unit}"
+
+
+class QuantityArray:
+    """Many values with one unit, stored in a single NumPy array.
+
+    Float32 and float64 inputs keep their dtype, other inputs are converted
+    to float64. Arithmetic and to() return new arrays and never create a
+    Python object per element.
+    """
+
+    __slots__ = ('values', 'unit_id')
+
+    def __init__(self, values, unit):
+        import numpy as np
+
+        values = np.asarray(values)
+        if values.dtype.kind != 'f':
+            values = values.astype(np.float64)
+        self.values = values
+        self.unit_id = unit_id(unit)
+
+    @property
+    def unit(self):
+        """The unit name"""
+        return UNIT_NAMES[self.unit_id]
+
+    @property
+    def category(self):
+        """The category of the unit"""
+        return _UNIT_CATEGORIES[self.unit_id]
+
+    @property
+    def nbytes(self):
+        """Bytes used by the value buffer"""
+        return self.values.nbytes
+
+    def to(self, unit, out=None):
+        """Returns the array converted to another unit of its category; if
+        out is given the values are written into it"""
+        import numpy as np
+
+        target = unit_id(unit)
+        scale, offset = scale_offset(self.unit_id, target)
+        values = np.multiply(self.values, scale, out=out)
+        if offset:
+            np.add(values, offset, out=values)
+        return QuantityArray(values, target)
+
+    def _in_own_unit(self, other, operation):
+        """Returns the values of another quantity in this array's unit"""
+        if not isinstance(other, (Quantity, QuantityArray)):
+            raise TypeError(f"Cannot {operation} {type(other).__name__} "
+                            f"and QuantityArray")
+        if isinstance(other, QuantityArray):
+            values = other.values
+        else:
+            values = other.value
+        scale, offset = scale_offset(other.unit_id, self.unit_id)
+        if scale == 1 and not offset:
+            return values
+        return values * scale + offset
+
+    def __add__(self, other):
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        _check_linear(self.unit_id, 'added up')
+        return QuantityArray(self.values + self._in_own_unit(other, 'add'),
+                             self.unit_id)
+
+    def __sub__(self, other):
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        _check_linear(self.unit_id, 'subtracted')
+        return QuantityArray(self.values - self._in_own_unit(other,
+                                                             'subtract'),
+                             self.unit_id)
+
+    def __mul__(self, factor):
+        if isinstance(factor, (Quantity, QuantityArray)):
+            return NotImplemented
+        _check_linear(self.unit_id, 'scaled')
+        return QuantityArray(self.values * factor, self.unit_id)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, (Quantity, QuantityArray)):
+            _check_linear(self.unit_id, 'divided')
+            return self.values / self._in_own_unit(other, 'divide')
+        _check_linear(self.unit_id, 'scaled')
+        return QuantityArray(self.values / other, self.unit_id)
+
+    def __neg__(self):
+        _check_linear(self.unit_id, 'negated')
+        return QuantityArray(-self.values, self.unit_id)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        values = self.values[index]
+        if getattr(values, 'ndim', 0):
+            return QuantityArray(values, self.unit_id)
+        return Quantity(float(values), self.unit_id)
+
+    def __iter__(self):
+        for value in self.values.tolist():
+            yield Quantity(value, self.unit_id)
+
+    def sum(self):
+        """Returns the total as a Quantity"""
+        _check_linear(self.unit_id, 'added up')
+        return Quantity(float(self.values.sum()), self.unit_id)
+
+    def mean(self):
+        """Returns the mean as a Quantity"""
+        return Quantity(float(self.values.mean()), self.unit_id)
+
+    def min(self):
+        """Returns the smallest value as a Quantity"""
+        return Quantity(float(self.values.min()), self.unit_id)
+
+    def max(self):
+        """Returns the largest value as a Quantity"""
+        return Quantity(float(self.values.max()), self.unit_id)
+
+    def __repr__(self):
+        return f"QuantityArray({self.values!r}, {self.unit!r})"
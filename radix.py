@@ -0,0 +1,977 @@
+"""
+Number Base Conversion
+Converts arbitrary-size integers between bases 2 to 36.
+
+Large numbers are split recursively around cached powers of the base, so a
+conversion costs a few big multiplications or divisions instead of one
+bignum operation per digit.
+
+Bases that are powers of two (2, 4, 8, 16, 32) are regrouped bit by bit,
+which also works on files streamed chunk by chunk.
+
+format_array and parse_array convert whole NumPy arrays of 64-bit integers,
+splitting blocks of values into digits together.
+
+Floats can be viewed as their IEEE-754 bit patterns, one value at a time or
+as whole arrays reinterpreted in place.
+
+License: MIT
+"""
+
+import itertools
+import math
+import struct
+
+# Digit characters for bases up to 36
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Digit lookup table: valid digit characters of every base
+BASE_DIGITS = {base: frozenset(DIGITS[:base] + DIGITS[:base].lower())
+               for base in range(2, 37)}
+
+# Bases whose digits are whole groups of bits
+POWER_OF_TWO_BASES = {2: 1, 4: 2, 8: 3, 16: 4, 32: 5}
+
+# Numbers up to this many bits are converted directly
+LEAF_BITS = 1024
+
+# Divisions below this many bits use the builtin divmod
+DIV_LIMIT_BITS = 4096
+
+# Cached powers of each base: base -> [(m, base ** m), (2m, base ** 2m), ...]
+_power_cache = {}
+
+# Digits read per chunk when streaming
+STREAM_CHUNK_DIGITS = 1 << 20
+
+# Bytes read per chunk when encoding binary files
+STREAM_CHUNK_BYTES = 1 << 18
+
+# Bit groups -> digit, for bases the builtin format() does not produce
+GROUP_DIGITS = {bits: {format(value, f'0{bits}b'): DIGITS[value]
+                       for value in range(1 << bits)}
+                for bits in (2, 5)}
+
+# Byte -> digits, for encoding binary data in bases 2 and 4
+BYTE_DIGITS = {base: tuple(format(byte, f'0{8 // bits}b') if base == 2 else
+                           ''.join(DIGITS[byte >> shift & 3]
+                                   for shift in (6, 4, 2, 0))
+                           for byte in range(256))
+               for base, bits in ((2, 1), (4, 2))}
+
+# Whitespace removed from streamed digit text
+_WHITESPACE = str.maketrans('', '', ' \t\r\n')
+
+
+def check_base(base):
+    """Raises ValueError unless base is between 2 and 36"""
+    if not 2 <= base <= 36:
+        raise ValueError(f"Base must be between 2 and 36, not {base}")
+
+
+def get_powers(base, bits):
+    """Returns the cached powers base ** (m * 2 ** k) up to the first one
+    with more than bits bits.
+    """
+    powers = _power_cache.get(base)
+    if powers is None:
+        # The first power is the largest one that fits in a leaf
+        digits = 1
+        while base ** (digits * 2) < 1 << LEAF_BITS:
+            digits *= 2
+        powers = _power_cache[base] = [(digits, base ** digits)]
+    while powers[-1][1].bit_length() <= bits:
+        digits, power = powers[-1]
+        powers.append((digits * 2, power * power))
+    return powers
+
+# Divide-and-conquer division
+
+
+def _div2n1n(a, b, n):
+    """Divides a by b, where b has n bits and a < b << n.
+
+    Recursive (Burnikel-Ziegler) division: the quotient is found half by
+    half, so the cost is a few multiplications instead of a schoolbook
+    division.
+    """
+    if a.bit_length() - n <= DIV_LIMIT_BITS:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+
+def _div3n2n(a12, a3, b, b1, b2, n):
+    """Helper of _div2n1n: divides (a12 << n | a3) by b = (b1 << n | b2)"""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def divmod_power(n, power):
+    """Divides n by a power of the base, where n < power ** 2"""
+    bits = power.bit_length()
+    if n.bit_length() <= DIV_LIMIT_BITS:
+        return divmod(n, power)
+    return _div2n1n(n, power, bits)
+
+# Base conversion functions
+
+
+def _small_to_base(n, base):
+    """Converts a non-negative leaf-sized integer to the given base"""
+    if base == 10:
+        return str(n)
+    if base == 16:
+        return format(n, 'X')
+    if base == 8:
+        return format(n, 'o')
+    if base == 2:
+        return format(n, 'b')
+    if n == 0:
+        return "0"
+    result = []
+    while n:
+        n, digit = divmod(n, base)
+        result.append(DIGITS[digit])
+    return ''.join(reversed(result))
+
+
+def _int_to_digits(n, base, powers, level):
+    """Converts n < powers[level][1] ** 2 to the given base"""
+    while level >= 0 and n < powers[level][1]:
+        level -= 1
+    if level < 0:
+        return _small_to_base(n, base)
+    digits, power = powers[level]
+    high, low = divmod_power(n, power)
+    return (_int_to_digits(high, base, powers, level - 1) +
+            _int_to_digits(low, base, powers, level - 1).rjust(digits, '0'))
+
+
+def decimal_to_base(n, base):
+    """Converts a decimal number to specified base"""
+    check_base(base)
+    negative = n < 0
+    if negative:
+        n = -n
+    if n.bit_length() <= LEAF_BITS:
+        result = _small_to_base(n, base)
+    elif base in POWER_OF_TWO_BASES:
+        # Digits are groups of bits, formatting them is linear
+        bits = POWER_OF_TWO_BASES[base]
+        result = format_bit_groups(n, base, -(-n.bit_length() // bits))
+    else:
+        powers = get_powers(base, n.bit_length())
+        result = _int_to_digits(n, base, powers, len(powers) - 1)
+    return "-" + result if negative else result
+
+
+def _digits_to_int(text, base, powers, level):
+    """Converts a validated digit string to an integer"""
+    while level >= 0 and len(text) <= powers[level][0]:
+        level -= 1
+    if level < 0:
+        return int(text, base)
+    digits, power = powers[level]
+    return (_digits_to_int(text[:-digits], base, powers, level - 1) * power +
+            _digits_to_int(text[-digits:], base, powers, level - 1))
+
+
+def base_to_decimal(n, base):
+    """Converts a number from specified base to decimal"""
+    check_base(base)
+    if not n:
+        return 0
+    negative = n[0] == '-'
+    if negative:
+        n = n[1:]
+    if not n or not BASE_DIGITS[base].issuperset(n):
+        raise ValueError(f"Invalid digits for base {base}: {n!r}")
+
+    if base in POWER_OF_TWO_BASES or len(n) <= get_powers(base, 0)[0][0]:
+        # Builtin parsing is linear for these bases and fine for short input
+        result = int(n, base)
+    else:
+        bits = len(n) * base.bit_length()
+        powers = get_powers(base, bits)
+        result = _digits_to_int(n, base, powers, len(powers) - 1)
+    return -result if negative else result
+
+# Power-of-two regrouping
+
+
+def check_power_of_two_base(base):
+    """Returns the bits per digit of a power-of-two base"""
+    try:
+        return POWER_OF_TWO_BASES[base]
+    except KeyError:
+        raise ValueError(f"Base must be 2, 4, 8, 16 or 32, not {base}") from None
+
+
+def format_bit_groups(n, base, width):
+    """Formats n in a power-of-two base, zero padded to width digits"""
+    if base == 16:
+        return format(n, f'0{width}X')
+    if base == 8:
+        return format(n, f'0{width}o')
+    if base == 2:
+        return format(n, f'0{width}b')
+    bits = POWER_OF_TWO_BASES[base]
+    groups = GROUP_DIGITS[bits]
+    binary = format(n, f'0{width * bits}b')
+    return ''.join([groups[binary[i:i + bits]]
+                    for i in range(0, len(binary), bits)])
+
+
+def _regroup_block(digits, from_base, to_base):
+    """Regroups a run of digits, keeping leading zero digits"""
+    from_bits = POWER_OF_TWO_BASES[from_base]
+    to_bits = POWER_OF_TWO_BASES[to_base]
+    if not BASE_DIGITS[from_base].issuperset(digits):
+        raise ValueError(f"Invalid digits for base {from_base}")
+    width = -(-len(digits) * from_bits // to_bits)
+    return format_bit_groups(int(digits, from_base), to_base, width)
+
+
+def regroup_digits(text, from_base, to_base):
+    """Converts a digit string between two power-of-two bases in linear time"""
+    check_power_of_two_base(from_base)
+    check_power_of_two_base(to_base)
+    negative = text.startswith('-')
+    digits = text[1:] if negative else text
+    if not digits:
+        raise ValueError("No digits to convert")
+    result = _regroup_block(digits, from_base, to_base).lstrip('0') or '0'
+    return '-' + result if negative and result != '0' else result
+
+
+class _DigitWriter:
+    """Writes a digit stream, dropping leading zeros and wrapping lines.
+
+    The sign is only written once a non-zero digit shows up.
+    """
+
+    def __init__(self, outfile, wrap=0, sign=''):
+        self.outfile = outfile
+        self.wrap = wrap
+        self.sign = sign
+        self.column = 0
+        self.started = False
+        self.digits = 0
+
+    def write(self, digits):
+        if not self.started:
+            digits = digits.lstrip('0')
+            if not digits:
+                return
+            self.started = True
+            self.outfile.write(self.sign)
+        self.digits += len(digits)
+        if not self.wrap:
+            self.outfile.write(digits)
+            return
+        # Finish the current line, then write whole lines
+        start = min(self.wrap - self.column, len(digits)) if self.column else 0
+        if start:
+            self.outfile.write(digits[:start])
+            self.column += start
+            if self.column < self.wrap:
+                return
+            self.outfile.write('\n')
+            self.column = 0
+        lines = [digits[i:i + self.wrap]
+                 for i in range(start, len(digits), self.wrap)]
+        if lines:
+            self.outfile.write('\n'.join(lines))
+            self.column = len(lines[-1])
+            if self.column == self.wrap:
+                self.outfile.write('\n')
+                self.column = 0
+
+    def close(self):
+        if not self.started:
+            self.outfile.write('0')
+            self.digits = 1
+            self.column += 1
+        if self.column or not self.wrap:
+            self.outfile.write('\n')
+
+
+def _iter_digit_chunks(infile, chunk_digits):
+    """Yields chunks of digit text with whitespace removed"""
+    while True:
+        chunk = infile.read(chunk_digits)
+        if not chunk:
+            return
+        chunk = chunk.translate(_WHITESPACE)
+        if chunk:
+            yield chunk
+
+
+def regroup_stream(infile, outfile, from_base, to_base,
+                   chunk_digits=STREAM_CHUNK_DIGITS, wrap=0):
+    """Converts a text stream of digits between two power-of-two bases.
+
+    The digits are read and written chunk by chunk in linear time and
+    constant memory; whitespace in the input is ignored. When an output
+    digit spans several input digits the input must be seekable, since the
+    digits are counted first to align the groups. Returns the number of
+    digits written.
+    """
+    from_bits = check_power_of_two_base(from_base)
+    to_bits = check_power_of_two_base(to_base)
+    # Input digits that map onto a whole number of output digits
+    block = math.lcm(from_bits, to_bits) // from_bits
+    chunk_digits = max(chunk_digits // block, 1) * block
+
+    if block > 1 and not infile.seekable():
+        raise ValueError(f"Converting base {from_base} to base {to_base} "
+                         f"needs a seekable input to align digit groups")
+
+    chunks = _iter_digit_chunks(infile, chunk_digits)
+    first = next(chunks, '')
+    negative = first.startswith('-')
+    if negative:
+        first = first[1:]
+
+    head = 0
+    if block > 1:
+        # Count the digits to find the size of the leading partial block
+        start = infile.tell()
+        count = len(first) + sum(len(chunk) for chunk in chunks)
+        infile.seek(start)
+        chunks = _iter_digit_chunks(infile, chunk_digits)
+        head = count % block
+    if not first and not negative:
+        raise ValueError("No digits to convert")
+
+    # Pad the leading partial block with zeros, the writer drops them
+    pending = '0' * (block - head) + first if head else first
+    writer = _DigitWriter(outfile, wrap, '-' if negative else '')
+    for chunk in itertools.chain([''], chunks):
+        pending += chunk
+        usable = len(pending) - len(pending) % block
+        if usable:
+            writer.write(_regroup_block(pending[:usable], from_base, to_base))
+            pending = pending[usable:]
+    if pending:
+        writer.write(_regroup_block(pending, from_base, to_base))
+    writer.close()
+    return writer.digits
+
+# Hexdump-style encoding of binary data
+
+
+def _check_byte_base(base):
+    """Returns the digits per byte of a base that splits bytes evenly"""
+    if base not in (2, 4, 16):
+        raise ValueError(f"Bytes can only be encoded in base 2, 4 or 16, "
+                         f"not {base}")
+    return 8 // POWER_OF_TWO_BASES[base]
+
+
+def encode_bytes(data, base=16):
+    """Encodes bytes as digits, keeping every byte (leading zeros too)"""
+    _check_byte_base(base)
+    if base == 16:
+        return data.hex().upper()
+    return ''.join(map(BYTE_DIGITS[base].__getitem__, data))
+
+
+def decode_bytes(text, base=16):
+    """Decodes digits written by encode_bytes back into bytes"""
+    per_byte = _check_byte_base(base)
+    text = text.translate(_WHITESPACE)
+    if len(text) % per_byte:
+        raise ValueError(f"Digit count is not a multiple of {per_byte}")
+    if not BASE_DIGITS[base].issuperset(text):
+        raise ValueError(f"Invalid digits for base {base}")
+    if base == 16:
+        return bytes.fromhex(text)
+    return int(text or '0', base).to_bytes(len(text) // per_byte, 'big')
+
+
+def encode_stream(infile, outfile, base=16, wrap=64,
+                  chunk_bytes=STREAM_CHUNK_BYTES):
+    """Encodes a binary stream as lines of digits, returns the bytes read"""
+    per_byte = _check_byte_base(base)
+    if wrap:
+        # Whole lines per chunk so lines never straddle two chunks
+        line_bytes = max(wrap // per_byte, 1)
+        wrap = line_bytes * per_byte
+        chunk_bytes = max(chunk_bytes // line_bytes, 1) * line_bytes
+    total = 0
+    while True:
+        chunk = infile.read(chunk_bytes)
+        if not chunk:
+            return total
+        total += len(chunk)
+        digits = encode_bytes(chunk, base)
+        if wrap:
+            outfile.write('\n'.join(digits[i:i + wrap]
+                                     for i in range(0, len(digits), wrap)))
+        else:
+            outfile.write(digits)
+        outfile.write('\n')
+
+
+def decode_stream(infile, outfile, base=16,
+                  chunk_digits=STREAM_CHUNK_DIGITS):
+    """Decodes a text stream of digits into bytes, returns the bytes written"""
+    per_byte = _check_byte_base(base)
+    total = 0
+    pending = ''
+    for chunk in _iter_digit_chunks(infile, chunk_digits):
+        pending += chunk
+        usable = len(pending) - len(pending) % per_byte
+        data = decode_bytes(pending[:usable], base)
+        pending = pending[usable:]
+        outfile.write(data)
+        total += len(data)
+    if pending:
+        raise ValueError(f"Digit count is not a multiple of {per_byte}")
+    return total
+
+# Vectorized formatting and parsing of integer arrays
+
+# Rows converted per block, small enough for the digit matrices to stay cached
+ARRAY_BLOCK_ROWS = 1 << 14
+
+# Largest value of a uint64
+UINT64_MAX = (1 << 64) - 1
+
+# Digit counts up to this are found by comparing with every power of the base
+LENGTH_COUNT_COLUMNS = 16
+
+
+def _digit_count(value, base):
+    """Returns the number of digits of a non-negative integer in a base"""
+    count = 1
+    while value >= base:
+        value //= base
+        count += 1
+    return count
+
+
+def _smallest_uint(limit):
+    """Returns the smallest NumPy unsigned type holding values below limit"""
+    import numpy as np
+
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if limit <= 1 << 8 * np.dtype(dtype).itemsize:
+            return dtype
+    return np.uint64
+
+
+def _power_table(base, count):
+    """Returns base ** 0 .. base ** (count - 1) as uint64, saturated at the
+    largest uint64"""
+    import numpy as np
+
+    return np.array([min(base ** k, UINT64_MAX) for k in range(count)],
+                    dtype=np.uint64)
+
+
+def _digit_lengths(magnitude, base, columns):
+    """Returns the number of digits of every uint64 magnitude of at most
+    columns digits.
+
+    Short numbers count the powers of the base they reach. For longer ones
+    the float exponent gives the bit length (or one more, when rounding
+    reaches the next power of two), which fixes the digit count to within
+    one; a comparison with the matching power of the base settles it.
+    """
+    import numpy as np
+
+    if columns <= LENGTH_COUNT_COLUMNS:
+        dtype = _smallest_uint(base ** columns)
+        narrow = magnitude.astype(dtype, copy=False)
+        lengths = np.ones(magnitude.shape, dtype=np.uint8)
+        for count in range(1, columns):
+            lengths += narrow >= dtype(base ** count)
+        return lengths
+
+    most = [_digit_count(min((1 << bits) - 1, UINT64_MAX), base)
+            for bits in range(66)]
+    # Zero has exponent 0 and, like one, a single digit
+    lower = np.array([0] + [min(base ** (count - 1), UINT64_MAX)
+                            for count in most[1:]], dtype=np.uint64)
+    exponent = np.frexp(magnitude.astype(np.float64))[1]
+    lengths = np.take(np.array(most, dtype=np.uint8), exponent)
+    if base not in POWER_OF_TWO_BASES or base ** columns > 1 << 53:
+        # Bit lengths fix the digits of power-of-two bases, unless the
+        # magnitude is past the float mantissa and rounds up
+        lengths -= magnitude < np.take(lower, exponent)
+    return lengths
+
+
+def _split_levels(base, columns):
+    """Returns (dtype, power, bits, drop) for each halving of a
+    columns-digit number, from whole numbers down to single digits.
+
+    Every level splits each group of digits in two around power, using
+    shifts when the base is a power of two, and drops the leading groups
+    that lie entirely before the first column.
+    """
+    width = 1
+    while width < columns:
+        width *= 2
+    bit_count = POWER_OF_TWO_BASES.get(base)
+    levels = []
+    group = width
+    while group > 1:
+        first = (width - columns) // group
+        group //= 2
+        power = base ** group
+        levels.append((_smallest_uint(power), power,
+                       bit_count * group if bit_count else 0,
+                       (width - columns) // group - 2 * first))
+    return levels
+
+
+def _binary_matrix(magnitude, columns, lengths):
+    """_digit_matrix for base 2, unpacking the bits of big-endian words"""
+    import numpy as np
+
+    # The narrowest word holding every digit, so rows unpack contiguously
+    size = next(size for size in (1, 2, 4, 8) if 8 * size >= columns)
+    word = f'>u{size}'
+    skip = 8 * size - columns
+    all_ones = np.uint64((1 << 8 * size) - 1)
+
+    matrix = np.empty((magnitude.size, columns), dtype=np.uint8)
+    for start in range(0, magnitude.size, ARRAY_BLOCK_ROWS):
+        block = magnitude[start:start + ARRAY_BLOCK_ROWS]
+        rows = matrix[start:start + block.size]
+        if lengths is None:
+            bits = np.unpackbits(block.astype(word).view(np.uint8))
+            np.add(bits.reshape(block.size, 8 * size)[:, skip:],
+                   np.uint8(ord('0')), out=rows)
+            continue
+        # Scaled values move to the top of the word, under the mask of
+        # their digits: '0' + bit under the mask, NUL after it
+        bits = np.unpackbits((block << np.uint64(skip)).astype(word)
+                             .view(np.uint8))
+        shift = np.uint64(8 * size) - lengths[start:start + block.size]
+        mask = np.unpackbits(
+            (all_ones << shift & all_ones).astype(word).view(np.uint8))
+        mask *= np.uint8(ord('0'))
+        np.add(bits.reshape(block.size, 8 * size)[:, :columns],
+               mask.reshape(block.size, 8 * size)[:, :columns], out=rows)
+    return matrix
+
+
+def _digit_matrix(magnitude, base, columns, lengths=None):
+    """Returns the ASCII digits of every magnitude as a (size, columns)
+    uint8 matrix.
+
+    Without lengths the digits are zero-padded on the left. With lengths,
+    every magnitude is taken to be already scaled to the left, and the
+    cells from its length on are NUL.
+    """
+    import numpy as np
+
+    if base == 2:
+        return _binary_matrix(magnitude, columns, lengths)
+    levels = _split_levels(base, columns)
+    # Every magnitude is below base ** columns, narrower types divide faster
+    magnitude = magnitude.astype(_smallest_uint(base ** columns), copy=False)
+    matrix = np.empty((magnitude.size, columns), dtype=np.uint8)
+    for start in range(0, magnitude.size, ARRAY_BLOCK_ROWS):
+        # Groups of digits are rows here, so every operation is contiguous
+        groups = magnitude[None, start:start + ARRAY_BLOCK_ROWS]
+        for dtype, power, bits, drop in levels:
+            split = np.empty((2 * groups.shape[0], groups.shape[1]),
+                             dtype=dtype)
+            if power > UINT64_MAX:
+                split[0::2] = 0
+                split[1::2] = groups
+            elif bits:
+                np.right_shift(groups, groups.dtype.type(bits),
+                               out=split[0::2], casting='unsafe')
+                np.bitwise_and(groups, groups.dtype.type(power - 1),
+                               out=split[1::2], casting='unsafe')
+            else:
+                high = groups // groups.dtype.type(power)
+                split[0::2] = high
+                high *= groups.dtype.type(power)
+                np.subtract(groups, high, out=split[1::2], casting='unsafe')
+            groups = split[drop:]
+        groups = groups.astype(np.uint8)
+        if base > 10:
+            groups += (groups > 9) * np.uint8(ord('A') - ord('9') - 1)
+        groups += np.uint8(ord('0'))
+        if lengths is not None:
+            index = np.arange(columns, dtype=np.uint8)[:, None]
+            groups *= index < lengths[None, start:start + groups.shape[1]]
+        matrix[start:start + groups.shape[1]] = groups.T
+    return matrix
+
+
+def format_array(values, base, width=None, pad=False, bits=None):
+    """Formats an array of integers as digit strings, converting whole
+    blocks of values per vectorized step.
+
+    values can be a NumPy integer array, an array.array or a sequence of
+    ints that fit in 64 bits. By default every string has its minimal
+    width. pad zero-pads every string to the width of the widest one (or of
+    the bit width when bits is given); width zero-pads to a fixed number of
+    digits. With bits, negative values are shown as their two's complement
+    in that many bits. Returns a NumPy array of ASCII bytes (dtype 'S')
+    with the same shape, ready to be written out or decoded with
+    .astype(str).
+    """
+    import numpy as np
+
+    check_base(base)
+    values = np.asarray(values)
+    if not values.size and values.dtype.kind == 'f':
+        # An empty list has no integer dtype of its own
+        values = values.astype(np.int64)
+    if values.dtype.kind not in 'iub':
+        raise ValueError(f"Expected integers, got {values.dtype}")
+    shape = values.shape
+    values = values.ravel()
+
+    if values.dtype.kind == 'u':
+        negative = np.zeros(values.shape, dtype=bool)
+        magnitude = values.astype(np.uint64)
+    else:
+        values = values.astype(np.int64)
+        negative = values < 0
+        # Negation wraps for the minimum int64, the uint64 view is still right
+        magnitude = np.negative(values, where=negative,
+                                out=values.copy()).view(np.uint64)
+
+    if bits is not None:
+        if not 1 <= bits <= 64:
+            raise ValueError(f"Bit width must be between 1 and 64, not {bits}")
+        limit = 1 << bits
+        if (magnitude[~negative] >= limit).any() or \
+                (magnitude[negative] > limit >> 1).any():
+            raise ValueError(f"Values do not fit in {bits} bits")
+        # Two's complement: negative values become limit - magnitude
+        twos = np.uint64((limit - 1) & UINT64_MAX)
+        magnitude = np.where(negative, (~magnitude + np.uint64(1)) & twos,
+                             magnitude)
+        negative = np.zeros(values.shape, dtype=bool)
+
+    largest = int(magnitude.max()) if magnitude.size else 0
+    needed = _digit_count(largest, base)
+    if bits is not None and pad:
+        needed = max(needed, _digit_count((1 << bits) - 1, base))
+    if width is not None and needed > width:
+        raise ValueError(f"Values need {needed} digits, more than {width}")
+    columns = needed if width is None else width
+
+    if width is not None or pad:
+        matrix = _digit_matrix(magnitude, base, columns)
+    elif base ** columns <= 1 << 64:
+        # Scale every value to the left so the strings end in NUL padding
+        lengths = _digit_lengths(magnitude, base, columns)
+        scaled = magnitude * _power_table(base, columns)[columns - lengths]
+        matrix = _digit_matrix(scaled, base, columns, lengths)
+    else:
+        matrix = _digit_matrix(magnitude, base, columns)
+        matrix = np.char.lstrip(matrix.view(f'S{columns}'), b'0')
+        matrix[magnitude == 0] = b'0'
+    strings = matrix.view(f'S{columns}').ravel()
+
+    if negative.any():
+        strings = strings.astype(f'S{columns + 1}')
+        strings[negative] = np.char.add(b'-', strings[negative])
+    return strings.reshape(shape)
+
+
+def _digit_values(codes, base, negative):
+    """Returns the digit values of a (size, columns) matrix of character
+    codes as uint8, reading NUL and the sign of negative rows as zero.
+
+    Letters are folded to lower case and every other character wraps
+    around to a value no smaller than the base, so a single comparison
+    validates the whole matrix.
+    """
+    import numpy as np
+
+    code = codes.dtype.type
+    values = codes - code(ord('0'))
+    if base > 10:
+        # Non-digits take the largest code, so letters win the minimum, and
+        # non-letters saturate at 36
+        values |= (values > 9) * code(np.iinfo(code).max)
+        letters = (codes | code(0x20)) - code(ord('a'))
+        np.minimum(letters, code(26), out=letters)
+        letters += code(10)
+        np.minimum(values, letters, out=values)
+    values *= codes != 0
+    values[negative, 0] = 0
+    if (values >= base).any():
+        raise ValueError(f"Invalid digits for base {base}")
+    return values.astype(np.uint8, copy=False)
+
+
+def _pack_binary(rows):
+    """Returns the values of rows of up to 64 bits, packing them into
+    big-endian words"""
+    import numpy as np
+
+    columns = rows.shape[1]
+    size = next(size for size in (1, 2, 4, 8) if 8 * size >= columns)
+    bits = np.zeros((rows.shape[0], 8 * size), dtype=np.uint8)
+    bits[:, 8 * size - columns:] = rows
+    return np.packbits(bits, axis=1).view(f'>u{size}').ravel()
+
+
+def parse_array(strings, base, bits=None, dtype='int64'):
+    """Parses an array of digit strings into integers, converting whole
+    blocks of strings per vectorized step.
+
+    strings can be a NumPy array of str or bytes, or a sequence of str. A
+    leading '-' is accepted. With bits, the digits are read as a two's
+    complement number of that many bits. Returns a NumPy array of dtype
+    (int64 or uint64) with the same shape.
+    """
+    import numpy as np
+
+    check_base(base)
+    strings = np.asarray(strings)
+    if not strings.size:
+        # Including an empty list, which has no string dtype of its own
+        return np.zeros(strings.shape, dtype=dtype)
+    if strings.dtype.kind not in 'US':
+        raise ValueError(f"Expected strings, got {strings.dtype}")
+    shape = strings.shape
+    strings = np.ascontiguousarray(strings.ravel())
+    lengths = np.char.str_len(strings)
+    columns = max(int(lengths.max()) if strings.size else 1, 1)
+    # Shorter strings are read as if scaled to the left by their missing
+    # digits, unless that could overflow: then they are right-aligned on
+    # zeros, so no value overflows unless its digits do
+    padded = base ** columns > 1 << 64
+    if padded:
+        strings = np.char.zfill(strings, columns)
+    code_type = np.uint32 if strings.dtype.kind == 'U' else np.uint8
+    matrix = strings.view(code_type).reshape(strings.size, -1)
+    columns = matrix.shape[1]
+
+    negative = matrix[:, 0] == ord('-')
+    if (lengths == negative).any():
+        raise ValueError("Empty digit strings")
+    if np.count_nonzero(matrix) != lengths.sum() + \
+            (columns - lengths).sum() * padded:
+        raise ValueError(f"Invalid digits for base {base}")
+
+    # Digits combine pairwise, from single digits up to whole numbers
+    powers = [power for _, power, _, _ in _split_levels(base, columns)]
+    width = 1
+    while width < columns:
+        width *= 2
+    result = np.empty(strings.size, dtype=np.uint64)
+    for start in range(0, strings.size, ARRAY_BLOCK_ROWS):
+        block = matrix[start:start + ARRAY_BLOCK_ROWS]
+        rows = _digit_values(block, base,
+                             negative[start:start + block.shape[0]])
+        if base == 2 and not padded:
+            result[start:start + block.shape[0]] = _pack_binary(rows)
+            continue
+
+        # Groups of digits are rows here, so every operation is contiguous
+        groups = np.zeros((width, block.shape[0]), dtype=np.uint8)
+        groups[width - columns:] = rows.T
+        for power in reversed(powers):
+            high = groups[0::2]
+            low = groups[1::2]
+            if power > UINT64_MAX:
+                if high.any():
+                    raise ValueError("Values do not fit in 64 bits")
+                groups = low.astype(np.uint64)
+                continue
+            wide = _smallest_uint(power * power)
+            if power * power > 1 << 64:
+                high = high.astype(np.uint64)
+                low = low.astype(np.uint64)
+                if (high > (np.uint64(UINT64_MAX) - low) //
+                        np.uint64(power)).any():
+                    raise ValueError("Values do not fit in 64 bits")
+            combined = high.astype(wide)
+            combined *= wide(power)
+            combined += low
+            groups = combined
+        result[start:start + block.shape[0]] = groups[0]
+
+    # Undo the scaling of strings shorter than the widest one
+    if not padded and (lengths != columns).any():
+        missing = (columns - lengths).astype(np.uint8)
+        if base in POWER_OF_TWO_BASES:
+            result >>= missing * np.uint8(POWER_OF_TWO_BASES[base])
+        else:
+            result //= _power_table(base, columns + 1)[missing]
+
+    dtype = np.dtype(dtype)
+    if bits is not None:
+        if not 1 <= bits <= 64:
+            raise ValueError(f"Bit width must be between 1 and 64, not {bits}")
+        if bits < 64 and (result >> np.uint64(bits)).any():
+            raise ValueError(f"Values do not fit in {bits} bits")
+        # Sign-extend values with the top bit set
+        shift = np.uint64(64 - bits)
+        result = ((result << shift).view(np.int64) >> np.int64(64 - bits))
+        result = np.where(negative, -result, result)
+        return result.astype(dtype).reshape(shape)
+
+    if dtype.kind == 'u':
+        if negative.any():
+            raise ValueError("Negative values in an unsigned result")
+        return result.astype(dtype).reshape(shape)
+    if ((result > np.uint64(1 << 63)) |
+            ((result == np.uint64(1 << 63)) & ~negative)).any():
+        raise ValueError("Values do not fit in int64")
+    signed = np.negative(result.view(np.int64), where=negative,
+                         out=result.view(np.int64))
+    return signed.astype(dtype, copy=False).reshape(shape)
+
+# IEEE-754 bit patterns
+
+# Float format -> (exponent bits, mantissa bits)
+FLOAT_FORMATS = {
+    'float16': (5, 10),
+    'float32': (8, 23),
+    'float64': (11, 52),
+}
+
+# Float format -> struct codes of the float and of its unsigned bit pattern
+_FLOAT_STRUCT = {
+    'float16': ('>e', '>H'),
+    'float32': ('>f', '>I'),
+    'float64': ('>d', '>Q'),
+}
+
+
+def check_float_format(fmt):
+    """Returns the total bits of a float format"""
+    try:
+        exponent_bits, mantissa_bits = FLOAT_FORMATS[fmt]
+    except KeyError:
+        raise ValueError(f"Float format must be float16, float32 or float64, "
+                         f"not {fmt}") from None
+    return 1 + exponent_bits + mantissa_bits
+
+
+def float_to_bits(value, fmt='float64'):
+    """Returns the IEEE-754 bit pattern of a float as an unsigned int.
+
+    Values out of range of float16 and float32 raise OverflowError, like
+    struct.pack.
+    """
+    check_float_format(fmt)
+    float_code, bits_code = _FLOAT_STRUCT[fmt]
+    return struct.unpack(bits_code, struct.pack(float_code, value))[0]
+
+
+def bits_to_float(pattern, fmt='float64'):
+    """Returns the float stored in an IEEE-754 bit pattern"""
+    bits = check_float_format(fmt)
+    if not 0 <= pattern < 1 << bits:
+        raise ValueError(f"Bit pattern does not fit in {bits} bits")
+    float_code, bits_code = _FLOAT_STRUCT[fmt]
+    return struct.unpack(float_code, struct.pack(bits_code, pattern))[0]
+
+
+def float_fields(pattern, fmt='float64'):
+    """Splits an IEEE-754 bit pattern into (sign, exponent, mantissa).
+
+    pattern can be an int or a NumPy array of patterns; the fields are the
+    raw bit fields, the exponent still biased.
+    """
+    check_float_format(fmt)
+    exponent_bits, mantissa_bits = FLOAT_FORMATS[fmt]
+    sign = pattern >> exponent_bits + mantissa_bits
+    exponent = pattern >> mantissa_bits & (1 << exponent_bits) - 1
+    mantissa = pattern & (1 << mantissa_bits) - 1
+    return sign, exponent, mantissa
+
+
+def format_bit_pattern(pattern, base, fmt='float64'):
+    """Formats a bit pattern in a base, zero padded to the digits of the
+    largest pattern of the format"""
+    check_base(base)
+    bits = check_float_format(fmt)
+    width = _digit_count((1 << bits) - 1, base)
+    return decimal_to_base(pattern, base).rjust(width, '0')
+
+
+def format_float_bits(value, base, fmt='float64'):
+    """Formats the bit pattern of a float in a base, see format_bit_pattern"""
+    return format_bit_pattern(float_to_bits(value, fmt), base, fmt)
+
+
+def parse_float_bits(text, base, fmt='float64'):
+    """Parses the digits of a bit pattern in a base into a float"""
+    return bits_to_float(base_to_decimal(text, base), fmt)
+
+
+def float_array_bits(values, fmt='float64'):
+    """Returns the bit patterns of a float array as unsigned integers.
+
+    The result is a view of values when it already has the dtype of fmt;
+    otherwise values are converted to fmt once, as a whole array.
+    """
+    import numpy as np
+
+    bits = check_float_format(fmt)
+    values = np.asarray(values, dtype=fmt)
+    return values.view(f'uint{bits}')
+
+
+def bits_array_to_float(patterns, fmt='float64'):
+    """Returns the floats stored in an array of bit patterns.
+
+    The result is a view of patterns when they are already unsigned
+    integers of the width of fmt.
+    """
+    import numpy as np
+
+    bits = check_float_format(fmt)
+    patterns = np.asarray(patterns)
+    if patterns.dtype != np.dtype(f'uint{bits}'):
+        if patterns.dtype.kind not in 'iu':
+            raise ValueError(f"Expected integers, got {patterns.dtype}")
+        if ((patterns < 0) | (patterns >> bits > 0)).any():
+            raise ValueError(f"Bit patterns do not fit in {bits} bits")
+        patterns = patterns.astype(f'uint{bits}')
+    return patterns.view(fmt)
+
+
+def format_float_array(values, base, fmt='float64'):
+    """Formats the bit patterns of a float array as zero-padded digit
+    strings, see format_array"""
+    bits = check_float_format(fmt)
+    return format_array(float_array_bits(values, fmt), base, pad=True,
+                        bits=bits)
+
+
+def parse_float_array(strings, base, fmt='float64'):
+    """Parses digit strings of bit patterns into a float array, see
+    parse_array"""
+    bits = check_float_format(fmt)
+    patterns = parse_array(strings, base, bits=bits)
+    # Two's complement truncation keeps the pattern of every value
+    return patterns.astype(f'uint{bits}').view(fmt)
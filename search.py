@@ -0,0 +1,112 @@
+"""
+Unit Search
+A prefix index over every unit name, symbol and alias of every category,
+so a search box can list matching units as the user types.
+
+The index is a sorted list of case-folded keys built once at import time;
+a lookup is two bisections plus ranking of the matches, and repeated
+prefixes are answered from an LRU cache.
+
+License: MIT
+"""
+
+import bisect
+import functools
+from collections import namedtuple
+
+from engine import CATEGORY_UNITS, UNIT_CATEGORY
+from expression import UNIT_SYMBOLS
+
+# Results kept in the lookup cache
+SEARCH_CACHE_SIZE = 1024
+
+# Matches returned by default
+SEARCH_LIMIT = 8
+
+# Spellings and words that are neither unit names nor expression symbols
+ALIASES = {
+    'metre': 'Meter', 'metres': 'Meter', 'meters': 'Meter',
+    'centimetre': 'Centimeter', 'millimetre': 'Millimeter',
+    'kilometre': 'Kilometer', 'inches': 'Inch', 'feet': 'Foot',
+    'yards': 'Yard', 'miles': 'Mile', 'kilo': 'Kilogram',
+    'kilos': 'Kilogram', 'grams': 'Gram', 'pounds': 'Pound',
+    'ounces': 'Ounce', 'tonne': 'Ton', 'seconds': 'Second',
+    'minutes': 'Minute', 'hours': 'Hour', 'days': 'Day', 'weeks': 'Week',
+    'months': 'Month', 'years': 'Year', 'litre': 'Liter',
+    'litres': 'Liter', 'liters': 'Liter', 'millilitre': 'Milliliter',
+    'cm³': 'Cubic Centimeter', 'm³': 'Cubic Meter', 'gallons': 'Gallon',
+    'm/s': 'Meters per Second', 'km/h': 'Kilometers per Hour',
+    'kmh': 'Kilometers per Hour', 'm²': 'Square Meter',
+    'cm²': 'Square Centimeter', 'km²': 'Square Kilometer',
+    'ft²': 'Square Foot', 'yd²': 'Square Yard', 'kilowatt-hour': 'Kilowatt Hour',
+    'pascals': 'Pascal', 'bytes': 'Byte', 'bits': 'Bit', 'kib': 'Kilobyte',
+    'mib': 'Megabyte', 'gib': 'Gigabyte', 'tib': 'Terabyte',
+    'degrees': 'Degree', 'radians': 'Radian', 'gradian': 'Grad',
+    'gon': 'Grad', 'newtons': 'Newton', 'watts': 'Watt', 'nit': 'cd/m²',
+    'nits': 'cd/m²', 'pascal-second': 'Pa·s', 'Pa*s': 'Pa·s',
+    'amp': 'Ampere', 'amps': 'Ampere', 'ohms': 'Ohm', 'kohm': 'Kiloohm',
+    'Mohm': 'Megaohm', 'centigrade': 'Celsius', 'kelvins': 'Kelvin',
+}
+
+# A search result: the unit, its category and the key that matched
+Match = namedtuple('Match', 'unit category alias')
+
+
+def _index_entries():
+    """Yields (alias, unit) for every name, symbol and alias"""
+    for units in CATEGORY_UNITS.values():
+        for unit in units:
+            yield unit, unit
+    for table in (UNIT_SYMBOLS, ALIASES):
+        for alias, unit in table.items():
+            if unit in UNIT_CATEGORY:
+                yield alias, unit
+
+
+def build_index():
+    """Returns the sorted (key, alias, unit) entries of the index, where key
+    is the case-folded alias"""
+    entries = {(alias.casefold(), alias, unit)
+               for alias, unit in _index_entries()}
+    return sorted(entries)
+
+
+# Built once at import time; _KEYS is kept apart for bisect
+INDEX = build_index()
+_KEYS = [key for key, _, _ in INDEX]
+
+# Unit -> position in display order, to break ties between equal matches
+_UNIT_ORDER = {unit: position for position, unit in enumerate(UNIT_CATEGORY)}
+
+
+def _rank(text, alias, unit):
+    """Sort key of a match: exact before prefix, same case before other
+    case, unit names before symbols, then short before long"""
+    return (alias.casefold() != text.casefold(),
+            not alias.startswith(text),
+            alias != unit,
+            len(alias),
+            _UNIT_ORDER[unit])
+
+
+@functools.lru_cache(maxsize=SEARCH_CACHE_SIZE)
+def search_units(text, limit=SEARCH_LIMIT):
+    """Returns up to limit Matches whose name, symbol or alias starts with
+    text, best first; each unit appears once"""
+    text = text.strip()
+    if not text:
+        return ()
+    key = text.casefold()
+    start = bisect.bisect_left(_KEYS, key)
+    end = bisect.bisect_left(_KEYS, key + '\U0010ffff', start)
+
+    # Best alias per unit
+    best = {}
+    for _, alias, unit in INDEX[start:end]:
+        rank = _rank(text, alias, unit)
+        if unit not in best or rank < best[unit][0]:
+            best[unit] = (rank, alias)
+    ranked = sorted((rank, alias, unit)
+                    for unit, (rank, alias) in best.items())
+    return tuple(Match(unit, UNIT_CATEGORY[unit], alias)
+                 for _, alias, unit in ranked[:limit])
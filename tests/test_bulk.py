@@ -0,0 +1,85 @@
+"""
+Tests for the streaming and sharded CSV conversion in bulk.py, in
+particular records that are shorter than the header or the requested
+column.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk import (convert_csv, convert_records, iter_records,  # noqa: E402
+                  main)
+
+
+def test_convert_records():
+    records = [b'a,1,x\r\n', b'\n', b'b,,y\n', b'c,"2",z']
+    assert convert_records(records, [1], 2.0, 1.0, first_line=2) == [
+        b'a,3.0,x\r\n', b'\n', b'b,,y\n', b'c,5.0,z']
+
+
+def test_missing_column():
+    with pytest.raises(ValueError, match="Line 4: missing column 2"):
+        convert_records([b'1,2,3\n', b'4,5\n'], [2], 1.0, 0.0, first_line=3)
+
+
+def test_short_row(tmp_path):
+    source = tmp_path / 'in.csv'
+    source.write_bytes(b'name,depth,width\nA,1,2\nB,3\n')
+    with pytest.raises(ValueError, match="Line 3: missing column 2"):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['width'],
+                    'Foot', 'Meter')
+
+
+def test_column_past_row_width(tmp_path, capsys):
+    source = tmp_path / 'in.csv'
+    source.write_bytes(b'1,2\n3,4\n')
+    assert main(['csv', str(source), '-o', str(tmp_path / 'out.csv'),
+                 '--columns', '5', '--no-header',
+                 '--from', 'Foot', '--to', 'Meter']) == 1
+    assert capsys.readouterr().err == "Error: Line 1: missing column 5\n"
+
+
+def test_short_row_in_shard(tmp_path):
+    source = tmp_path / 'in.csv'
+    rows = [b'%d,%d\n' % (row, row) for row in range(100)]
+    rows[80] = b'80\n'
+    source.write_bytes(b'a,b\n' + b''.join(rows))
+    with pytest.raises(ValueError,
+                       match=r"Shard at byte \d+: Line \d+: missing column 1"):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['b'],
+                    'Foot', 'Meter', workers=2)
+    assert os.listdir(tmp_path) == ['in.csv']
+
+
+def test_shards_match_single_process(tmp_path):
+    source = tmp_path / 'in.csv'
+    source.write_bytes(b'a,b\n' + b''.join(b'%d,%d.5\n' % (row, row)
+                                           for row in range(1000)))
+    convert_csv(str(source), str(tmp_path / 'one.csv'), ['b'], 'Foot',
+                'Meter')
+    stats = convert_csv(str(source), str(tmp_path / 'four.csv'), ['b'],
+                        'Foot', 'Meter', workers=4)
+    assert stats['rows'] == 1000
+    assert ((tmp_path / 'four.csv').read_bytes() ==
+            (tmp_path / 'one.csv').read_bytes())
+
+
+def test_iter_records_joins_quoted_line_breaks():
+    lines = [b'a,"x\n', b'y",1\n', b'b,"z",2\n']
+    assert list(iter_records(lines)) == [b'a,"x\ny",1\n', b'b,"z",2\n']
+
+
+def test_stray_quote():
+    lines = [b'a,1\n', b'b,"2\n'] + [b'c,3\n'] * 100
+    with pytest.raises(ValueError, match="Line 2: quoted field is not "
+                                         "closed within 64 bytes"):
+        list(iter_records(iter(lines), max_bytes=64))
+    with pytest.raises(ValueError, match="Line 2: quoted field is not closed"):
+        list(iter_records(iter(lines[:3]), strict=True))
+    assert list(iter_records(iter(lines[:3]))) == [b'a,1\n', b'b,"2\nc,3\n']
@@ -0,0 +1,97 @@
+"""
+Tests for the dimensional-analysis core in dimensions.py: interned
+dimensions, hash-consed units, pickling and the factor tables the engine
+is built from.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+from fractions import Fraction
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dimensions import (BIT, CENTIMETER, DIMENSIONLESS, FOOT,  # noqa: E402
+                        HOUR, JOULE, KILOGRAM, METER, MILE, NEWTON, ONE,
+                        SECOND, Unit, combine_dimensions, factor_table,
+                        format_dimension, get_factor, intern_dimension)
+from engine import (CATEGORY_DEFINITIONS, CATEGORY_UNITS,  # noqa: E402
+                    FACTOR_MATRICES, LINEAR_CATEGORIES)
+
+
+def test_interned_units_are_identical():
+    assert METER / 100 is CENTIMETER
+    assert 0.01 * METER is CENTIMETER
+    assert Unit(Fraction(1, 100), METER.dimension) is CENTIMETER
+    assert KILOGRAM * METER / SECOND ** 2 is NEWTON
+    assert JOULE / METER is NEWTON
+    assert METER / METER is ONE
+
+
+def test_interned_dimensions():
+    assert intern_dimension(METER.vector) == METER.dimension
+    assert intern_dimension(list(METER.vector)) == METER.dimension
+    assert (MILE / HOUR).dimension == (METER / SECOND).dimension
+    assert (combine_dimensions(METER.dimension, METER.dimension, -1)
+            == DIMENSIONLESS)
+    assert format_dimension(JOULE.dimension) == 'm^2·kg·s^-2'
+    assert format_dimension(DIMENSIONLESS) == '1'
+    with pytest.raises(ValueError):
+        intern_dimension((1, 0))
+
+
+def test_exact_scales():
+    assert FOOT.exact == Fraction(3048, 10000)
+    assert (MILE / HOUR).exact == Fraction(1397, 3125)
+    assert get_factor(MILE, FOOT) == 5280.0
+    with pytest.raises(ValueError, match="Cannot convert m to s"):
+        get_factor(METER, SECOND)
+    with pytest.raises(ValueError):
+        METER ** 0.5
+
+
+@pytest.mark.parametrize('unit', [CENTIMETER, NEWTON, MILE / HOUR, ONE])
+def test_pickle_round_trip(unit):
+    assert pickle.loads(pickle.dumps(unit)) is unit
+
+
+def test_pickle_across_processes():
+    # A new dimension gets a different ID in a process that has interned
+    # another one first; the exponents carry over
+    unit = 3 * METER ** 5 * BIT
+    script = (
+        "import pickle, sys\n"
+        "import dimensions\n"
+        "first = dimensions.METER ** 7\n"
+        "unit = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(unit.exact, unit.vector, unit.dimension != first.dimension)\n")
+    result = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                            input=pickle.dumps(unit), capture_output=True,
+                            check=True)
+    assert result.stdout.decode().split(maxsplit=1) == [
+        '3', f"{unit.vector} True\n"]
+
+
+def test_factor_table():
+    assert factor_table({'Foot': FOOT, 'Mile': MILE}) == {'Foot': 1.0,
+                                                         'Mile': 5280.0}
+    with pytest.raises(ValueError, match="Second is s, not m"):
+        factor_table({'Foot': FOOT, 'Second': SECOND})
+
+
+@pytest.mark.parametrize('category', CATEGORY_DEFINITIONS)
+def test_factor_tables_match_engine(category):
+    units = CATEGORY_DEFINITIONS[category]
+    assert factor_table(units) == LINEAR_CATEGORIES[category]
+    names = CATEGORY_UNITS[category]
+    for source_id, source in enumerate(names):
+        for target_id, target in enumerate(names):
+            factor = get_factor(units[source], units[target])
+            assert (FACTOR_MATRICES[category][source_id][target_id]
+                    == pytest.approx(factor))
@@ -0,0 +1,190 @@
+"""
+Tests for the conversion engine in engine.py, checked against the scalar
+convert: array conversion, the factor matrices, temperature kernels and
+differences, and the generated conversion plans.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine  # noqa: E402
+from engine import (CATEGORY_UNITS, FACTOR_MATRICES,  # noqa: E402
+                    FUSED_MIN_SIZE, LINEAR_CATEGORIES, TEMPERATURE_UNITS,
+                    convert, convert_array, convert_difference, get_factor,
+                    get_plan)
+
+VALUES = [-40.0, -1.5, 0.0, 0.1, 1.0, 98.6, 1e6]
+
+
+def expected(values, source, target):
+    """The scalar conversion of each value"""
+    return [convert(value, source, target) for value in values]
+
+
+@pytest.mark.parametrize('source, target', [
+    ('Foot', 'Meter'), ('Mile', 'Kilometer'), ('PSI', 'Pascal'),
+    ('Megabyte', 'Bit'), ('Degree', 'Radian'),
+])
+def test_convert_array(source, target):
+    result = convert_array(VALUES, source, target)
+    assert result.dtype == np.float64
+    assert result.tolist() == pytest.approx(expected(VALUES, source, target))
+
+
+def test_convert_array_dtypes():
+    ints = np.arange(10)
+    assert convert_array(ints, 'Foot', 'Inch').dtype == np.float64
+    assert convert_array(ints, 'Foot', 'Inch').tolist() == pytest.approx(
+        expected(range(10), 'Foot', 'Inch'))
+    floats = np.asarray(VALUES, np.float32)
+    result = convert_array(floats, 'Foot', 'Meter')
+    assert result.dtype == np.float32
+    assert result.tolist() == pytest.approx(
+        expected(floats.tolist(), 'Foot', 'Meter'), rel=1e-6)
+
+
+def test_convert_array_out():
+    values = np.asarray(VALUES).reshape(7, 1)
+    out = np.empty_like(values)
+    assert convert_array(values, 'Yard', 'Foot', out=out) is out
+    assert out.ravel().tolist() == pytest.approx(
+        expected(VALUES, 'Yard', 'Foot'))
+
+
+def test_convert_array_errors():
+    with pytest.raises(ValueError):
+        convert_array(VALUES, 'Foot', 'Kilogram')
+    with pytest.raises(KeyError):
+        convert_array(VALUES, 'Foot', 'Furlong')
+
+
+@pytest.mark.parametrize('category', LINEAR_CATEGORIES)
+def test_factor_matrices(category):
+    factors = LINEAR_CATEGORIES[category]
+    units = CATEGORY_UNITS[category]
+    matrix = FACTOR_MATRICES[category]
+    assert len(matrix) == len(units)
+    for source_id, source in enumerate(units):
+        assert len(matrix[source_id]) == len(units)
+        for target_id, target in enumerate(units):
+            factor = get_factor(source, target)
+            assert factor == matrix[source_id][target_id]
+            assert factor == pytest.approx(factors[source] / factors[target])
+            assert convert(3.0, source, target) == 3.0 * factor
+        assert matrix[source_id][source_id] == pytest.approx(1.0)
+
+
+def test_get_factor_errors():
+    with pytest.raises(ValueError, match="Cannot convert Foot to Second"):
+        get_factor('Foot', 'Second')
+    with pytest.raises(ValueError, match="no single factor"):
+        get_factor('Celsius', 'Kelvin')
+
+
+@pytest.fixture
+def fused_calls(monkeypatch):
+    """Counts the calls of the blocked multiply-add"""
+    calls = []
+    blocks = engine._multiply_add_blocks
+
+    def counted(*args):
+        calls.append(args[0].size)
+        return blocks(*args)
+
+    monkeypatch.setattr(engine, '_multiply_add_blocks', counted)
+    return calls
+
+
+@pytest.mark.parametrize('source', TEMPERATURE_UNITS)
+@pytest.mark.parametrize('target', TEMPERATURE_UNITS)
+def test_temperature_arrays(source, target, fused_calls):
+    result = convert_array(VALUES, source, target)
+    assert result.tolist() == pytest.approx(expected(VALUES, source, target))
+    assert not fused_calls
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_fused_path(dtype, fused_calls):
+    # Not a whole number of blocks, so the last block is partial
+    values = np.linspace(-500, 500, FUSED_MIN_SIZE + 3).astype(dtype)
+    result = convert_array(values, 'Fahrenheit', 'Celsius')
+    assert fused_calls == [values.size]
+    assert result.dtype == dtype
+    sample = np.r_[0:values.size:4099, -3:0]
+    assert result[sample].tolist() == pytest.approx(
+        expected(values[sample].tolist(), 'Fahrenheit', 'Celsius'),
+        rel=1e-6, abs=1e-4 if dtype == np.float32 else 1e-12)
+
+
+def test_fused_path_out(fused_calls):
+    values = np.linspace(0, 1000, FUSED_MIN_SIZE).reshape(-1, 2)
+    out = np.empty_like(values)
+    assert convert_array(values, 'Kelvin', 'Fahrenheit', out=out) is out
+    assert fused_calls == [values.size]
+    sample = np.r_[0:values.size:4099, -1]
+    assert out.ravel()[sample].tolist() == pytest.approx(
+        expected(values.ravel()[sample].tolist(), 'Kelvin', 'Fahrenheit'))
+
+
+def test_fused_path_needs_contiguous_arrays(fused_calls):
+    values = np.linspace(0, 1000, 2 * FUSED_MIN_SIZE)[::2]
+    result = convert_array(values, 'Celsius', 'Kelvin')
+    assert not fused_calls
+    assert result[[0, -1]].tolist() == expected([0.0, values[-1]],
+                                                'Celsius', 'Kelvin')
+
+
+@pytest.mark.parametrize('value, source, target, result', [
+    (10, 'Celsius', 'Fahrenheit', 18),
+    (18, 'Fahrenheit', 'Celsius', 10),
+    (9, 'Fahrenheit', 'Kelvin', 5),
+    (1, 'Kelvin', 'Celsius', 1),
+    (-4, 'Celsius', 'Kelvin', -4),
+])
+def test_convert_difference(value, source, target, result):
+    assert convert_difference(value, source, target) == pytest.approx(result)
+    assert convert_array([value], source, target,
+                         difference=True).tolist() == pytest.approx([result])
+
+
+def test_linear_difference_is_convert():
+    assert convert_difference(3, 'Foot', 'Inch') == convert(3, 'Foot', 'Inch')
+
+
+@pytest.mark.parametrize('category', CATEGORY_UNITS)
+def test_plans(category):
+    units = CATEGORY_UNITS[category]
+    for source in units:
+        for target in units:
+            plan = get_plan(category, source, target)
+            assert plan.__doc__ == f"Converts a value from {source} to {target}"
+            for value in VALUES:
+                assert plan(value) == pytest.approx(
+                    convert(value, source, target), rel=1e-15, abs=1e-12)
+
+
+def test_plan_cache():
+    get_plan.cache_clear()
+    plan = get_plan('Length', 'Foot', 'Meter')
+    assert get_plan('Length', 'Foot', 'Meter') is plan
+    info = get_plan.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.maxsize == engine.PLAN_CACHE_SIZE
+    assert plan.__name__ == 'convert_Foot_to_Meter'
+    assert plan(10) == convert(10, 'Foot', 'Meter')
+
+
+def test_plan_errors():
+    with pytest.raises(ValueError, match="Foot is not a Temperature unit"):
+        get_plan('Temperature', 'Foot', 'Kelvin')
+    with pytest.raises(ValueError, match="Kelvin is not a Length unit"):
+        get_plan('Length', 'Foot', 'Kelvin')
+    with pytest.raises(KeyError, match="Unknown unit: Furlong"):
+        get_plan('Length', 'Foot', 'Furlong')
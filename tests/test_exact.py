@@ -0,0 +1,85 @@
+"""
+Tests for the exact conversion mode in engine.py: exact input parsing,
+Fraction and Decimal results and exact temperature round trips.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import (TEMPERATURE_UNITS, convert, convert_decimal,  # noqa: E402
+                    convert_exact, exact_ratio, exact_scale_offset)
+
+
+@pytest.mark.parametrize('value, expected', [
+    (3, (3, 1)),
+    (Fraction(2, 6), (1, 3)),
+    (0.1, (1, 10)),
+    ('0.1', (1, 10)),
+    (' 2.5e3 ', (2500, 1)),
+    ('1/3', (1, 3)),
+    ('-7/21', (-1, 3)),
+    (Decimal('0.125'), (1, 8)),
+])
+def test_exact_ratio(value, expected):
+    assert exact_ratio(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    float('inf'), float('nan'), 'inf', '-Infinity', 'nan',
+    Decimal('Infinity'), Decimal('NaN'), 'abc',
+])
+def test_rejects_non_finite_and_invalid(value):
+    with pytest.raises(ValueError):
+        exact_ratio(value)
+
+
+def test_rejects_other_types():
+    with pytest.raises(TypeError):
+        exact_ratio(None)
+
+
+def test_string_input():
+    assert convert_exact('0.1', 'Meter', 'Centimeter') == 10
+    assert convert_exact('1/3', 'Foot', 'Inch') == 4
+    assert convert_exact('0.1', 'Foot', 'Meter') == Fraction(381, 12500)
+    # A float reads as its shortest decimal form, the same as the string
+    assert convert_exact(0.1, 'Foot', 'Meter') == Fraction(381, 12500)
+
+
+def test_decimal_input_and_precision():
+    assert (convert_decimal(Decimal('2.5'), 'Mile', 'Kilometer')
+            == Decimal('4.02336'))
+    assert (convert_decimal(Decimal('2.5'), 'Mile', 'Kilometer', precision=3)
+            == Decimal('4.02'))
+    assert (convert_decimal('1/3', 'Meter', 'Foot')
+            == Decimal('1.093613298337707786526684164'))
+    assert (convert_decimal('1/3', 'Meter', 'Foot', precision=50)
+            == Decimal('1.0936132983377077865266841644794400699912510936133'))
+
+
+def test_exact_temperatures():
+    assert exact_scale_offset('Fahrenheit', 'Kelvin') == (Fraction(5, 9),
+                                                          Fraction(45967, 180))
+    assert convert_exact('98.6', 'Fahrenheit', 'Celsius') == 37
+    assert convert_exact(-40, 'Celsius', 'Fahrenheit') == -40
+    assert convert_exact(0, 'Kelvin', 'Fahrenheit') == Fraction(-45967, 100)
+    assert convert_decimal('1/3', 'Celsius', 'Kelvin') == Decimal(
+        '273.4833333333333333333333333')
+
+
+@pytest.mark.parametrize('source', TEMPERATURE_UNITS)
+@pytest.mark.parametrize('target', TEMPERATURE_UNITS)
+@pytest.mark.parametrize('value', ['-459.67', '1/3', '36.6', '1e6'])
+def test_temperature_round_trips(value, source, target):
+    there = convert_exact(value, source, target)
+    assert convert_exact(there, target, source) == Fraction(value)
+    assert float(there) == pytest.approx(convert(float(Fraction(value)),
+                                                 source, target))
@@ -0,0 +1,86 @@
+"""
+Tests for the unit expression parser in expression.py, in particular
+absolute temperatures on one side and scaled kelvins on the other.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from expression import compile_conversion, evaluate  # noqa: E402
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('5 °C to mK', 278150.0),
+    ('278150 mK to °C', 5.0),
+    ('212 °F to kK', 0.37315),
+    ('0.37315 kK to °F', 212.0),
+    ('0 K to °F', -459.67),
+    ('-40 degC to degF', -40.0),
+    ('300 K to mK', 300000.0),
+])
+def test_absolute_temperatures(query, expected):
+    assert evaluate(query) == pytest.approx(expected)
+
+
+def test_temperature_plans_are_affine():
+    plan = compile_conversion('°C', 'mK')
+    assert plan.scale == pytest.approx(1000)
+    assert plan.offset == pytest.approx(273150)
+
+
+def test_compound_temperatures_are_differences():
+    assert evaluate('1 degC/s to K/s') == pytest.approx(1.0)
+    assert evaluate('1 K/s to mK/s') == pytest.approx(1000.0)
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('3 ft 4 in to cm', 101.6),
+    ('12 kWh in MJ', 43.2),
+    ('1 kg*m/s^2 to N', 1.0),
+])
+def test_linear_queries(query, expected):
+    assert evaluate(query) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('query', ['5 °C to m', '1 °C 2 °F to K',
+                                   '3 ft to kg'])
+def test_invalid_queries(query):
+    with pytest.raises(ValueError):
+        evaluate(query)
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('5 Miles per Hour to km/h', 8.04672),
+    ('5 miles per hour in Kilometers per Hour', 8.04672),
+    ('2 Square Meter to Square Foot', 21.527820833419444),
+    ('1 Kilowatt Hour to MJ', 3.6),
+    ('10 Kilogram-force to N', 98.0665),
+    ('3 FEET to metres', 0.9144),
+    ('100 centigrade to Fahrenheit', 212.0),
+    ('1 nmi to m', 1852.0),
+    ('1 nmi/h to Knots', 1.0),
+])
+def test_unit_names_and_aliases(query, expected):
+    assert evaluate(query) == pytest.approx(expected)
+
+
+def test_symbols_keep_their_case():
+    assert evaluate('1 Mohm to ohm') == pytest.approx(1e6)
+    assert evaluate('1 mK to K') == pytest.approx(1e-3)
+    with pytest.raises(KeyError, match="Unknown unit: mOhm"):
+        evaluate('1 mOhm to ohm')
+
+
+@pytest.mark.parametrize('query, unit', [
+    ('5 Furlongs per Hour to km/h', 'Furlongs'),
+    ('1 nmi to parsec', 'parsec'),
+])
+def test_unknown_units(query, unit):
+    with pytest.raises(KeyError, match=f"Unknown unit: {unit}"):
+        evaluate(query)
@@ -0,0 +1,121 @@
+"""
+Tests for the lazy conversion chains in lazy.py.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import FUSED_MIN_SIZE  # noqa: E402
+from lazy import LazyArray  # noqa: E402
+from quantity import Quantity, QuantityArray  # noqa: E402
+
+FEET = np.array([1.0, 2.0, 3.0])
+
+
+def test_chain_collapses_to_one_factor():
+    chain = LazyArray(FEET, 'Foot').to('Meter').to('Centimeter')
+    assert len(chain.terms) == 1
+    assert chain.terms[0][1] == pytest.approx(30.48)
+    assert chain.compute().values == pytest.approx(FEET * 30.48)
+
+
+def test_scale_and_offset():
+    chain = (LazyArray(FEET, 'Foot').to('Meter') * 1.5 +
+             Quantity(2, 'Meter')).to('Centimeter')
+    result = chain.compute()
+    assert result.unit == 'Centimeter'
+    assert result.values == pytest.approx((FEET * 0.3048 * 1.5 + 2) * 100)
+
+
+@pytest.mark.parametrize('size', [10, FUSED_MIN_SIZE + 3])
+def test_two_arrays_in_one_pass(size):
+    rng = np.random.default_rng(0)
+    feet, inches = rng.random(size), rng.random(size)
+    chain = LazyArray(feet, 'Foot') - QuantityArray(inches, 'Inch')
+    assert len(chain.terms) == 2
+    assert chain.compute().values == pytest.approx(feet - inches / 12)
+
+
+def test_same_array_keeps_one_term():
+    lazy = LazyArray(FEET, 'Foot')
+    chain = lazy.to('Meter') + lazy
+    assert len(chain.terms) == 1
+    assert chain.compute().values == pytest.approx(FEET * 0.3048 * 2)
+
+
+def test_quantity_on_either_side():
+    lazy = LazyArray(FEET, 'Foot')
+    left = (lazy + Quantity(12, 'Inch')).compute()
+    assert left.unit == 'Foot'
+    assert left.values == pytest.approx(FEET + 1)
+
+    right = (Quantity(12, 'Inch') + lazy).compute()
+    assert right.unit == 'Inch'
+    assert right.values == pytest.approx(FEET * 12 + 12)
+
+    difference = (Quantity(2, 'Meter') - lazy).compute()
+    assert difference.unit == 'Meter'
+    assert difference.values == pytest.approx(2 - FEET * 0.3048)
+
+
+def test_quantity_array_on_either_side():
+    inches = QuantityArray(FEET * 12, 'Inch')
+    lazy = LazyArray(FEET, 'Foot')
+    assert (lazy + inches).compute().values == pytest.approx(FEET * 2)
+
+    total = inches + lazy
+    assert isinstance(total, LazyArray)
+    assert total.unit == 'Inch'
+    assert total.compute().values == pytest.approx(FEET * 24)
+
+    difference = (inches - lazy).compute()
+    assert difference.values == pytest.approx(np.zeros(3))
+
+
+def test_temperatures_only_convert():
+    celsius = LazyArray(np.array([0.0, 100.0]), 'Celsius')
+    assert celsius.to('Fahrenheit').to('Kelvin').compute().values == \
+        pytest.approx([273.15, 373.15])
+    with pytest.raises(ValueError):
+        celsius * 2
+    with pytest.raises(ValueError):
+        Quantity(1, 'Celsius') - celsius
+
+
+def test_unsupported_operands():
+    lazy = LazyArray(FEET, 'Foot')
+    with pytest.raises(TypeError):
+        lazy + 1
+    with pytest.raises(TypeError):
+        1 - lazy
+    with pytest.raises(ValueError):
+        lazy + LazyArray(np.ones(4), 'Foot')
+
+
+def test_out_may_be_any_input():
+    meters = np.array([1.0, 2.0, 3.0])
+    centimeters = np.array([10.0, 20.0, 30.0])
+    chain = LazyArray(meters, 'Meter') + \
+        QuantityArray(centimeters, 'Centimeter')
+    expected = meters + centimeters / 100
+    result = chain.compute(out=centimeters)
+    assert result.values is centimeters
+    assert centimeters == pytest.approx(expected)
+
+    feet = np.array([1.0, 2.0, 3.0])
+    LazyArray(feet, 'Foot').to('Inch').compute(out=feet)
+    assert feet == pytest.approx([12.0, 24.0, 36.0])
+
+
+def test_out_overlapping_a_shifted_input():
+    values = np.arange(FUSED_MIN_SIZE * 2 + 5, dtype=np.float64)
+    expected = values[:-1] * 2 + 1
+    chain = LazyArray(values[:-1], 'Meter') * 2 + Quantity(1, 'Meter')
+    assert np.array_equal(chain.compute(out=values[1:]).values, expected)
@@ -0,0 +1,35 @@
+"""
+Checks that the sources and documents use CRLF line endings, the
+convention of the tree that .gitattributes keeps git from converting.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import subprocess
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files the convention covers
+EXTENSIONS = ('.py', '.md', '.txt')
+
+
+def source_files():
+    """Returns the covered files that git tracks, none outside a checkout"""
+    try:
+        tracked = subprocess.run(['git', 'ls-files', '-z'], cwd=ROOT,
+                                 capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [path for path in tracked.decode('utf-8').split('\0')
+            if path.endswith(EXTENSIONS) or path == '.gitattributes']
+
+
+@pytest.mark.parametrize('path', source_files())
+def test_crlf(path):
+    with open(os.path.join(ROOT, path), 'rb') as source:
+        data = source.read()
+    assert data.count(b'\n') == data.count(b'\r\n'), (
+        f"{path} has LF line endings, save it with CRLF")
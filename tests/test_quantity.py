@@ -0,0 +1,42 @@
+"""
+Tests for Quantity equality and hashing in quantity.py.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quantity import Quantity  # noqa: E402
+
+
+def test_equal_quantities_hash_alike():
+    pairs = [(Quantity(1, 'Foot'), Quantity(0.3048, 'Meter')),
+             (Quantity(100, 'Celsius'), Quantity(212, 'Fahrenheit')),
+             (Quantity(0, 'Celsius'), Quantity(273.15, 'Kelvin')),
+             (Quantity(1, 'Hour'), Quantity(60, 'Minute'))]
+    for first, second in pairs:
+        assert first == second
+        assert second == first
+        assert hash(first) == hash(second)
+
+
+def test_equality_is_symmetric():
+    quantities = [Quantity(value, unit) for value in (1, 12, 0.3048)
+                  for unit in ('Inch', 'Foot', 'Meter')]
+    for first in quantities:
+        for second in quantities:
+            assert (first == second) == (second == first)
+
+
+def test_hashes_spread_over_values():
+    quantities = {Quantity(value, 'Meter') for value in range(1000)}
+    assert len({hash(quantity) for quantity in quantities}) == 1000
+    assert Quantity(500, 'Centimeter') in quantities
+    assert Quantity(1000, 'Meter') not in quantities
+
+
+def test_categories_differ():
+    assert Quantity(1, 'Meter') != Quantity(1, 'Kilogram')
@@ -0,0 +1,116 @@
+"""
+Tests for the base conversions in radix.py: round trips at the edges of
+the divide-and-conquer power levels and of powers of two, for every base.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radix import (POWER_OF_TWO_BASES, base_to_decimal,  # noqa: E402
+                   decimal_to_base, get_powers, regroup_digits)
+
+# int(text, 10) refuses long strings by default since Python 3.11
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
+BASES = range(2, 37)
+
+# Exponents around the machine word, the leaf size and the division limit
+BIT_COUNTS = (1, 8, 63, 64, 65, 1023, 1024, 1025, 4095, 4096, 4097, 8192,
+              16385)
+
+
+def power_boundaries(base):
+    """Returns base ** k - 1 and base ** k + 1 for digit counts k on both
+    sides of every cached power of the base"""
+    leaf_digits = get_powers(base, 0)[0][0]
+    counts = {1, 2, 3}
+    for scale in (1, 2, 4, 8, 16, 32):
+        digits = leaf_digits * scale
+        counts.update((digits - 1, digits, digits + 1))
+    values = []
+    for count in sorted(counts):
+        values += [base ** count - 1, base ** count + 1]
+    return values
+
+
+def bit_boundaries():
+    """Returns 2 ** k - 1 and 2 ** k + 1 for the bit counts"""
+    values = []
+    for bits in BIT_COUNTS:
+        values += [(1 << bits) - 1, (1 << bits) + 1]
+    return values
+
+
+def check_round_trip(n, base):
+    """Checks n against the builtin int() and back through both functions"""
+    text = decimal_to_base(n, base)
+    assert int(text, base) == n
+    assert text == '0' or text.lstrip('-')[0] != '0'
+    assert base_to_decimal(text, base) == n
+    assert base_to_decimal(text.lower(), base) == n
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_power_boundaries(base):
+    for n in power_boundaries(base):
+        check_round_trip(n, base)
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_bit_boundaries(base):
+    for n in bit_boundaries():
+        check_round_trip(n, base)
+        check_round_trip(-n, base)
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_zero_and_empty(base):
+    check_round_trip(0, base)
+    assert base_to_decimal('', base) == 0
+
+
+def test_leading_zeros_are_read():
+    digits = '0' * 5000 + decimal_to_base(3 ** 9000, 7)
+    assert base_to_decimal(digits, 7) == 3 ** 9000
+
+
+@pytest.mark.parametrize('text, base', [('12', 2), ('G', 16), ('-', 10),
+                                        ('1.5', 10), ('z', 35)])
+def test_invalid_digits(text, base):
+    with pytest.raises(ValueError):
+        base_to_decimal(text, base)
+
+
+@pytest.mark.parametrize('base', [0, 1, 37])
+def test_invalid_base(base):
+    with pytest.raises(ValueError):
+        decimal_to_base(10, base)
+    with pytest.raises(ValueError):
+        base_to_decimal('10', base)
+
+
+@pytest.mark.parametrize('from_base', sorted(POWER_OF_TWO_BASES))
+@pytest.mark.parametrize('to_base', sorted(POWER_OF_TWO_BASES))
+def test_regroup_digits(from_base, to_base):
+    for n in bit_boundaries() + [0, 1]:
+        text = decimal_to_base(n, from_base)
+        assert regroup_digits(text, from_base, to_base) == \
+            decimal_to_base(n, to_base)
+        assert regroup_digits('-' + text, from_base, to_base) == \
+            decimal_to_base(-n, to_base)
+    assert regroup_digits('000' + decimal_to_base(255, from_base),
+                          from_base, to_base) == decimal_to_base(255, to_base)
+
+
+def test_regroup_digits_rejects_other_bases():
+    with pytest.raises(ValueError):
+        regroup_digits('12', 10, 16)
+    with pytest.raises(ValueError):
+        regroup_digits('', 2, 16)
@@ -0,0 +1,144 @@
+"""
+Tests for the array base conversions in radix.py: format_array and
+parse_array against the scalar functions at the edges of powers of each
+base and of two, and the IEEE-754 bit views.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radix import (bits_array_to_float, decimal_to_base,  # noqa: E402
+                   float_array_bits, float_to_bits, format_array,
+                   format_float_array, parse_array, parse_float_array)
+
+BASES = range(2, 37)
+
+INT64_MAX = (1 << 63) - 1
+UINT64_MAX = (1 << 64) - 1
+
+
+def boundaries(base):
+    """Returns base ** k +/- 1 and 2 ** k +/- 1 that fit in uint64"""
+    values = {0, 1, UINT64_MAX}
+    count = 1
+    while base ** count <= UINT64_MAX:
+        values.update((base ** count - 1, base ** count,
+                       base ** count + 1))
+        count += 1
+    for bits in range(1, 65):
+        values.update(((1 << bits) - 1, (1 << bits) + 1))
+    return sorted(value for value in values if value <= UINT64_MAX)
+
+
+def as_bytes(values, base):
+    """Returns the scalar digit strings of values as bytes"""
+    return [decimal_to_base(value, base).encode('ascii') for value in values]
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_unsigned_round_trip(base):
+    values = boundaries(base)
+    array = np.array(values, dtype=np.uint64)
+    strings = format_array(array, base)
+    assert strings.tolist() == as_bytes(values, base)
+    assert parse_array(strings, base, dtype='uint64').tolist() == values
+    assert parse_array(strings.astype(str), base,
+                       dtype='uint64').tolist() == values
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_signed_round_trip(base):
+    values = [value for value in boundaries(base) if value <= INT64_MAX]
+    values += [-value for value in values] + [-INT64_MAX - 1]
+    array = np.array(values, dtype=np.int64)
+    strings = format_array(array, base)
+    assert strings.tolist() == as_bytes(values, base)
+    assert parse_array(strings, base).tolist() == values
+
+
+@pytest.mark.parametrize('base', BASES)
+def test_padding_and_twos_complement(base):
+    values = [0, 1, -1, 127, -128, 100, -100]
+    array = np.array(values, dtype=np.int8)
+    width = len(decimal_to_base(255, base))
+
+    padded = format_array(array, base, pad=True, bits=8)
+    assert padded.tolist() == [decimal_to_base(value & 0xFF, base)
+                               .rjust(width, '0').encode('ascii')
+                               for value in values]
+    assert parse_array(padded, base, bits=8).tolist() == values
+
+    fixed = format_array(np.abs(array.astype(np.int64)), base,
+                         width=width + 2)
+    assert {len(string) for string in fixed.tolist()} == {width + 2}
+    with pytest.raises(ValueError):
+        format_array(np.array([base ** 3]), base, width=2)
+    with pytest.raises(ValueError):
+        format_array(np.array([256]), base, bits=8)
+    with pytest.raises(ValueError):
+        format_array(np.array([-129]), base, bits=8)
+
+
+@pytest.mark.parametrize('base', [2, 10, 16, 36])
+def test_shape_is_kept(base):
+    array = np.arange(-6, 6, dtype=np.int32).reshape(3, 4)
+    strings = format_array(array, base)
+    assert strings.shape == (3, 4)
+    assert (parse_array(strings, base) == array).all()
+
+
+@pytest.mark.parametrize('base', [2, 10, 16, 36])
+def test_empty_input(base):
+    for empty in ([], np.array([], dtype=np.int16)):
+        strings = format_array(empty, base)
+        assert strings.shape == (0,)
+        assert parse_array(strings, base).shape == (0,)
+    assert parse_array([], base).dtype == np.int64
+    assert format_array(np.zeros((0, 3), dtype=np.int64), base).shape == \
+        (0, 3)
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        format_array([1.5], 10)
+    with pytest.raises(ValueError):
+        parse_array(['12', '1G'], 16)
+    with pytest.raises(ValueError):
+        parse_array(['-'], 10)
+    with pytest.raises(ValueError):
+        parse_array([decimal_to_base(1 << 64, 10)], 10, dtype='uint64')
+    with pytest.raises(ValueError):
+        parse_array(['-1'], 10, dtype='uint64')
+
+
+@pytest.mark.parametrize('fmt', ['float16', 'float32', 'float64'])
+def test_float_bit_views(fmt):
+    values = np.array([0.0, -0.0, 1.5, -0.1, np.inf, -np.inf, 65504.0,
+                       np.finfo(fmt).tiny, np.finfo(fmt).smallest_subnormal],
+                      dtype=fmt)
+    patterns = float_array_bits(values, fmt)
+    assert np.shares_memory(patterns, values)
+    assert patterns.tolist() == [float_to_bits(float(value), fmt)
+                                 for value in values]
+    assert bits_array_to_float(patterns, fmt).tobytes() == values.tobytes()
+
+    for base in (2, 16, 36):
+        strings = format_float_array(values, base, fmt)
+        assert len({len(string) for string in strings.tolist()}) == 1
+        assert parse_float_array(strings, base, fmt).tobytes() == \
+            values.tobytes()
+
+
+def test_float_nan_keeps_its_bits():
+    patterns = np.array([0x7FF8000000000001, 0xFFF0000000000001],
+                        dtype=np.uint64)
+    values = bits_array_to_float(patterns)
+    assert np.isnan(values).all()
+    assert (float_array_bits(values) == patterns).all()
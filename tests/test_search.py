@@ -0,0 +1,66 @@
+"""
+Tests for the unit search index in search.py: ranking, case-folded
+matches, aliases and the result limit.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import UNIT_CATEGORY  # noqa: E402
+from search import ALIASES, SEARCH_LIMIT, Match, search_units  # noqa: E402
+
+
+def units(text, **kwargs):
+    """The units found for text, best first"""
+    return [match.unit for match in search_units(text, **kwargs)]
+
+
+def test_exact_match_first():
+    assert search_units('m')[0] == Match('Meter', 'Length', 'm')
+    assert units('K')[:2] == ['Kelvin', 'Knots']
+    assert units('mi')[0] == 'Mile'
+
+
+def test_same_case_first():
+    assert search_units('mi')[1] == Match('Minute', 'Time', 'min')
+    assert search_units('Mi')[1] == Match('Minute', 'Time', 'Minute')
+
+
+@pytest.mark.parametrize('text, unit', [
+    ('mb', 'Megabyte'), ('MB', 'Megabyte'), ('Ω', 'Ohm'), ('ω', 'Ohm'),
+    ('OHM', 'Ohm'), ('mOhm', 'Megaohm'), ('FEET', 'Foot'),
+])
+def test_casefolded_matches(text, unit):
+    assert units(text)[0] == unit
+
+
+@pytest.mark.parametrize('text, unit, alias', [
+    ('metres', 'Meter', 'metres'), ('gon', 'Grad', 'gon'),
+    ('nits', 'cd/m²', 'nits'), ('centigrade', 'Celsius', 'centigrade'),
+    ('  fe ', 'Foot', 'feet'), ('km/h', 'Kilometers per Hour', 'km/h'),
+])
+def test_aliases(text, unit, alias):
+    assert search_units(text) == (Match(unit, UNIT_CATEGORY[unit], alias),)
+
+
+def test_aliases_name_known_units():
+    assert set(ALIASES.values()) <= set(UNIT_CATEGORY)
+
+
+def test_limit():
+    found = units('m', limit=100)
+    assert len(found) > SEARCH_LIMIT
+    assert len(found) == len(set(found))
+    assert units('m') == found[:SEARCH_LIMIT]
+    assert units('m', limit=3) == found[:3]
+
+
+@pytest.mark.parametrize('text', ['', '   ', 'zzz'])
+def test_no_matches(text):
+    assert search_units(text) == ()